@@ -7,7 +7,7 @@ Uses Claude API via OpenRouter
 import os
 import json
 import logging
-import requests
+from data.http_session import get_session
 from typing import Dict, Any, List, Optional
 
 logger = logging.getLogger(__name__)
@@ -90,7 +90,7 @@ For what-if scenarios, estimate the directional impact on valuation."""
             # Add current message
             messages.append({"role": "user", "content": message})
             
-            response = requests.post(
+            response = get_session().post(
                 OPENROUTER_URL,
                 headers={
                     "Authorization": f"Bearer {self.api_key}",
@@ -8,6 +8,7 @@ from typing import Dict, Any, Optional
 import json
 import os
 import logging
+from types import MappingProxyType
 
 logger = logging.getLogger(__name__)
 
@@ -88,6 +89,9 @@ INDUSTRY_TEMPLATES = {
     },
 }
 
+# Read-only view shared by every request; the templates never change at runtime
+INDUSTRY_TEMPLATES = MappingProxyType(INDUSTRY_TEMPLATES)
+
 
 class IndustryClassifier:
     """AI-powered industry classification agent"""
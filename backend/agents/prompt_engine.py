@@ -7,7 +7,7 @@ import json
 import os
 from typing import Dict, List, Optional, Any
 from pathlib import Path
-import requests
+from data.http_session import get_session
 
 # Try to import AI libraries
 try:
@@ -240,7 +240,7 @@ Return ONLY valid JSON, no other text.
         try:
             if self.provider == "claude":
                 # Call Claude via OpenRouter
-                response = requests.post(
+                response = get_session().post(
                     f"{OPENROUTER_BASE_URL}/chat/completions",
                     headers={
                         "Authorization": f"Bearer {self.api_key}",
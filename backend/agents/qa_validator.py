@@ -12,6 +12,8 @@ logger = logging.getLogger(__name__)
 class ValidationError:
     """Represents a validation error or warning"""
     
+    __slots__ = ('severity', 'category', 'message', 'location', 'value', 'expected')
+    
     def __init__(
         self,
         severity: str,  # 'error', 'warning', 'info'
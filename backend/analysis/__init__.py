@@ -1,2 +1,9 @@
 """Analysis package for AI Financial Modeler"""
-from . import monte_carlo
+import importlib
+
+
+def __getattr__(name):
+    # Load monte_carlo (and numpy) on first access rather than with the package
+    if name == "monte_carlo":
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
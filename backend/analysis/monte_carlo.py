@@ -7,6 +7,7 @@ import logging
 from typing import Dict, Any, List, Tuple
 import random
 import math
+from bisect import bisect_right
 
 logger = logging.getLogger(__name__)
 
@@ -79,68 +80,82 @@ def _run_numpy_simulation(
     terminal_growth_base = base_assumptions.get('terminal_growth', 0.04)
     wacc_base = base_assumptions.get('wacc', 0.12)
     
-    # Generate normally distributed variations
-    np.random.seed(42)  # For reproducibility
-    
-    revenue_mult = 1 + np.random.uniform(ranges['revenue_growth'][0], ranges['revenue_growth'][1], num_simulations)
-    margin_mult = 1 + np.random.uniform(ranges['ebitda_margin'][0], ranges['ebitda_margin'][1], num_simulations)
-    tg_mult = 1 + np.random.uniform(ranges['terminal_growth'][0], ranges['terminal_growth'][1], num_simulations)
-    wacc_mult = 1 + np.random.uniform(ranges['wacc'][0], ranges['wacc'][1], num_simulations)
+    # Draw all variations in one call from a local seeded generator, so
+    # concurrent simulations don't share or reseed global random state
+    rng = np.random.default_rng(42)  # For reproducibility
+    keys = ('revenue_growth', 'ebitda_margin', 'terminal_growth', 'wacc')
+    low = np.array([ranges[key][0] for key in keys])
+    high = np.array([ranges[key][1] for key in keys])
+    revenue_mult, margin_mult, tg_mult, wacc_mult = 1 + rng.uniform(low, high, (num_simulations, 4)).T
     
     # Simplified valuation sensitivity model
     # EV is roughly proportional to FCFF / (WACC - g)
     # FCFF is proportional to Revenue * Margin
+    # Computed in place so each step reuses a buffer instead of allocating
     
-    revenue_effect = revenue_mult ** 5  # 5 years of growth
-    margin_effect = margin_mult
-    discount_effect = wacc_base / (wacc_base * wacc_mult)
-    terminal_effect = (wacc_base - terminal_growth_base) / (wacc_base * wacc_mult - terminal_growth_base * tg_mult)
+    # terminal_effect = (wacc - g) / (wacc' - g'), clipped against division issues
+    terminal_effect = wacc_mult * wacc_base
+    terminal_effect -= tg_mult * terminal_growth_base
+    np.divide(wacc_base - terminal_growth_base, terminal_effect, out=terminal_effect)
+    np.clip(terminal_effect, 0.1, 10, out=terminal_effect)
     
-    # Prevent extreme values from division issues
-    terminal_effect = np.clip(terminal_effect, 0.1, 10)
+    # Combined effect on valuation: revenue (5 years of growth) * margin * terminal
+    ev_multiplier = revenue_mult ** 5
+    ev_multiplier *= margin_mult
+    ev_multiplier *= terminal_effect
+    ev_multiplier *= 0.7
+    ev_multiplier += 0.3
     
-    # Combined effect on valuation
-    ev_multiplier = revenue_effect * margin_effect * terminal_effect * 0.7 + 0.3
+    # Simulate valuations, folding scalar factors together before they touch
+    # the arrays so each step costs one pass and one allocation
+    simulated_ev = ev_multiplier
+    simulated_ev *= base_ev
+    if net_debt:
+        simulated_equity = simulated_ev - net_debt
+    elif base_ev > 0:
+        simulated_equity = simulated_ev * (base_equity / base_ev)
+    else:
+        simulated_equity = simulated_ev
+    if base_equity > 0:
+        simulated_share_price = simulated_equity * (base_share_price / base_equity)
+    else:
+        simulated_share_price = np.full(num_simulations, base_share_price, dtype=float)
     
-    # Simulate valuations
-    simulated_ev = base_ev * ev_multiplier
-    simulated_equity = simulated_ev - net_debt if net_debt else simulated_ev * (base_equity / base_ev) if base_ev > 0 else simulated_ev
-    simulated_share_price = base_share_price * (simulated_equity / base_equity) if base_equity > 0 else base_share_price
+    # Calculate statistics, with one percentile pass per array (0/100 give min/max)
+    price_pcts = np.percentile(simulated_share_price, [5, 25, 50, 75, 95, 0, 100])
+    ev_pcts = np.percentile(simulated_ev, [5, 50, 95])
+    equity_pcts = np.percentile(simulated_equity, [5, 50, 95])
     
-    # Calculate statistics
     return {
         'num_simulations': num_simulations,
         'share_price': {
             'mean': float(np.mean(simulated_share_price)),
-            'median': float(np.median(simulated_share_price)),
+            'median': float(price_pcts[2]),
             'std': float(np.std(simulated_share_price)),
-            'min': float(np.min(simulated_share_price)),
-            'max': float(np.max(simulated_share_price)),
-            'percentile_5': float(np.percentile(simulated_share_price, 5)),
-            'percentile_25': float(np.percentile(simulated_share_price, 25)),
-            'percentile_75': float(np.percentile(simulated_share_price, 75)),
-            'percentile_95': float(np.percentile(simulated_share_price, 95)),
+            'min': float(price_pcts[5]),
+            'max': float(price_pcts[6]),
+            'percentile_5': float(price_pcts[0]),
+            'percentile_25': float(price_pcts[1]),
+            'percentile_75': float(price_pcts[3]),
+            'percentile_95': float(price_pcts[4]),
             'histogram': _create_histogram(simulated_share_price, 20),
         },
         'enterprise_value': {
             'mean': float(np.mean(simulated_ev)),
-            'median': float(np.median(simulated_ev)),
+            'median': float(ev_pcts[1]),
             'std': float(np.std(simulated_ev)),
-            'percentile_5': float(np.percentile(simulated_ev, 5)),
-            'percentile_95': float(np.percentile(simulated_ev, 95)),
+            'percentile_5': float(ev_pcts[0]),
+            'percentile_95': float(ev_pcts[2]),
         },
         'equity_value': {
             'mean': float(np.mean(simulated_equity)),
-            'median': float(np.median(simulated_equity)),
+            'median': float(equity_pcts[1]),
             'std': float(np.std(simulated_equity)),
-            'percentile_5': float(np.percentile(simulated_equity, 5)),
-            'percentile_95': float(np.percentile(simulated_equity, 95)),
+            'percentile_5': float(equity_pcts[0]),
+            'percentile_95': float(equity_pcts[2]),
         },
         'probability_above_current': float(np.mean(simulated_share_price > base_share_price) * 100),
-        'confidence_interval_90': (
-            float(np.percentile(simulated_share_price, 5)),
-            float(np.percentile(simulated_share_price, 95))
-        ),
+        'confidence_interval_90': (float(price_pcts[0]), float(price_pcts[4])),
     }
 
 
@@ -157,39 +172,45 @@ def _run_python_simulation(
     terminal_growth_base = base_assumptions.get('terminal_growth', 0.04)
     wacc_base = base_assumptions.get('wacc', 0.12)
     
-    simulated_share_prices = []
-    simulated_evs = []
-    simulated_equities = []
+    # Hoist the bounds and scalar ratios out of the per-simulation loop
+    uniform = random.uniform
+    rg_low, rg_high = ranges['revenue_growth']
+    em_low, em_high = ranges['ebitda_margin']
+    tg_low, tg_high = ranges['terminal_growth']
+    wacc_low, wacc_high = ranges['wacc']
+    spread_base = wacc_base - terminal_growth_base
+    equity_ratio = base_equity / base_ev if base_ev > 0 else 1.0
+    price_ratio = base_share_price / base_equity if base_equity > 0 else None
     
-    for _ in range(num_simulations):
+    simulated_share_prices = [0.0] * num_simulations
+    simulated_evs = [0.0] * num_simulations
+    simulated_equities = [0.0] * num_simulations
+    
+    for i in range(num_simulations):
         # Generate random multipliers
-        revenue_mult = 1 + random.uniform(ranges['revenue_growth'][0], ranges['revenue_growth'][1])
-        margin_mult = 1 + random.uniform(ranges['ebitda_margin'][0], ranges['ebitda_margin'][1])
-        tg_mult = 1 + random.uniform(ranges['terminal_growth'][0], ranges['terminal_growth'][1])
-        wacc_mult = 1 + random.uniform(ranges['wacc'][0], ranges['wacc'][1])
+        revenue_mult = 1 + uniform(rg_low, rg_high)
+        margin_mult = 1 + uniform(em_low, em_high)
+        tg_mult = 1 + uniform(tg_low, tg_high)
+        wacc_mult = 1 + uniform(wacc_low, wacc_high)
         
         # Simplified valuation sensitivity
-        revenue_effect = revenue_mult ** 5
-        margin_effect = margin_mult
-        
         new_wacc = wacc_base * wacc_mult
         new_tg = terminal_growth_base * tg_mult
         
         if new_wacc > new_tg:
-            terminal_effect = (wacc_base - terminal_growth_base) / (new_wacc - new_tg)
+            terminal_effect = spread_base / (new_wacc - new_tg)
             terminal_effect = max(0.1, min(10, terminal_effect))
         else:
             terminal_effect = 1.0
         
-        ev_multiplier = revenue_effect * margin_effect * terminal_effect * 0.7 + 0.3
+        ev_multiplier = revenue_mult ** 5 * margin_mult * terminal_effect * 0.7 + 0.3
         
         sim_ev = base_ev * ev_multiplier
-        sim_equity = sim_ev * (base_equity / base_ev) if base_ev > 0 else sim_ev
-        sim_price = base_share_price * (sim_equity / base_equity) if base_equity > 0 else base_share_price
+        sim_equity = sim_ev * equity_ratio
         
-        simulated_share_prices.append(sim_price)
-        simulated_evs.append(sim_ev)
-        simulated_equities.append(sim_equity)
+        simulated_share_prices[i] = sim_equity * price_ratio if price_ratio is not None else base_share_price
+        simulated_evs[i] = sim_ev
+        simulated_equities[i] = sim_equity
     
     # Calculate statistics
     simulated_share_prices.sort()
@@ -214,8 +235,8 @@ def _run_python_simulation(
             'mean': mean(simulated_share_prices),
             'median': percentile(simulated_share_prices, 50),
             'std': std(simulated_share_prices),
-            'min': min(simulated_share_prices),
-            'max': max(simulated_share_prices),
+            'min': simulated_share_prices[0],
+            'max': simulated_share_prices[-1],
             'percentile_5': percentile(simulated_share_prices, 5),
             'percentile_25': percentile(simulated_share_prices, 25),
             'percentile_75': percentile(simulated_share_prices, 75),
@@ -236,7 +257,7 @@ def _run_python_simulation(
             'percentile_5': percentile(simulated_equities, 5),
             'percentile_95': percentile(simulated_equities, 95),
         },
-        'probability_above_current': sum(1 for p in simulated_share_prices if p > base_share_price) / num_simulations * 100,
+        'probability_above_current': (num_simulations - bisect_right(simulated_share_prices, base_share_price)) / num_simulations * 100,
         'confidence_interval_90': (
             percentile(simulated_share_prices, 5),
             percentile(simulated_share_prices, 95)
@@ -247,15 +268,18 @@ def _run_python_simulation(
 def _create_histogram(data, num_bins: int) -> List[Dict[str, Any]]:
     """Create histogram data using numpy"""
     counts, bin_edges = np.histogram(data, bins=num_bins)
-    histogram = []
-    for i in range(len(counts)):
-        histogram.append({
-            'bin_start': float(bin_edges[i]),
-            'bin_end': float(bin_edges[i + 1]),
-            'count': int(counts[i]),
-            'percentage': float(counts[i] / len(data) * 100)
-        })
-    return histogram
+    # Convert to Python scalars in bulk rather than one element at a time
+    edges = bin_edges.tolist()
+    percentages = (counts * (100 / len(data))).tolist()
+    return [
+        {
+            'bin_start': edges[i],
+            'bin_end': edges[i + 1],
+            'count': count,
+            'percentage': percentages[i],
+        }
+        for i, count in enumerate(counts.tolist())
+    ]
 
 
 def _create_histogram_python(data: List[float], num_bins: int) -> List[Dict[str, Any]]:
@@ -5,6 +5,7 @@ API Documentation: https://www.alphavantage.co/documentation/
 """
 
 import requests
+from .http_session import get_session
 import logging
 import os
 from typing import Dict, Any, Optional, List
@@ -34,7 +35,7 @@ class AlphaVantageAPI:
         }
         
         try:
-            response = requests.get(BASE_URL, params=params, timeout=30)
+            response = get_session().get(BASE_URL, params=params, timeout=30)
             response.raise_for_status()
             data = response.json()
             
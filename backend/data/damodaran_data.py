@@ -5,7 +5,7 @@ Source: https://pages.stern.nyu.edu/~adamodar/
 """
 
 import logging
-import requests
+from .http_session import get_session
 from typing import Dict, Any, Optional, List, Union
 from io import BytesIO
 import os
@@ -83,7 +83,7 @@ def _fetch_excel_data(url: str, dataset_name: str) -> List[List[Any]]:
     # Fetch from web
     try:
         logger.info(f"Fetching Damodaran data: {dataset_name}")
-        response = requests.get(url, timeout=30)
+        response = get_session().get(url, timeout=30)
         response.raise_for_status()
         
         # Read Excel file using xlrd
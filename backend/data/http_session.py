@@ -0,0 +1,18 @@
+"""Shared HTTP session for the data sources and AI clients"""
+
+from functools import lru_cache
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+@lru_cache(maxsize=None)
+def get_session() -> requests.Session:
+    """
+    Process-wide keep-alive session, created on first use. Repeat calls to
+    the same host (OpenRouter, Alpha Vantage, Damodaran, Screener) reuse
+    its TCP/TLS connection instead of handshaking each time.
+    """
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=10))
+    return session
@@ -5,6 +5,7 @@ Supports both API mode (with API key) and web scraping fallback
 """
 
 import requests
+from .http_session import get_session
 from bs4 import BeautifulSoup
 from typing import Dict, Any, List, Optional
 import logging
@@ -69,7 +70,7 @@ class ScreenerScraper:
             }
             
             # Try the company API endpoint
-            response = requests.get(self.api_url, headers=headers, timeout=15)
+            response = get_session().get(self.api_url, headers=headers, timeout=15)
             
             if response.status_code == 200:
                 self._api_data = response.json()
@@ -107,7 +108,7 @@ class ScreenerScraper:
             else:
                 logger.info(f"Fetching Screener.in without auth for {self.symbol}")
             
-            response = requests.get(self.url, headers=headers, timeout=15)
+            response = get_session().get(self.url, headers=headers, timeout=15)
             response.raise_for_status()
             self._soup = BeautifulSoup(response.content, 'lxml')
             logger.info(f"Successfully fetched Screener page for {self.symbol}")
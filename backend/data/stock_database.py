@@ -269,71 +269,119 @@ INDIAN_STOCKS = {
 import os
 import csv
 import logging
+from functools import lru_cache
+from types import MappingProxyType
 
-logger = logging.getLogger(__name__)
+@lru_cache(maxsize=1)
+def _log():
+    """Module logger, created on first use (only the loaders log)"""
+    return logging.getLogger(__name__)
+
+
+# Try to import pyarrow for fast CSV parsing (falls back to stdlib csv)
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
 
 # Flatten all stocks into single list
 ALL_STOCKS = []
 seen_symbols = set()
 
-# 1. Add hardcoded stocks first (they have better sector data)
-for sector, stocks in INDIAN_STOCKS.items():
-    for stock in stocks:
-        stock['sector_code'] = sector
-        stock['symbol'] = stock['symbol'].upper() # Ensure uppercase
-        ALL_STOCKS.append(stock)
-        seen_symbols.add(stock['symbol'])
+# Prefer the lookup tables emitted at build time by scripts/gen_stock_tables.py
+_generated = None
+if not os.environ.get("STOCK_TABLES_CODEGEN"):
+    try:
+        from . import stock_tables_generated as _generated
+    except ImportError:
+        _generated = None
+
+if _generated is not None:
+    ALL_STOCKS = _generated.ALL_STOCKS
+    INDIAN_STOCKS = {
+        sector: [ALL_STOCKS[i] for i in indices]
+        for sector, indices in _generated.SECTOR_INDICES.items()
+    }
+    seen_symbols = {stock['symbol'] for stock in ALL_STOCKS}
+else:
+    # 1. Add hardcoded stocks first (they have better sector data)
+    for sector, stocks in INDIAN_STOCKS.items():
+        for stock in stocks:
+            stock['sector_code'] = sector
+            stock['symbol'] = stock['symbol'].upper() # Ensure uppercase
+            ALL_STOCKS.append(stock)
+            seen_symbols.add(stock['symbol'])
+
+# Frozen baseline for the CSV ingest membership check
+_HARDCODED_SYMBOLS = frozenset(seen_symbols)
+
+def _read_csv_rows(csv_path: str):
+    """Yield (symbol, name) pairs from the NSE equity list"""
+    if PYARROW_AVAILABLE:
+        table = pacsv.read_csv(
+            csv_path,
+            convert_options=pacsv.ConvertOptions(
+                include_columns=['SYMBOL', 'NAME OF COMPANY'],
+                column_types={'SYMBOL': pa.string(), 'NAME OF COMPANY': pa.string()},
+            ),
+        )
+        return zip(table['SYMBOL'].to_pylist(), table['NAME OF COMPANY'].to_pylist())
+
+    with open(csv_path, 'r') as f:
+        return [(row.get('SYMBOL'), row.get('NAME OF COMPANY')) for row in csv.DictReader(f)]
 
 def load_csv_stocks():
     """Load additional stocks from EQUITY_L.csv"""
     csv_path = os.path.join(os.path.dirname(__file__), 'EQUITY_L.csv')
     
     if not os.path.exists(csv_path):
-        logger.warning(f"Stock CSV not found at {csv_path}")
+        _log().warning(f"Stock CSV not found at {csv_path}")
         return
 
     try:
-        with open(csv_path, 'r') as f:
-            reader = csv.DictReader(f)
-            count = 0
-            for row in reader:
-                symbol = row.get('SYMBOL', '').strip().upper()
-                name = row.get('NAME OF COMPANY', '').strip()
-                
-                if symbol and symbol not in seen_symbols:
-                    # Add to "Others" or "General" sector
-                    stock_data = {
-                        "symbol": symbol,
-                        "name": name,
-                        "sector": "General / Unclassified", # Default
-                        "sector_code": "general"
-                    }
-                    
-                    # Add to ALL_STOCKS
-                    ALL_STOCKS.append(stock_data)
-                    seen_symbols.add(symbol)
-                    
-                    # Also add to INDIAN_STOCKS under 'general'
-                    if 'general' not in INDIAN_STOCKS:
-                        INDIAN_STOCKS['general'] = []
-                    INDIAN_STOCKS['general'].append(stock_data)
-                    
-                    count += 1
+        csv_seen = set()
+        for raw_symbol, raw_name in _read_csv_rows(csv_path):
+            symbol = (raw_symbol or '').strip().upper()
+            name = (raw_name or '').strip()
+            
+            if not symbol or symbol in _HARDCODED_SYMBOLS or symbol in csv_seen:
+                continue
             
-            logger.info(f"Loaded {count} additional stocks from CSV")
+            # Add to "Others" or "General" sector
+            stock_data = {
+                "symbol": symbol,
+                "name": name,
+                "sector": "General / Unclassified", # Default
+                "sector_code": "general"
+            }
+            
+            # Add to ALL_STOCKS
+            ALL_STOCKS.append(stock_data)
+            csv_seen.add(symbol)
+            
+            # Also add to INDIAN_STOCKS under 'general'
+            if 'general' not in INDIAN_STOCKS:
+                INDIAN_STOCKS['general'] = []
+            INDIAN_STOCKS['general'].append(stock_data)
+        
+        seen_symbols.update(csv_seen)
+        _log().info(f"Loaded {len(csv_seen)} additional stocks from CSV")
             
     except Exception as e:
-        logger.error(f"Error loading stock CSV: {e}")
+        _log().error(f"Error loading stock CSV: {e}")
 
 # Load stocks on module import
-load_csv_stocks()
+if _generated is None:
+    load_csv_stocks()
 
 def load_us_stocks():
     """Load US stocks from us_stocks.json"""
     json_path = os.path.join(os.path.dirname(__file__), 'us_stocks.json')
     
     if not os.path.exists(json_path):
-        logger.warning(f"US Stock JSON not found at {json_path}")
+        _log().warning(f"US Stock JSON not found at {json_path}")
         return
 
     try:
@@ -354,12 +402,18 @@ def load_us_stocks():
                     
                     count += 1
             
-            logger.info(f"Loaded {count} US stocks from JSON")
+            _log().info(f"Loaded {count} US stocks from JSON")
             
     except Exception as e:
-        logger.error(f"Error loading US stocks JSON: {e}")
+        _log().error(f"Error loading US stocks JSON: {e}")
+
+if _generated is None:
+    load_us_stocks()
 
-load_us_stocks()
+# Freeze the tables once loading is done so callers can't mutate shared lists.
+# Nothing rebinds them afterwards, so request threads read them without locks.
+INDIAN_STOCKS = MappingProxyType({sector: tuple(stocks) for sector, stocks in INDIAN_STOCKS.items()})
+ALL_STOCKS = tuple(ALL_STOCKS)
 
 def get_all_stocks():
     """Return all stocks as flat list"""
@@ -367,7 +421,7 @@ def get_all_stocks():
 
 def get_stocks_by_sector(sector: str):
     """Return stocks for specific sector"""
-    return INDIAN_STOCKS.get(sector, [])
+    return INDIAN_STOCKS.get(sector, ())
 
 def search_stocks(query: str):
     """Search stocks by symbol or name"""
@@ -392,5 +446,5 @@ def search_stocks(query: str):
 
 def get_sectors():
     """Return list of all sectors"""
-    return list(INDIAN_STOCKS.keys())
+    return tuple(INDIAN_STOCKS.keys())
 
@@ -1,16 +1,117 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.util.request import ACCEPT_ENCODING
 import json
-from typing import Dict, Any, Optional, List, Union
+import orjson
+import os
+import time
+import hashlib
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Any, Optional, List, Union
 from datetime import datetime, timedelta
-import random
+import itertools
+import copy
+from collections import OrderedDict
 
 logger = logging.getLogger(__name__)
 
+# Try to import numpy for vectorized price statistics
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Try to import numba to compile the price statistics loop
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = NUMPY_AVAILABLE
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+# Try to import ijson for streaming the close series out of chart payloads
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 # Constants for Yahoo Finance API
 BASE_URL = "https://query1.finance.yahoo.com/v10/finance/quoteSummary/"
 CHART_URL = "https://query1.finance.yahoo.com/v8/finance/chart/"
 
+# Rupees per Crore
+CRORE = 10000000
+
+# (output field, module, key, default, divisor) for the numeric stock info fields
+_FIELD_SPEC = (
+    ("market_cap", "price", "marketCap", 0, CRORE),
+    ("enterprise_value", "defaultKeyStatistics", "enterpriseValue", 0, CRORE),
+    ("current_price", "financialData", "currentPrice", 0, 1),
+    ("52_week_high", "summaryDetail", "fiftyTwoWeekHigh", 0, 1),
+    ("52_week_low", "summaryDetail", "fiftyTwoWeekLow", 0, 1),
+    ("avg_volume", "summaryDetail", "averageVolume", 0, 1),
+    ("shares_outstanding", "defaultKeyStatistics", "sharesOutstanding", 0, CRORE),
+    ("held_percent_insiders", "defaultKeyStatistics", "heldPercentInsiders", 0, 1),
+    ("held_percent_institutions", "defaultKeyStatistics", "heldPercentInstitutions", 0, 1),
+    ("pe_ratio", "summaryDetail", "trailingPE", 0, 1),
+    ("forward_pe", "summaryDetail", "forwardPE", 0, 1),
+    ("pb_ratio", "defaultKeyStatistics", "priceToBook", 0, 1),
+    ("ps_ratio", "summaryDetail", "priceToSalesTrailing12Months", 0, 1),
+    ("beta", "defaultKeyStatistics", "beta", 1.0, 1),
+    ("profit_margin", "financialData", "profitMargins", 0, 1),
+    ("operating_margin", "financialData", "operatingMargins", 0, 1),
+    ("return_on_equity", "financialData", "returnOnEquity", 0, 1),
+    ("return_on_assets", "financialData", "returnOnAssets", 0, 1),
+    ("total_revenue", "financialData", "totalRevenue", 0, CRORE),
+    ("revenue_growth", "financialData", "revenueGrowth", 0, 1),
+    ("ebitda", "financialData", "ebitda", 0, CRORE),
+    ("total_debt", "financialData", "totalDebt", 0, CRORE),
+    ("total_cash", "financialData", "totalCash", 0, CRORE),
+    ("free_cash_flow", "financialData", "freeCashflow", 0, CRORE),
+    ("earnings_per_share", "defaultKeyStatistics", "trailingEps", 0, 1),
+    ("dividend_yield", "summaryDetail", "dividendYield", 0, 1),
+    ("dividend_rate", "summaryDetail", "dividendRate", 0, 1),
+    ("debt_to_equity", "financialData", "debtToEquity", 0, 1),
+    ("current_ratio", "financialData", "currentRatio", 0, 1),
+)
+
+# Yahoo statement field -> engine field mappings for historical financials
+_INCOME_MAP = (
+    ("totalRevenue", "revenue"),
+    ("grossProfit", "gross_profit"),
+    ("ebitda", "ebitda"),
+    ("operatingIncome", "operating_income"),
+    ("netIncome", "net_income"),
+    ("interestExpense", "interest_expense"),
+    ("incomeTaxExpense", "tax_expense"),
+)
+
+_BALANCE_MAP = (
+    ("totalAssets", "total_assets"),
+    ("totalLiab", "total_liabilities"),
+    ("totalStockholderEquity", "total_equity"),
+    ("cash", "cash"),
+    ("totalCurrentAssets", "current_assets"),
+    ("totalCurrentLiabilities", "current_liabilities"),
+)
+
+# Cache directory for Yahoo responses
+CACHE_DIR = os.path.join(os.path.dirname(__file__), "..", "cache_yahoo")
+os.makedirs(CACHE_DIR, exist_ok=True)
+
+# Cache TTLs in seconds, aligned to how often each endpoint's data refreshes
+CACHE_TTL = {
+    "stock_info": 3600,                  # 1 hour
+    "price_history": 86400,              # 1 day
+    "historical_financials": 7776000,    # 90 days (quarterly filings)
+    "empty": 60,                         # 1 minute (no data for the symbol)
+}
+
 # List of user agents to avoid rate limiting
 USER_AGENTS = [
     'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
@@ -18,12 +119,129 @@ USER_AGENTS = [
     'Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/118.0.0.0 Safari/537.36',
 ]
 
+# Headers shared by every request, set once on the session
+_BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+    # gzip/deflate always, plus br/zstd when their decoders are installed
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+# Rotate user agents deterministically rather than drawing from the RNG
+_UA_CYCLE = itertools.cycle(USER_AGENTS)
+
 def _get_headers():
-    return {
-        'User-Agent': random.choice(USER_AGENTS),
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-    }
+    """Per-request headers: the next user agent in the rotation"""
+    return {'User-Agent': next(_UA_CYCLE)}
+
+def _create_session() -> requests.Session:
+    """Create a keep-alive session with connection pooling and retries"""
+    session = requests.Session()
+    retry = Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+    adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+    session.mount("https://", adapter)
+    # User-Agent is added per request by _get_headers()
+    session.headers.update(_BASE_HEADERS)
+    return session
+
+# Shared session so repeated Yahoo calls reuse the same TCP/TLS connection
+_SESSION = _create_session()
+
+def _get_cache_path(url: str) -> str:
+    """Get cache file path for a request URL"""
+    return os.path.join(CACHE_DIR, f"{hashlib.md5(url.encode()).hexdigest()}.json")
+
+# In-process copy of recent cache entries: url -> (expires_at, serialized payload).
+# Payloads are kept serialized so every caller gets its own mutable copy.
+_MEMO: "OrderedDict[str, tuple]" = OrderedDict()
+_MEMO_MAX_ENTRIES = 256
+_MEMO_LOCK = threading.Lock()
+
+def _remember(url: str, expires_at: float, data: Any) -> None:
+    """Keep a serialized payload in the in-process memo, evicting the oldest entry"""
+    try:
+        blob = orjson.dumps(data)
+    except TypeError:
+        return
+    # Fetches run on _FETCH_POOL threads
+    with _MEMO_LOCK:
+        _MEMO[url] = (expires_at, blob)
+        _MEMO.move_to_end(url)
+        if len(_MEMO) > _MEMO_MAX_ENTRIES:
+            _MEMO.popitem(last=False)
+
+# Returned by _read_cache when nothing usable is cached (None is a cached empty answer)
+_MISS = object()
+
+def _read_cache(url: str) -> Any:
+    """Return the cached payload for a URL if it is still within its TTL, else _MISS"""
+    memo = _MEMO.get(url)
+    if memo is not None and time.time() < memo[0]:
+        return orjson.loads(memo[1])
+    
+    try:
+        with open(_get_cache_path(url), 'r') as f:
+            entry = json.load(f)
+    except (OSError, ValueError):
+        return _MISS
+    
+    expires_at = entry.get('ts', 0) + entry.get('ttl', 0)
+    if time.time() < expires_at:
+        data = entry.get('data')
+        _remember(url, expires_at, data)
+        return data
+    return _MISS
+
+def _write_cache(url: str, endpoint: str, data: Any) -> None:
+    """Write a payload to the cache atomically"""
+    now = time.time()
+    _remember(url, now + CACHE_TTL[endpoint], data)
+    
+    cache_path = _get_cache_path(url)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'w') as f:
+            json.dump({"ts": now, "ttl": CACHE_TTL[endpoint], "data": data}, f)
+        os.replace(tmp_path, cache_path)
+    except OSError as e:
+        logger.warning(f"Could not cache Yahoo response for {endpoint}: {e}")
+
+# Striped locks serialising fetches per URL without keeping a lock per symbol
+_URL_LOCKS = tuple(threading.Lock() for _ in range(64))
+
+def _url_lock(url: str) -> threading.Lock:
+    """Lock shared by every fetch of this URL"""
+    return _URL_LOCKS[hash(url) % len(_URL_LOCKS)]
+
+def _fetch_json_locked(url: str, endpoint: str, fetch: Callable[[], Any]) -> Any:
+    """
+    Return the cached payload for a URL, or run fetch() and cache its result.
+    One thread fetches a given URL at a time; the rest wait and then read
+    what it cached instead of calling Yahoo again. A None result (Yahoo has
+    no data) is cached briefly too, so the waiters don't each retry it.
+    """
+    cached = _read_cache(url)
+    if cached is not _MISS:
+        return cached
+    
+    with _url_lock(url):
+        cached = _read_cache(url)
+        if cached is not _MISS:
+            return cached
+        
+        data = fetch()
+        _write_cache(url, endpoint if data is not None else "empty", data)
+        return data
+
+# Bounded pool for concurrent Yahoo calls (caps fan-out to avoid throttling)
+_FETCH_POOL = ThreadPoolExecutor(max_workers=5, thread_name_prefix="yahoo")
+
+# Exchange suffixes Yahoo uses for Indian listings
+_SUFFIXES = frozenset((".NS", ".BO"))
+
+def _normalize(symbol: str, default_suffix: str = ".NS") -> str:
+    """Append the exchange suffix unless the symbol already carries one"""
+    return symbol if symbol[-3:] in _SUFFIXES else symbol + default_suffix
 
 class YahooFinanceCollector:
     """Class to fetch data from Yahoo Finance without yfinance"""
@@ -31,283 +249,327 @@ class YahooFinanceCollector:
     def __init__(self, symbol: str, exchange: str = "NSE"):
         self.symbol = symbol
         self.exchange = exchange
-        self.ticker_symbol = f"{symbol}.NS" if exchange == "NSE" else f"{symbol}.BO"
-        if '.' in symbol: # Already formatted
-            self.ticker_symbol = symbol
+        self.ticker_symbol = _normalize(symbol, ".NS" if exchange == "NSE" else ".BO")
             
     def get_data(self) -> Dict[str, Any]:
         """Get all available data for the symbol"""
-        info = get_stock_info(self.ticker_symbol)
-        financials = get_historical_financials(self.ticker_symbol)
-        price_history = get_price_history(self.ticker_symbol)
+        # The three endpoints are independent, so fetch them concurrently
+        info_future = _FETCH_POOL.submit(get_stock_info, self.ticker_symbol)
+        financials_future = _FETCH_POOL.submit(get_historical_financials, self.ticker_symbol)
+        price_future = _FETCH_POOL.submit(get_price_history, self.ticker_symbol)
         
-        return {
-            "company_info": info if info else {},
-            "info": info if info else {}, 
-            "financials": financials if financials else {},
-            "price_history": price_history if price_history else {},
-            "income_statement": financials.get('income_statement', {}) if financials else {},
-            "balance_sheet": financials.get('balance_sheet', {}) if financials else {},
-            "cash_flow": financials.get('cash_flow', {}) if financials else {},
-        }
+        return _build_stock_data(info_future.result(), financials_future.result(), price_future.result())
+
+def _build_stock_data(info, financials, price_history) -> Dict[str, Any]:
+    """Assemble the combined payload returned by get_data/fetch_stock_data"""
+    financials = financials or {}
+    return {
+        "company_info": info or {},
+        "financials": financials,
+        "price_history": price_history or {},
+        # Statement views read directly by the model builders
+        "income_statement": financials.get('income_statement', {}),
+        "balance_sheet": financials.get('balance_sheet', {}),
+        "cash_flow": financials.get('cash_flow', {}),
+    }
+
+# ticker -> in-flight fetch, so concurrent requests for one company
+# (e.g. a compare and a model job) share a single round of Yahoo calls
+_INFLIGHT: Dict[str, "asyncio.Future"] = {}
+
+async def _fetch_stock_payload(ticker: str) -> Dict[str, Any]:
+    # Run the blocking fetchers off the event loop, all at once
+    loop = asyncio.get_running_loop()
+    info, financials, price_history = await asyncio.gather(
+        loop.run_in_executor(_FETCH_POOL, get_stock_info, ticker),
+        loop.run_in_executor(_FETCH_POOL, get_historical_financials, ticker),
+        loop.run_in_executor(_FETCH_POOL, get_price_history, ticker),
+    )
+    return _build_stock_data(info, financials, price_history)
 
 async def fetch_stock_data(symbol: str, exchange: str = "NSE") -> Dict[str, Any]:
     collector = YahooFinanceCollector(symbol, exchange)
-    return collector.get_data()
+    ticker = collector.ticker_symbol
+    
+    task = _INFLIGHT.get(ticker)
+    if task is None:
+        task = asyncio.ensure_future(_fetch_stock_payload(ticker))
+        _INFLIGHT[ticker] = task
+        task.add_done_callback(
+            lambda done: _INFLIGHT.pop(ticker) if _INFLIGHT.get(ticker) is done else None
+        )
+    
+    # Shielded so one caller disconnecting doesn't cancel the others' fetch
+    data = await asyncio.shield(task)
+    # Callers mutate the payload, so each gets its own copy of the shared result
+    return copy.deepcopy(data)
 
 def get_stock_info(symbol: str) -> Optional[Dict[str, Any]]:
     """Fetch basic stock info directly from Yahoo API"""
     try:
-        if not (symbol.endswith('.NS') or symbol.endswith('.BO')):
-            symbol = f"{symbol}.NS"
+        symbol = _normalize(symbol)
             
         modules = "financialData,quoteType,summaryDetail,price,defaultKeyStatistics,summaryProfile"
         url = f"{BASE_URL}{symbol}?modules={modules}"
         
-        response = requests.get(url, headers=_get_headers(), timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        def fetch():
+            response = _SESSION.get(url, headers=_get_headers(), timeout=15)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
         
-        if 'quoteSummary' not in data or not data['quoteSummary']['result']:
-            return None
+            if 'quoteSummary' not in data or not data['quoteSummary']['result']:
+                return None
             
-        result = data['quoteSummary']['result'][0]
+            result = data['quoteSummary']['result'][0]
         
-        # Helper to safely get nested values
-        def get_v(module, key, default=0):
-            return result.get(module, {}).get(key, {}).get('raw', default)
-
-        # Map to common structure
-        info = {
-            "symbol": symbol.replace('.NS', '').replace('.BO', ''),
-            "name": result.get('price', {}).get('longName', symbol),
-            "sector": result.get('summaryProfile', {}).get('sector', 'Unknown'),
-            "industry": result.get('summaryProfile', {}).get('industry', 'Unknown'),
-            "website": result.get('summaryProfile', {}).get('website', ''),
-            "description": result.get('summaryProfile', {}).get('longBusinessSummary', ''),
-            
-            "market_cap": get_v('price', 'marketCap') / 10000000,
-            "enterprise_value": get_v('defaultKeyStatistics', 'enterpriseValue') / 10000000,
-            "current_price": get_v('financialData', 'currentPrice'),
-            "52_week_high": get_v('summaryDetail', 'fiftyTwoWeekHigh'),
-            "52_week_low": get_v('summaryDetail', 'fiftyTwoWeekLow'),
-            "avg_volume": get_v('summaryDetail', 'averageVolume'),
-            
-            "shares_outstanding": get_v('defaultKeyStatistics', 'sharesOutstanding') / 10000000,
-            "held_percent_insiders": get_v('defaultKeyStatistics', 'heldPercentInsiders'),
-            "held_percent_institutions": get_v('defaultKeyStatistics', 'heldPercentInstitutions'),
-            
-            "pe_ratio": get_v('summaryDetail', 'trailingPE'),
-            "forward_pe": get_v('summaryDetail', 'forwardPE'),
-            "pb_ratio": get_v('defaultKeyStatistics', 'priceToBook'),
-            "ps_ratio": get_v('summaryDetail', 'priceToSalesTrailing12Months'),
-            
-            "beta": get_v('defaultKeyStatistics', 'beta', 1.0),
-            
-            "profit_margin": get_v('financialData', 'profitMargins'),
-            "operating_margin": get_v('financialData', 'operatingMargins'),
-            "return_on_equity": get_v('financialData', 'returnOnEquity'),
-            "return_on_assets": get_v('financialData', 'returnOnAssets'),
-            
-            "total_revenue": get_v('financialData', 'totalRevenue') / 10000000,
-            "revenue_growth": get_v('financialData', 'revenueGrowth'),
-            "ebitda": get_v('financialData', 'ebitda') / 10000000,
-            "total_debt": get_v('financialData', 'totalDebt') / 10000000,
-            "total_cash": get_v('financialData', 'totalCash') / 10000000,
-            "free_cash_flow": get_v('financialData', 'freeCashflow') / 10000000,
-            "earnings_per_share": get_v('defaultKeyStatistics', 'trailingEps'),
+            # Flatten {module: {key: {'raw': value}}} once so each field is a single lookup
+            flat = {
+                (module, key): value['raw']
+                for module, fields in result.items() if isinstance(fields, dict)
+                for key, value in fields.items() if isinstance(value, dict) and 'raw' in value
+            }
+
+            # Map to common structure
+            info = {
+                "symbol": symbol.replace('.NS', '').replace('.BO', ''),
+                "name": result.get('price', {}).get('longName', symbol),
+                "sector": result.get('summaryProfile', {}).get('sector', 'Unknown'),
+                "industry": result.get('summaryProfile', {}).get('industry', 'Unknown'),
+                "website": result.get('summaryProfile', {}).get('website', ''),
+                "description": result.get('summaryProfile', {}).get('longBusinessSummary', ''),
             
-            "dividend_yield": get_v('summaryDetail', 'dividendYield'),
-            "dividend_rate": get_v('summaryDetail', 'dividendRate'),
-            "debt_to_equity": get_v('financialData', 'debtToEquity'),
-            "current_ratio": get_v('financialData', 'currentRatio'),
-        }
-        return info
+                **{
+                    field: flat.get((module, key), default) / divisor
+                    for field, module, key, default, divisor in _FIELD_SPEC
+                },
+            }
+        
+            return info
+        
+        return _fetch_json_locked(url, "stock_info", fetch)
     except Exception as e:
         logger.error(f"Error in get_stock_info for {symbol}: {e}")
         return None
 
+def _map_fields(vals: Dict[str, float], mapping) -> Dict[str, float]:
+    """Rename statement fields per a (source, destination) mapping, defaulting to 0"""
+    return {dst: vals.get(src, 0) for src, dst in mapping}
+
 def get_historical_financials(symbol: str, years: int = 5) -> Optional[Dict[str, Any]]:
     """Fetch historical financials from Yahoo API"""
     try:
-        if not (symbol.endswith('.NS') or symbol.endswith('.BO')):
-            symbol = f"{symbol}.NS"
+        symbol = _normalize(symbol)
 
         modules = "incomeStatementHistory,balanceSheetHistory,cashflowStatementHistory"
         url = f"{BASE_URL}{symbol}?modules={modules}"
         
-        response = requests.get(url, headers=_get_headers(), timeout=15)
-        response.raise_for_status()
-        data = response.json()
+        def fetch():
+            response = _SESSION.get(url, headers=_get_headers(), timeout=15)
+            response.raise_for_status()
+            data = orjson.loads(response.content)
         
-        if 'quoteSummary' not in data or not data['quoteSummary']['result']:
-            return None
+            if 'quoteSummary' not in data or not data['quoteSummary']['result']:
+                return None
             
-        result = data['quoteSummary']['result'][0]
+            result = data['quoteSummary']['result'][0]
         
-        def parse_statement(module_name):
-            stmt_data = {}
-            history = result.get(module_name, {}).get(module_name.replace('History', 'Statements'), [])
-            for item in history:
-                date = item.get('endDate', {}).get('fmt', '')[:4]
-                if not date: continue
+            def parse_statement(module_name):
+                stmt_data = {}
+                history = result.get(module_name, {}).get(module_name.replace('History', 'Statements'), [])
+                for item in history:
+                    date = item.get('endDate', {}).get('fmt', '')[:4]
+                    if not date: continue
                 
-                vals = {}
-                for k, v in item.items():
-                    if isinstance(v, dict) and 'raw' in v:
-                        vals[k] = v['raw'] / 10000000 # To Crores
-                stmt_data[date] = vals
-            return stmt_data
-
-        income_stmt = parse_statement('incomeStatementHistory')
-        balance_sheet = parse_statement('balanceSheetHistory')
-        cash_flow = parse_statement('cashflowStatementHistory')
+                    vals = {}
+                    for k, v in item.items():
+                        if isinstance(v, dict) and 'raw' in v:
+                            vals[k] = v['raw'] / 10000000 # To Crores
+                    stmt_data[date] = vals
+                return stmt_data
+
+            income_stmt = parse_statement('incomeStatementHistory')
+            balance_sheet = parse_statement('balanceSheetHistory')
+            cash_flow = parse_statement('cashflowStatementHistory')
         
-        # Normalize keys for the engine
-        normalized_income = {}
-        for yr, vals in income_stmt.items():
-            normalized_income[yr] = {
-                "revenue": vals.get('totalRevenue', 0),
-                "gross_profit": vals.get('grossProfit', 0),
-                "ebitda": vals.get('ebitda', 0),
-                "operating_income": vals.get('operatingIncome', 0),
-                "net_income": vals.get('netIncome', 0),
-                "interest_expense": vals.get('interestExpense', 0),
-                "tax_expense": vals.get('incomeTaxExpense', 0),
-            }
+            # Normalize keys for the engine
+            normalized_income = {yr: _map_fields(vals, _INCOME_MAP) for yr, vals in income_stmt.items()}
 
-        normalized_balance = {}
-        for yr, vals in balance_sheet.items():
-            normalized_balance[yr] = {
-                "total_assets": vals.get('totalAssets', 0),
-                "total_liabilities": vals.get('totalLiab', 0),
-                "total_equity": vals.get('totalStockholderEquity', 0),
-                "cash": vals.get('cash', 0),
-                "total_debt": vals.get('longTermDebt', 0) + vals.get('shortLongTermDebt', 0),
-                "current_assets": vals.get('totalCurrentAssets', 0),
-                "current_liabilities": vals.get('totalCurrentLiabilities', 0),
-            }
+            normalized_balance = {}
+            for yr, vals in balance_sheet.items():
+                row = _map_fields(vals, _BALANCE_MAP)
+                row["total_debt"] = vals.get('longTermDebt', 0) + vals.get('shortLongTermDebt', 0)
+                normalized_balance[yr] = row
 
-        normalized_cash = {}
-        for yr, vals in cash_flow.items():
-            normalized_cash[yr] = {
-                "operating_cash_flow": vals.get('totalCashFromOperatingActivities', 0),
-                "capex": abs(vals.get('capitalExpenditures', 0)),
-                "depreciation": vals.get('depreciation', 0),
-                "free_cash_flow": vals.get('totalCashFromOperatingActivities', 0) + vals.get('capitalExpenditures', 0),
-            }
+            normalized_cash = {}
+            for yr, vals in cash_flow.items():
+                ocf = vals.get('totalCashFromOperatingActivities', 0)
+                capex = vals.get('capitalExpenditures', 0)
+                normalized_cash[yr] = {
+                    "operating_cash_flow": ocf,
+                    "capex": abs(capex),
+                    "depreciation": vals.get('depreciation', 0),
+                    "free_cash_flow": ocf + capex,
+                }
 
-        return {
-            "income_statement": normalized_income,
-            "balance_sheet": normalized_balance,
-            "cash_flow": normalized_cash,
-            "years_available": len(normalized_income),
-        }
+            financials = {
+                "income_statement": normalized_income,
+                "balance_sheet": normalized_balance,
+                "cash_flow": normalized_cash,
+                "years_available": len(normalized_income),
+            }
+            return financials
+        
+        return _fetch_json_locked(url, "historical_financials", fetch)
     except Exception as e:
         logger.error(f"Error in get_historical_financials for {symbol}: {e}")
         return None
 
+def _stream_closes(url: str) -> List[Optional[float]]:
+    """Stream only the close series out of a chart payload"""
+    with _SESSION.get(url, headers=_get_headers(), timeout=15, stream=True) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # let urllib3 undo gzip before parsing
+        return list(ijson.items(
+            response.raw, 'chart.result.item.indicators.quote.item.close.item', use_float=True
+        ))
+
 def get_price_history(symbol: str, period: str = "5y") -> Optional[Dict[str, Any]]:
     """Fetch price history using Chart API"""
     try:
-        if not (symbol.endswith('.NS') or symbol.endswith('.BO')):
-            symbol = f"{symbol}.NS"
+        symbol = _normalize(symbol)
             
         # Map period to YF range
         range_map = {"1y": "1y", "2y": "2y", "5y": "5y", "10y": "10y", "max": "max"}
         r = range_map.get(period, "5y")
         
         url = f"{CHART_URL}{symbol}?range={r}&interval=1d"
-        response = requests.get(url, headers=_get_headers(), timeout=15)
-        response.raise_for_status()
-        data = response.json()
-        
-        chart = data.get('chart', {}).get('result', [{}])[0]
-        if not chart: return None
         
-        closes = chart.get('indicators', {}).get('quote', [{}])[0].get('close', [])
-        closes = [c for c in closes if c is not None]
-        
-        if not closes: return None
+        def fetch():
+            if IJSON_AVAILABLE:
+                closes = _stream_closes(url)
+            else:
+                response = _SESSION.get(url, headers=_get_headers(), timeout=15)
+                response.raise_for_status()
+                data = orjson.loads(response.content)
+            
+                try:
+                    closes = data["chart"]["result"][0]["indicators"]["quote"][0]["close"]
+                except (KeyError, IndexError, TypeError):
+                    return None
+            if NUMPY_AVAILABLE:
+                # Contiguous float64 buffer instead of a list of boxed floats
+                closes = np.fromiter((c for c in closes if c is not None), dtype=np.float64)
+                if closes.size == 0: return None
+            else:
+                closes = [c for c in closes if c is not None]
+                if not closes: return None
         
-        returns = [(closes[i] / closes[i-1]) - 1 for i in range(1, len(closes))]
-        avg_ret = sum(returns) / len(returns) if returns else 0
-        std_ret = (sum([(x - avg_ret)**2 for x in returns]) / len(returns))**0.5 if returns else 0
+            history = _compute_price_stats(closes)
+            return history
         
-        return {
-            "current_price": closes[-1],
-            "start_price": closes[0],
-            "high": max(closes),
-            "low": min(closes),
-            "total_return": (closes[-1] / closes[0]) - 1,
-            "annualized_return": avg_ret * 252,
-            "volatility": std_ret * (252 ** 0.5),
-            "sharpe_ratio": (avg_ret * 252 - 0.07) / (std_ret * (252 ** 0.5)) if std_ret > 0 else 0,
-        }
+        return _fetch_json_locked(url, "price_history", fetch)
     except Exception as e:
         logger.error(f"Error in get_price_history for {symbol}: {e}")
         return None
 
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True)
+    def _return_stats(closes):
+        """Mean/std of daily returns plus high/low in one compiled pass (Welford)"""
+        high = closes[0]
+        low = closes[0]
+        mean = 0.0
+        m2 = 0.0
+        for i in range(1, closes.shape[0]):
+            c = closes[i]
+            if c > high:
+                high = c
+            if c < low:
+                low = c
+            r = c / closes[i - 1] - 1.0
+            delta = r - mean
+            mean += delta / i
+            m2 += delta * (r - mean)
+        n = closes.shape[0] - 1
+        std = (m2 / n) ** 0.5 if n > 0 else 0.0
+        return mean, std, high, low
+
+def _compute_price_stats(closes) -> Dict[str, float]:
+    """Compute return and volatility statistics from daily closing prices"""
+    if NUMBA_AVAILABLE:
+        avg_ret, std_ret, high, low = (float(v) for v in _return_stats(closes))
+    elif NUMPY_AVAILABLE:
+        rets = closes[1:] / closes[:-1] - 1.0
+        avg_ret = float(rets.mean()) if rets.size else 0
+        std_ret = float(rets.std()) if rets.size else 0
+        high, low = float(closes.max()), float(closes.min())
+    else:
+        returns = [(closes[i] / closes[i-1]) - 1 for i in range(1, len(closes))]
+        avg_ret = sum(returns) / len(returns) if returns else 0
+        std_ret = (sum([(x - avg_ret)**2 for x in returns]) / len(returns))**0.5 if returns else 0
+        high, low = max(closes), min(closes)
+    
+    current, start = float(closes[-1]), float(closes[0])
+    return {
+        "current_price": current,
+        "start_price": start,
+        "high": high,
+        "low": low,
+        "total_return": (current / start) - 1,
+        "annualized_return": avg_ret * 252,
+        "volatility": std_ret * (252 ** 0.5),
+        "sharpe_ratio": (avg_ret * 252 - 0.07) / (std_ret * (252 ** 0.5)) if std_ret > 0 else 0,
+    }
+
 def get_peer_comparison(symbol: str, peers: Optional[List[str]] = None) -> Optional[List[Dict[str, Any]]]:
-    """Fetch peer data using multiple API calls"""
+    """Fetch peer data, one pooled quoteSummary call per distinct symbol"""
     if not peers:
         peers = []
     
-    results = []
-    # Add main company
-    main_info = get_stock_info(symbol)
-    if main_info:
-        results.append({
-            "symbol": main_info["symbol"],
-            "name": main_info["name"],
-            "market_cap": main_info["market_cap"],
-            "pe_ratio": main_info["pe_ratio"],
-            "pb_ratio": main_info["pb_ratio"],
-            "roe": main_info["return_on_equity"] * 100,
-            "is_main": True,
-        })
+    # Order-preserving dedupe so the main symbol or a repeated peer is fetched once
+    main_ticker = _normalize(symbol)
+    tickers = list(dict.fromkeys([main_ticker, *(_normalize(p) for p in peers)]))
     
-    for p in peers:
-        p_info = get_stock_info(p)
-        if p_info:
+    results = []
+    for ticker, info in zip(tickers, _FETCH_POOL.map(get_stock_info, tickers)):
+        if info:
             results.append({
-                "symbol": p_info["symbol"],
-                "name": p_info["name"],
-                "market_cap": p_info["market_cap"],
-                "pe_ratio": p_info["pe_ratio"],
-                "pb_ratio": p_info["pb_ratio"],
-                "roe": p_info["return_on_equity"] * 100,
-                "is_main": False,
+                "symbol": info["symbol"],
+                "name": info["name"],
+                "market_cap": info["market_cap"],
+                "pe_ratio": info["pe_ratio"],
+                "pb_ratio": info["pb_ratio"],
+                "roe": info["return_on_equity"] * 100,
+                "is_main": ticker == main_ticker,
             })
     return results
 
-def search_stocks(query: str, limit: int = 10) -> List[Dict[str, str]]:
-    """Simple offline search for common Indian stocks"""
-    common_stocks = [
-        {"symbol": "RELIANCE", "name": "Reliance Industries Ltd"},
-        {"symbol": "TCS", "name": "Tata Consultancy Services"},
-        {"symbol": "HDFCBANK", "name": "HDFC Bank Ltd"},
-        {"symbol": "INFY", "name": "Infosys Ltd"},
-        {"symbol": "ICICIBANK", "name": "ICICI Bank Ltd"},
-        {"symbol": "HINDUNILVR", "name": "Hindustan Unilever Ltd"},
-        {"symbol": "SBIN", "name": "State Bank of India"},
-        {"symbol": "BHARTIARTL", "name": "Bharti Airtel Ltd"},
-        {"symbol": "ITC", "name": "ITC Ltd"},
-        {"symbol": "WIPRO", "name": "Wipro Ltd"},
-        {"symbol": "ADANIPOWER", "name": "Adani Power"},
-    ]
-    query_lower = query.lower()
-    return [s for s in common_stocks if query_lower in s["symbol"].lower() or query_lower in s["name"].lower()][:limit]
-
+# Placeholder catalog for offline search (Yahoo needs a separate search API)
+_COMMON_STOCKS = [
+    {"symbol": "RELIANCE", "name": "Reliance Industries Ltd"},
+    {"symbol": "TCS", "name": "Tata Consultancy Services"},
+    {"symbol": "HDFCBANK", "name": "HDFC Bank Ltd"},
+    {"symbol": "INFY", "name": "Infosys Ltd"},
+    {"symbol": "ICICIBANK", "name": "ICICI Bank Ltd"},
+    {"symbol": "HINDUNILVR", "name": "Hindustan Unilever Ltd"},
+    {"symbol": "SBIN", "name": "State Bank of India"},
+    {"symbol": "BHARTIARTL", "name": "Bharti Airtel Ltd"},
+    {"symbol": "ITC", "name": "ITC Ltd"},
+    {"symbol": "KOTAKBANK", "name": "Kotak Mahindra Bank"},
+    {"symbol": "LT", "name": "Larsen & Toubro Ltd"},
+    {"symbol": "AXISBANK", "name": "Axis Bank Ltd"},
+    {"symbol": "WIPRO", "name": "Wipro Ltd"},
+    {"symbol": "ASIANPAINT", "name": "Asian Paints Ltd"},
+    {"symbol": "MARUTI", "name": "Maruti Suzuki India Ltd"},
+    {"symbol": "TITAN", "name": "Titan Company Ltd"},
+    {"symbol": "SUNPHARMA", "name": "Sun Pharmaceutical"},
+    {"symbol": "ULTRACEMCO", "name": "UltraTech Cement Ltd"},
+    {"symbol": "TATAMOTORS", "name": "Tata Motors Ltd"},
+    {"symbol": "POWERGRID", "name": "Power Grid Corporation"},
+]
 
-def _get_value(df, col, possible_keys: List[str]) -> float:
-    """Helper to get value from dataframe with multiple possible keys"""
-    for key in possible_keys:
-        if key in df.index:
-            val = df.loc[key, col]
-            if val is not None and not (hasattr(val, '__iter__') and not isinstance(val, str)):
-                return float(val) / 10000000  # Convert to Crores
-    return 0.0
+# Lowercased (symbol, name, stock) tuples, built once at import
+_SEARCH_INDEX = [(s["symbol"].lower(), s["name"].lower(), s) for s in _COMMON_STOCKS]
 
 
 def search_stocks(query: str, limit: int = 10) -> List[Dict[str, str]]:
@@ -321,35 +583,10 @@ def search_stocks(query: str, limit: int = 10) -> List[Dict[str, str]]:
     Returns:
         List of matching stocks
     """
-    # For Yahoo Finance, we'd need a separate search API
-    # This is a placeholder that returns common Indian stocks
-    common_stocks = [
-        {"symbol": "RELIANCE", "name": "Reliance Industries Ltd"},
-        {"symbol": "TCS", "name": "Tata Consultancy Services"},
-        {"symbol": "HDFCBANK", "name": "HDFC Bank Ltd"},
-        {"symbol": "INFY", "name": "Infosys Ltd"},
-        {"symbol": "ICICIBANK", "name": "ICICI Bank Ltd"},
-        {"symbol": "HINDUNILVR", "name": "Hindustan Unilever Ltd"},
-        {"symbol": "SBIN", "name": "State Bank of India"},
-        {"symbol": "BHARTIARTL", "name": "Bharti Airtel Ltd"},
-        {"symbol": "ITC", "name": "ITC Ltd"},
-        {"symbol": "KOTAKBANK", "name": "Kotak Mahindra Bank"},
-        {"symbol": "LT", "name": "Larsen & Toubro Ltd"},
-        {"symbol": "AXISBANK", "name": "Axis Bank Ltd"},
-        {"symbol": "WIPRO", "name": "Wipro Ltd"},
-        {"symbol": "ASIANPAINT", "name": "Asian Paints Ltd"},
-        {"symbol": "MARUTI", "name": "Maruti Suzuki India Ltd"},
-        {"symbol": "TITAN", "name": "Titan Company Ltd"},
-        {"symbol": "SUNPHARMA", "name": "Sun Pharmaceutical"},
-        {"symbol": "ULTRACEMCO", "name": "UltraTech Cement Ltd"},
-        {"symbol": "TATAMOTORS", "name": "Tata Motors Ltd"},
-        {"symbol": "POWERGRID", "name": "Power Grid Corporation"},
-    ]
-    
     query_lower = query.lower()
     results = [
-        stock for stock in common_stocks
-        if query_lower in stock["symbol"].lower() or query_lower in stock["name"].lower()
+        stock for symbol_lower, name_lower, stock in _SEARCH_INDEX
+        if query_lower in symbol_lower or query_lower in name_lower
     ]
     
     return results[:limit]
@@ -5,6 +5,7 @@ Handles job persistence using SQLite
 
 import os
 import sqlite3
+import threading
 from datetime import datetime
 from typing import Optional, List, Dict, Any
 import json
@@ -21,16 +22,31 @@ else:
     DB_PATH = os.path.join(os.path.dirname(__file__), "models.db")
 
 
+# One long-lived connection per thread (request threads and executor
+# workers are reused), so queries don't pay the connect cost each time
+_local = threading.local()
+
+# How long a writer waits for another worker process to release the lock
+DB_BUSY_TIMEOUT_SECONDS = 30
+
+
 def get_connection():
-    """Get database connection"""
-    conn = sqlite3.connect(DB_PATH)
-    conn.row_factory = sqlite3.Row
+    """Get this thread's database connection, opening it on first use"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = sqlite3.connect(DB_PATH, timeout=DB_BUSY_TIMEOUT_SECONDS)
+        conn.row_factory = sqlite3.Row
+        # WAL lets status polls from every uvicorn worker read while one
+        # worker writes job progress, instead of serializing on the file lock
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        _local.conn = conn
     return conn
 
 
 @contextmanager
 def get_db():
-    """Context manager for database connections"""
+    """Context manager for database transactions on the thread's connection"""
     conn = get_connection()
     try:
         yield conn
@@ -38,8 +54,6 @@ def get_db():
     except Exception:
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
 
 def init_db():
@@ -68,6 +82,10 @@ def init_db():
             )
         """)
         
+        # History and re-download listings read the newest jobs first
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_created_at ON jobs (created_at)")
+        cursor.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status_completed_at ON jobs (status, completed_at)")
+        
         # Model metrics table (for preview)
         cursor.execute("""
             CREATE TABLE IF NOT EXISTS model_metrics (
@@ -101,12 +119,12 @@ def create_job(
     forecast_years: int = 5,
     source: str = "stock",
     request_data: Optional[Dict] = None
-) -> Dict[str, Any]:
-    """Create a new job"""
+) -> bool:
+    """Create a new job; returns False if a job with this ID already exists"""
     with get_db() as conn:
         cursor = conn.cursor()
         cursor.execute("""
-            INSERT INTO jobs (id, company_name, symbol, industry, forecast_years, source, request_data)
+            INSERT OR IGNORE INTO jobs (id, company_name, symbol, industry, forecast_years, source, request_data)
             VALUES (?, ?, ?, ?, ?, ?, ?)
         """, (
             job_id, 
@@ -117,7 +135,7 @@ def create_job(
             source,
             json.dumps(request_data) if request_data else None
         ))
-    return get_job(job_id)
+        return cursor.rowcount == 1
 
 
 def get_job(job_id: str) -> Optional[Dict[str, Any]]:
@@ -131,25 +149,74 @@ def get_job(job_id: str) -> Optional[Dict[str, Any]]:
     return None
 
 
-def update_job(job_id: str, **kwargs) -> Optional[Dict[str, Any]]:
-    """Update job fields"""
+def update_job(job_id: str, **kwargs) -> bool:
+    """
+    Update job fields; returns False if the job doesn't exist.
+    A result_data dict is merged into the stored JSON rather than replacing
+    it, so keys written by other workers are kept.
+    """
     if not kwargs:
-        return get_job(job_id)
+        return get_job(job_id) is not None
     
     # Handle special fields
     if 'request_data' in kwargs and isinstance(kwargs['request_data'], dict):
         kwargs['request_data'] = json.dumps(kwargs['request_data'])
-    if 'result_data' in kwargs and isinstance(kwargs['result_data'], dict):
-        kwargs['result_data'] = json.dumps(kwargs['result_data'])
+    result_changes = kwargs.get('result_data')
     
     set_clause = ", ".join(f"{k} = ?" for k in kwargs.keys())
-    values = list(kwargs.values()) + [job_id]
     
+    # Progress updates land here several times per job, so the row isn't
+    # read back afterwards; callers keep their own copy of the fields
     with get_db() as conn:
         cursor = conn.cursor()
+        if isinstance(result_changes, dict):
+            # Take the write lock before reading so no other worker can
+            # update result_data between the read and the write
+            cursor.execute("BEGIN IMMEDIATE")
+            cursor.execute("SELECT result_data FROM jobs WHERE id = ?", (job_id,))
+            row = cursor.fetchone()
+            if row is None:
+                return False
+            result = _load_result_data(row['result_data'])
+            result.update(result_changes)
+            kwargs['result_data'] = json.dumps(result)
+        
+        values = list(kwargs.values()) + [job_id]
         cursor.execute(f"UPDATE jobs SET {set_clause} WHERE id = ?", values)
-    
-    return get_job(job_id)
+        return cursor.rowcount == 1
+
+
+def append_job_result(job_id: str, key: str, item: Any) -> Optional[List[Any]]:
+    """
+    Append item to the list stored under key in a job's result_data, in one
+    write transaction so concurrent appends from every worker are kept.
+    Returns the updated list, or None if the job doesn't exist.
+    """
+    with get_db() as conn:
+        cursor = conn.cursor()
+        cursor.execute("BEGIN IMMEDIATE")
+        cursor.execute("SELECT result_data FROM jobs WHERE id = ?", (job_id,))
+        row = cursor.fetchone()
+        if row is None:
+            return None
+        
+        result = _load_result_data(row['result_data'])
+        items = result.get(key) or []
+        items.append(item)
+        result[key] = items
+        cursor.execute("UPDATE jobs SET result_data = ? WHERE id = ?", (json.dumps(result), job_id))
+        return items
+
+
+def _load_result_data(raw: Optional[str]) -> Dict[str, Any]:
+    """Parse a stored result_data value, treating missing or bad JSON as empty"""
+    if not raw:
+        return {}
+    try:
+        result = json.loads(raw)
+    except (json.JSONDecodeError, TypeError):
+        return {}
+    return result if isinstance(result, dict) else {}
 
 
 def get_job_history(limit: int = 50, offset: int = 0) -> List[Dict[str, Any]]:
@@ -261,6 +328,11 @@ def init_projects_table():
                 updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
             )
         """)
+        # Project listings are ordered by most recently updated
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_saved_projects_updated_at
+            ON saved_projects (updated_at)
+        """)
         conn.commit()
 
 
@@ -0,0 +1,22 @@
+"""Cell-writing helpers and shared fonts for the Excel generators"""
+
+from typing import Any, Optional
+
+from openpyxl.styles import Font
+
+# Fonts reused across many cells; openpyxl styles are immutable so one
+# instance can be shared
+BOLD_FONT = Font(bold=True)
+SECTION_FONT = Font(bold=True, size=11, color='1F4E79')
+
+
+def write_cell(ws, ref: str, value: Any, style: Optional[str] = None,
+               number_format: Optional[str] = None):
+    """Write a value and its formatting with a single cell lookup"""
+    cell = ws[ref]
+    cell.value = value
+    if style:
+        cell.style = style
+    if number_format:
+        cell.number_format = number_format
+    return cell
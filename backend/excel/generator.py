@@ -15,22 +15,27 @@ from datetime import datetime
 import os
 import logging
 
+from ._cells import BOLD_FONT, write_cell
+
 logger = logging.getLogger(__name__)
 
+LINK_FONT = Font(color='FF0563C1', underline='single')
+
 
 class ExcelStyler:
     """Professional Excel styles"""
     
     COLORS = {
-        'primary': '1F4E79',
-        'secondary': '2E75B6',
-        'header': '1F4E79',
-        'input': 'FFF2CC',
-        'output': 'E2EFDA',
-        'white': 'FFFFFF',
-        'black': '000000',
-        'grey': 'D9D9D9',
-        'dark_grey': '404040',
+        'primary': 'FF1F4E79',
+        'secondary': 'FF2E75B6',
+        'header': 'FF1F4E79',
+        'input': 'FFFFF2CC',
+        'output': 'FFE2EFDA',
+        'white': 'FFFFFFFF',
+        'black': 'FF000000',
+        'grey': 'FFD9D9D9',
+        'dark_grey': 'FF404040',
+        'note': 'FF666666',
     }
     
     @classmethod
@@ -90,6 +95,19 @@ class ExcelStyler:
         wb.add_named_style(label)
         styles['label'] = label
         
+        # Bold label (subtotals and key outputs)
+        label_bold = NamedStyle(name='label_bold')
+        label_bold.font = Font(name='Calibri', size=10, bold=True)
+        label_bold.alignment = Alignment(horizontal='left', indent=1)
+        wb.add_named_style(label_bold)
+        styles['label_bold'] = label_bold
+        
+        # Note (assumption descriptions)
+        note = NamedStyle(name='note')
+        note.font = Font(name='Calibri', size=9, italic=True, color=cls.COLORS['note'])
+        wb.add_named_style(note)
+        styles['note'] = note
+        
         # Total
         total = NamedStyle(name='total')
         total.font = Font(name='Calibri', size=10, bold=True)
@@ -126,6 +144,9 @@ class FinancialModelGenerator:
         self.structure = model_structure
         self.data = financial_data
         self.industry = industry_info
+        # Not write_only: sheets are filled by cell reference, merged and
+        # charted after the fact, which streaming worksheets can't do. A
+        # model is a few thousand cells, so the in-memory cost is small.
         self.wb = Workbook()
         self.styles = ExcelStyler.create_styles(self.wb)
         
@@ -166,8 +187,7 @@ class FinancialModelGenerator:
         ws.column_dimensions['A'].width = 3
         ws.column_dimensions['B'].width = 32
         
-        ws['B2'] = title
-        ws['B2'].style = 'title'
+        write_cell(ws, 'B2', title, style='title')
         
         return ws
     
@@ -177,16 +197,14 @@ class FinancialModelGenerator:
         for i in range(self.hist_years):
             col = get_column_letter(start_col + i)
             year = self.base_year - self.hist_years + i
-            ws[f'{col}{row}'] = f"FY{year}"
-            ws[f'{col}{row}'].style = 'header'
+            write_cell(ws, f'{col}{row}', f"FY{year}", style='header')
             ws.column_dimensions[col].width = 13
         
         # Forecast years
         for i in range(self.fcst_years):
             col = get_column_letter(start_col + self.hist_years + i)
             year = self.base_year + i
-            ws[f'{col}{row}'] = f"FY{year}E"
-            ws[f'{col}{row}'].style = 'header'
+            write_cell(ws, f'{col}{row}', f"FY{year}E", style='header')
             ws.column_dimensions[col].width = 13
     
     def _get_historical_value(self, statement: str, key: str, year_idx: int) -> Optional[float]:
@@ -328,15 +346,12 @@ class FinancialModelGenerator:
                 continue
             
             if value is None:  # Section header
-                ws[f'B{row}'] = name
-                ws[f'B{row}'].style = 'subheader'
+                write_cell(ws, f'B{row}', name, style='subheader')
                 ws.merge_cells(f'B{row}:E{row}')
             else:
-                ws[f'B{row}'] = name
-                ws[f'B{row}'].style = 'label'
+                write_cell(ws, f'B{row}', name, style='label')
                 
-                ws[f'C{row}'] = value
-                ws[f'C{row}'].style = 'input_cell'
+                write_cell(ws, f'C{row}', value, style='input_cell')
                 
                 if unit == 'percent':
                     ws[f'C{row}'].number_format = self.FORMATS['percent']
@@ -348,8 +363,7 @@ class FinancialModelGenerator:
                     ws[f'C{row}'].number_format = self.FORMATS['number']
                 
                 ws[f'D{row}'] = unit if unit else ""
-                ws[f'E{row}'] = desc if desc else ""
-                ws[f'E{row}'].font = Font(italic=True, size=9, color='666666')
+                write_cell(ws, f'E{row}', desc if desc else "", style='note')
                 
                 # Create named range (sanitize name)
                 range_name = name.replace(' ', '_').replace('%', 'Pct').replace('/', '_').replace('&', 'And').replace('(', '').replace(')', '')
@@ -466,10 +480,7 @@ class FinancialModelGenerator:
                 row += 1
                 continue
             
-            ws[f'B{row}'] = item_name
-            ws[f'B{row}'].style = 'label'
-            if is_bold:
-                ws[f'B{row}'].font = Font(bold=True)
+            write_cell(ws, f'B{row}', item_name, style='label_bold' if is_bold else 'label')
             
             if key:
                 rows[key] = row
@@ -498,70 +509,53 @@ class FinancialModelGenerator:
                     
                 elif key == 'cogs':
                     a_row = self.assum_rows['gross_margin']
-                    ws[f'{col}{row}'] = f"=IFERROR(-{col}{rows['revenue']}*(1-Assumptions!$C${a_row}),0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(-{col}{rows['revenue']}*(1-Assumptions!$C${a_row}),0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'gross':
-                    ws[f'{col}{row}'] = f"={col}{rows['revenue']}+{col}{rows['cogs']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['revenue']}+{col}{rows['cogs']}", number_format=self.FORMATS['number'])
                     
                 elif item_name == 'Gross Margin %':
-                    ws[f'{col}{row}'] = f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)", number_format=self.FORMATS['percent'])
                     
                 elif key == 'sga':
                     a_row = self.assum_rows['sga_pct']
-                    ws[f'{col}{row}'] = f"=IFERROR(-{col}{rows['revenue']}*Assumptions!$C${a_row},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(-{col}{rows['revenue']}*Assumptions!$C${a_row},0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'other_opex':
-                    ws[f'{col}{row}'] = f"=-{col}{rows['revenue']}*0.02"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=-{col}{rows['revenue']}*0.02", number_format=self.FORMATS['number'])
                     
                 elif key == 'ebitda':
-                    ws[f'{col}{row}'] = f"={col}{rows['gross']}+{col}{rows['sga']}+{col}{rows['other_opex']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['gross']}+{col}{rows['sga']}+{col}{rows['other_opex']}", style='output_cell', number_format=self.FORMATS['number'])
                     
                 elif item_name == 'EBITDA Margin %':
-                    ws[f'{col}{row}'] = f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)", number_format=self.FORMATS['percent'])
                     
                 elif key == 'da':
                     a_row = self.assum_rows['da_pct']
-                    ws[f'{col}{row}'] = f"=IFERROR(-{col}{rows['revenue']}*Assumptions!$C${a_row},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(-{col}{rows['revenue']}*Assumptions!$C${a_row},0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'ebit':
-                    ws[f'{col}{row}'] = f"={col}{rows['ebitda']}+{col}{rows['da']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['ebitda']}+{col}{rows['da']}", number_format=self.FORMATS['number'])
                     
                 elif item_name == 'EBIT Margin %':
-                    ws[f'{col}{row}'] = f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)", number_format=self.FORMATS['percent'])
                     
                 elif key == 'interest':
                     # Link to balance sheet for debt balance
-                    ws[f'{col}{row}'] = f"=-{col}{rows['revenue']}*0.02"  # Placeholder - will link to BS
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=-{col}{rows['revenue']}*0.02", number_format=self.FORMATS['number'])  # Placeholder - will link to BS
                     
                 elif key == 'pbt':
-                    ws[f'{col}{row}'] = f"={col}{rows['ebit']}+{col}{rows['interest']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['ebit']}+{col}{rows['interest']}", number_format=self.FORMATS['number'])
                     
                 elif key == 'tax':
                     a_row = self.assum_rows['tax_rate']
-                    ws[f'{col}{row}'] = f"=IFERROR(-MAX({col}{rows['pbt']},0)*Assumptions!$C${a_row},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(-MAX({col}{rows['pbt']},0)*Assumptions!$C${a_row},0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'net_income':
-                    ws[f'{col}{row}'] = f"={col}{rows['pbt']}+{col}{rows['tax']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['pbt']}+{col}{rows['tax']}", style='output_cell', number_format=self.FORMATS['number'])
                     
                 elif item_name == 'Net Margin %':
-                    ws[f'{col}{row}'] = f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR({col}{row-1}/{col}{rows['revenue']},0)", number_format=self.FORMATS['percent'])
             
             row += 1
         
@@ -636,14 +630,11 @@ class FinancialModelGenerator:
                 row += 1
                 continue
             
-            ws[f'B{row}'] = item_name
-            
             if item_type == "header":
-                ws[f'B{row}'].style = 'subheader'
+                label_style = 'subheader'
             else:
-                ws[f'B{row}'].style = 'label'
-                if item_type == "total":
-                    ws[f'B{row}'].font = Font(bold=True)
+                label_style = 'label_bold' if item_type == "total" else 'label'
+            write_cell(ws, f'B{row}', item_name, style=label_style)
             
             if key:
                 rows[key] = row
@@ -665,13 +656,11 @@ class FinancialModelGenerator:
                     
                 elif key == 'ar':
                     a_row = self.assum_rows['recv_days']
-                    ws[f'{col}{row}'] = f"=IFERROR(Income_Statement!{col}6*Assumptions!$C${a_row}/365,0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(Income_Statement!{col}6*Assumptions!$C${a_row}/365,0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'inv':
                     a_row = self.assum_rows['inv_days']
-                    ws[f'{col}{row}'] = f"=IFERROR(ABS(Income_Statement!{col}9)*Assumptions!$C${a_row}/365,0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(ABS(Income_Statement!{col}9)*Assumptions!$C${a_row}/365,0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'other_ca':
                     if i == 0:
@@ -681,8 +670,7 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
                     
                 elif key == 'tca':
-                    ws[f'{col}{row}'] = f"=SUM({col}{rows['cash']}:{col}{rows['other_ca']})"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=SUM({col}{rows['cash']}:{col}{rows['other_ca']})", number_format=self.FORMATS['number'])
                     
                 elif key == 'ppe_gross':
                     if i == 0:
@@ -700,8 +688,7 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
                     
                 elif key == 'ppe_net':
-                    ws[f'{col}{row}'] = f"={col}{rows['ppe_gross']}+{col}{rows['accum_dep']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['ppe_gross']}+{col}{rows['accum_dep']}", number_format=self.FORMATS['number'])
                     
                 elif key == 'other_nca':
                     if i == 0:
@@ -711,14 +698,11 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
                     
                 elif key == 'ta':
-                    ws[f'{col}{row}'] = f"={col}{rows['tca']}+{col}{rows['ppe_net']}+{col}{rows['other_nca']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['tca']}+{col}{rows['ppe_net']}+{col}{rows['other_nca']}", style='output_cell', number_format=self.FORMATS['number'])
                     
                 elif key == 'ap':
                     a_row = self.assum_rows['pay_days']
-                    ws[f'{col}{row}'] = f"=IFERROR(ABS(Income_Statement!{col}9)*Assumptions!$C${a_row}/365,0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"=IFERROR(ABS(Income_Statement!{col}9)*Assumptions!$C${a_row}/365,0)", number_format=self.FORMATS['number'])
                     
                 elif key == 'accrued':
                     if i == 0:
@@ -735,8 +719,7 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
                     
                 elif key == 'tcl':
-                    ws[f'{col}{row}'] = f"={col}{rows['ap']}+{col}{rows['accrued']}+{col}{rows['st_debt']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['ap']}+{col}{rows['accrued']}+{col}{rows['st_debt']}", number_format=self.FORMATS['number'])
                     
                 elif key == 'lt_debt':
                     if i == 0:
@@ -753,8 +736,7 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
                     
                 elif key == 'tl':
-                    ws[f'{col}{row}'] = f"={col}{rows['tcl']}+{col}{rows['lt_debt']}+{col}{rows['other_ncl']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['tcl']}+{col}{rows['lt_debt']}+{col}{rows['other_ncl']}", number_format=self.FORMATS['number'])
                     
                 elif key == 'share_cap':
                     if i == 0:
@@ -772,18 +754,13 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
                     
                 elif key == 'te':
-                    ws[f'{col}{row}'] = f"={col}{rows['share_cap']}+{col}{rows['retained']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['share_cap']}+{col}{rows['retained']}", number_format=self.FORMATS['number'])
                     
                 elif key == 'tle':
-                    ws[f'{col}{row}'] = f"={col}{rows['tl']}+{col}{rows['te']}"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['tl']}+{col}{rows['te']}", style='output_cell', number_format=self.FORMATS['number'])
                     
                 elif key == 'check':
-                    ws[f'{col}{row}'] = f"=ROUND({col}{rows['ta']}-{col}{rows['tle']},0)"
-                    ws[f'{col}{row}'].number_format = self.FORMATS['number']
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"=ROUND({col}{rows['ta']}-{col}{rows['tle']},0)", style='output_cell', number_format=self.FORMATS['number'])
             
             row += 1
         
@@ -831,14 +808,11 @@ class FinancialModelGenerator:
                 row += 1
                 continue
             
-            ws[f'B{row}'] = item_name
-            
             if item_type == "header":
-                ws[f'B{row}'].style = 'subheader'
+                label_style = 'subheader'
             else:
-                ws[f'B{row}'].style = 'label'
-                if item_type == "total":
-                    ws[f'B{row}'].font = Font(bold=True)
+                label_style = 'label_bold' if item_type == "total" else 'label'
+            write_cell(ws, f'B{row}', item_name, style=label_style)
             
             if key:
                 rows[key] = row
@@ -877,8 +851,7 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'] = 0
                     
                 elif key == 'ocf':
-                    ws[f'{col}{row}'] = f"=SUM({col}{rows['ni']}:{col}{rows['chg_other']})"
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"=SUM({col}{rows['ni']}:{col}{rows['chg_other']})", style='output_cell')
                     
                 elif key == 'capex':
                     ws[f'{col}{row}'] = f"=IFERROR(-Income_Statement!{col}6*Assumptions!$C$21,0)"
@@ -899,8 +872,7 @@ class FinancialModelGenerator:
                     ws[f'{col}{row}'] = f"={col}{rows['div']}+{col}{rows['chg_debt']}"
                     
                 elif key == 'net_cash':
-                    ws[f'{col}{row}'] = f"={col}{rows['ocf']}+{col}{rows['icf']}+{col}{rows['fcf']}"
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['ocf']}+{col}{rows['icf']}+{col}{rows['fcf']}", style='output_cell')
                     
                 elif key == 'open_cash':
                     if i > 0:
@@ -909,8 +881,7 @@ class FinancialModelGenerator:
                         ws[f'{col}{row}'] = 2000  # Starting cash
                         
                 elif key == 'close_cash':
-                    ws[f'{col}{row}'] = f"={col}{rows['open_cash']}+{col}{rows['net_cash']}"
-                    ws[f'{col}{row}'].style = 'output_cell'
+                    write_cell(ws, f'{col}{row}', f"={col}{rows['open_cash']}+{col}{rows['net_cash']}", style='output_cell')
                 
                 if key:
                     ws[f'{col}{row}'].number_format = self.FORMATS['number']
@@ -926,8 +897,7 @@ class FinancialModelGenerator:
         row = 5
         
         # WACC Section
-        ws[f'B{row}'] = "WACC CALCULATION"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "WACC CALCULATION", style='subheader')
         row += 1
         
         wacc_items = [
@@ -952,11 +922,9 @@ class FinancialModelGenerator:
                 row += 1
                 continue
             
-            ws[f'B{row}'] = name
-            ws[f'B{row}'].style = 'label'
+            write_cell(ws, f'B{row}', name, style='label_bold' if name == "WACC" else 'label')
             
             if name == "WACC":
-                ws[f'B{row}'].font = Font(bold=True)
                 ws[f'C{row}'].style = 'output_cell'
             
             if formula:
@@ -972,79 +940,61 @@ class FinancialModelGenerator:
         
         # DCF Section
         row += 2
-        ws[f'B{row}'] = "DCF VALUATION"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "DCF VALUATION", style='subheader')
         row += 1
         
         # Year headers
         for i in range(self.fcst_years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"Year {i+1}"
-            ws[f'{col}{row}'].style = 'header'
+            write_cell(ws, f'{col}{row}', f"Year {i+1}", style='header')
         row += 1
         
         fcff_row = row
         
         # FCFF (EBITDA - Capex - WC change)
-        ws[f'B{row}'] = "Free Cash Flow to Firm"
-        ws[f'B{row}'].style = 'label'
+        write_cell(ws, f'B{row}', "Free Cash Flow to Firm", style='label')
         for i in range(self.fcst_years):
             col = get_column_letter(3 + i)
             is_col = get_column_letter(3 + self.hist_years + i)
-            ws[f'{col}{row}'] = f"=Income_Statement!{is_col}15+Income_Statement!{is_col}18+Cash_Flow!{is_col}19"
-            ws[f'{col}{row}'].number_format = self.FORMATS['number']
+            write_cell(ws, f'{col}{row}', f"=Income_Statement!{is_col}15+Income_Statement!{is_col}18+Cash_Flow!{is_col}19", number_format=self.FORMATS['number'])
         row += 1
         
         # Discount Factor
-        ws[f'B{row}'] = "Discount Factor"
-        ws[f'B{row}'].style = 'label'
+        write_cell(ws, f'B{row}', "Discount Factor", style='label')
         for i in range(self.fcst_years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"=1/(1+$C${wacc_row})^{i+1}"
-            ws[f'{col}{row}'].number_format = '0.000'
+            write_cell(ws, f'{col}{row}', f"=1/(1+$C${wacc_row})^{i+1}", number_format='0.000')
         row += 1
         
         # PV of FCFF
         pv_row = row
         ws[f'B{row}'] = "Present Value of FCFF"
-        ws[f'B{row}'].style = 'label'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].style = 'label_bold'
         for i in range(self.fcst_years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"={col}{fcff_row}*{col}{row-1}"
-            ws[f'{col}{row}'].number_format = self.FORMATS['number']
-            ws[f'{col}{row}'].style = 'output_cell'
+            write_cell(ws, f'{col}{row}', f"={col}{fcff_row}*{col}{row-1}", style='output_cell', number_format=self.FORMATS['number'])
         row += 2
         
         # Terminal Value
         tv_start = row
         tg_row = row  # Terminal growth rate row
-        ws[f'B{row}'] = "Terminal Growth Rate"
-        ws[f'B{row}'].style = 'label'
-        ws[f'C{row}'] = "=Assumptions!$C$33"
-        ws[f'C{row}'].number_format = self.FORMATS['percent']
-        ws[f'C{row}'].style = 'input_cell'
+        write_cell(ws, f'B{row}', "Terminal Growth Rate", style='label')
+        write_cell(ws, f'C{row}', "=Assumptions!$C$33", style='input_cell', number_format=self.FORMATS['percent'])
         row += 1
         
         last_fcff_col = get_column_letter(2 + self.fcst_years)
         tv_row = row  # Terminal value row
-        ws[f'B{row}'] = "Terminal Value"
-        ws[f'B{row}'].style = 'label'
-        ws[f'C{row}'] = f"=IFERROR({last_fcff_col}{fcff_row}*(1+C{tg_row})/($C${wacc_row}-C{tg_row}),0)"
-        ws[f'C{row}'].number_format = self.FORMATS['number']
+        write_cell(ws, f'B{row}', "Terminal Value", style='label')
+        write_cell(ws, f'C{row}', f"=IFERROR({last_fcff_col}{fcff_row}*(1+C{tg_row})/($C${wacc_row}-C{tg_row}),0)", number_format=self.FORMATS['number'])
         row += 1
         
         pv_tv_row = row  # PV of terminal value row
-        ws[f'B{row}'] = "PV of Terminal Value"
-        ws[f'B{row}'].style = 'label'
-        ws[f'C{row}'] = f"=C{tv_row}*{last_fcff_col}{pv_row-1}"
-        ws[f'C{row}'].number_format = self.FORMATS['number']
-        ws[f'C{row}'].style = 'output_cell'
+        write_cell(ws, f'B{row}', "PV of Terminal Value", style='label')
+        write_cell(ws, f'C{row}', f"=C{tv_row}*{last_fcff_col}{pv_row-1}", style='output_cell', number_format=self.FORMATS['number'])
         row += 2
         
         # Valuation Summary
-        ws[f'B{row}'] = "VALUATION SUMMARY"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "VALUATION SUMMARY", style='subheader')
         row += 1
         
         sum_pv_row = row  # Sum of PV of FCFF row
@@ -1070,11 +1020,10 @@ class FinancialModelGenerator:
                 row += 1
                 continue
             
-            ws[f'B{row}'] = name
-            ws[f'B{row}'].style = 'label'
+            is_key_output = name in ["Enterprise Value", "Equity Value", "Implied Share Price (₹)"]
+            write_cell(ws, f'B{row}', name, style='label_bold' if is_key_output else 'label')
             
-            if name in ["Enterprise Value", "Equity Value", "Implied Share Price (₹)"]:
-                ws[f'B{row}'].font = Font(bold=True)
+            if is_key_output:
                 ws[f'C{row}'].style = 'output_cell'
             
             if formula:
@@ -1110,8 +1059,7 @@ class FinancialModelGenerator:
         ws = self._setup_sheet("Comps", f"{self.company_name} - Comparable Company Analysis")
         
         row = 5
-        ws[f'B{row}'] = "COMPARABLE COMPANY ANALYSIS"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "COMPARABLE COMPANY ANALYSIS", style='subheader')
         ws.merge_cells(f'B{row}:J{row}')
         row += 2
         
@@ -1130,30 +1078,21 @@ class FinancialModelGenerator:
         
         for i, (header, width) in enumerate(headers):
             col = get_column_letter(2 + i)
-            ws[f'{col}{row}'] = header
-            ws[f'{col}{row}'].style = 'header'
+            write_cell(ws, f'{col}{row}', header, style='header')
             ws.column_dimensions[col].width = width
         row += 1
         
         # Target company row (from model data)
         ws[f'B{row}'] = f"{self.company_name} (Target)"
-        ws[f'B{row}'].font = Font(bold=True)
-        ws[f'C{row}'] = "=Valuation!C46/100"  # Market cap
-        ws[f'C{row}'].number_format = self.FORMATS['number']
-        ws[f'D{row}'] = "=Income_Statement!C6"  # Revenue
-        ws[f'D{row}'].number_format = self.FORMATS['number']
-        ws[f'E{row}'] = "=Income_Statement!C15"  # EBITDA
-        ws[f'E{row}'].number_format = self.FORMATS['number']
-        ws[f'F{row}'] = "=IFERROR(E{0}/D{0},0)".format(row)
-        ws[f'F{row}'].number_format = self.FORMATS['percent']
-        ws[f'G{row}'] = "=IFERROR(Valuation!C46/Income_Statement!C26,0)"  # P/E
-        ws[f'G{row}'].number_format = self.FORMATS['decimal']
-        ws[f'H{row}'] = "=IFERROR(Valuation!C44/E{0},0)".format(row)  # EV/EBITDA
-        ws[f'H{row}'].number_format = self.FORMATS['decimal']
-        ws[f'I{row}'] = "=IFERROR(Valuation!C44/D{0},0)".format(row)  # EV/Revenue
-        ws[f'I{row}'].number_format = self.FORMATS['decimal']
-        ws[f'J{row}'] = "=Assumptions!C14"  # ROE placeholder
-        ws[f'J{row}'].number_format = self.FORMATS['percent']
+        ws[f'B{row}'].font = BOLD_FONT
+        write_cell(ws, f'C{row}', "=Valuation!C46/100", number_format=self.FORMATS['number'])  # Market cap
+        write_cell(ws, f'D{row}', "=Income_Statement!C6", number_format=self.FORMATS['number'])  # Revenue
+        write_cell(ws, f'E{row}', "=Income_Statement!C15", number_format=self.FORMATS['number'])  # EBITDA
+        write_cell(ws, f'F{row}', "=IFERROR(E{0}/D{0},0)".format(row), number_format=self.FORMATS['percent'])
+        write_cell(ws, f'G{row}', "=IFERROR(Valuation!C46/Income_Statement!C26,0)", number_format=self.FORMATS['decimal'])  # P/E
+        write_cell(ws, f'H{row}', "=IFERROR(Valuation!C44/E{0},0)".format(row), number_format=self.FORMATS['decimal'])  # EV/EBITDA
+        write_cell(ws, f'I{row}', "=IFERROR(Valuation!C44/D{0},0)".format(row), number_format=self.FORMATS['decimal'])  # EV/Revenue
+        write_cell(ws, f'J{row}', "=Assumptions!C14", number_format=self.FORMATS['percent'])  # ROE placeholder
         target_row = row
         row += 1
         
@@ -1168,39 +1107,21 @@ class FinancialModelGenerator:
         
         peer_start = row
         for name, mcap, rev, ebitda, margin, pe, ev_ebitda, ev_rev, roe in peer_data:
-            ws[f'B{row}'] = name
-            ws[f'B{row}'].style = 'input_cell'
-            ws[f'C{row}'] = mcap
-            ws[f'C{row}'].style = 'input_cell'
-            ws[f'C{row}'].number_format = self.FORMATS['number']
-            ws[f'D{row}'] = rev
-            ws[f'D{row}'].style = 'input_cell'
-            ws[f'D{row}'].number_format = self.FORMATS['number']
-            ws[f'E{row}'] = ebitda
-            ws[f'E{row}'].style = 'input_cell'
-            ws[f'E{row}'].number_format = self.FORMATS['number']
-            ws[f'F{row}'] = margin
-            ws[f'F{row}'].style = 'input_cell'
-            ws[f'F{row}'].number_format = self.FORMATS['percent']
-            ws[f'G{row}'] = pe
-            ws[f'G{row}'].style = 'input_cell'
-            ws[f'G{row}'].number_format = self.FORMATS['decimal']
-            ws[f'H{row}'] = ev_ebitda
-            ws[f'H{row}'].style = 'input_cell'
-            ws[f'H{row}'].number_format = self.FORMATS['decimal']
-            ws[f'I{row}'] = ev_rev
-            ws[f'I{row}'].style = 'input_cell'
-            ws[f'I{row}'].number_format = self.FORMATS['decimal']
-            ws[f'J{row}'] = roe
-            ws[f'J{row}'].style = 'input_cell'
-            ws[f'J{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'B{row}', name, style='input_cell')
+            write_cell(ws, f'C{row}', mcap, style='input_cell', number_format=self.FORMATS['number'])
+            write_cell(ws, f'D{row}', rev, style='input_cell', number_format=self.FORMATS['number'])
+            write_cell(ws, f'E{row}', ebitda, style='input_cell', number_format=self.FORMATS['number'])
+            write_cell(ws, f'F{row}', margin, style='input_cell', number_format=self.FORMATS['percent'])
+            write_cell(ws, f'G{row}', pe, style='input_cell', number_format=self.FORMATS['decimal'])
+            write_cell(ws, f'H{row}', ev_ebitda, style='input_cell', number_format=self.FORMATS['decimal'])
+            write_cell(ws, f'I{row}', ev_rev, style='input_cell', number_format=self.FORMATS['decimal'])
+            write_cell(ws, f'J{row}', roe, style='input_cell', number_format=self.FORMATS['percent'])
             row += 1
         peer_end = row - 1
         
         # Summary Statistics
         row += 2
-        ws[f'B{row}'] = "PEER STATISTICS"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "PEER STATISTICS", style='subheader')
         ws.merge_cells(f'B{row}:J{row}')
         row += 1
         
@@ -1212,8 +1133,7 @@ class FinancialModelGenerator:
         ]
         
         for stat_name, func in stats:
-            ws[f'B{row}'] = stat_name
-            ws[f'B{row}'].style = 'label'
+            write_cell(ws, f'B{row}', stat_name, style='label')
             
             for i, col in enumerate(['C', 'D', 'E', 'F', 'G', 'H', 'I', 'J']):
                 if "PERCENTILE" in func:
@@ -1232,8 +1152,7 @@ class FinancialModelGenerator:
         
         # Implied Valuation
         row += 2
-        ws[f'B{row}'] = "IMPLIED VALUATION FROM COMPS"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "IMPLIED VALUATION FROM COMPS", style='subheader')
         ws.merge_cells(f'B{row}:E{row}')
         row += 1
         
@@ -1270,14 +1189,14 @@ class FinancialModelGenerator:
         # Implied Share Price
         row += 1
         ws[f'B{row}'] = "Implied Share Price Range"
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         shares = "Valuation!C49"  # shares outstanding
         ws[f'C{row}'] = f"=IFERROR(C{row-2}/{shares},0)"
         ws[f'D{row}'] = f"=IFERROR(D{row-2}/{shares},0)"  
         ws[f'E{row}'] = f"=IFERROR(E{row-2}/{shares},0)"
         for col in ['C', 'D', 'E']:
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
             ws[f'{col}{row}'].style = 'output_cell'
+            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
     
     def _create_summary(self) -> None:
 
@@ -1292,8 +1211,7 @@ class FinancialModelGenerator:
         ws.column_dimensions['F'].width = 18
         
         # Title
-        ws['B2'] = self.company_name
-        ws['B2'].style = 'title'
+        write_cell(ws, 'B2', self.company_name, style='title')
         ws.merge_cells('B2:F2')
         
         ws['B3'] = "Financial Model Summary"
@@ -1304,8 +1222,7 @@ class FinancialModelGenerator:
         
         # Company Info
         row = 7
-        ws[f'B{row}'] = "Company Information"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "Company Information", style='subheader')
         ws.merge_cells(f'B{row}:C{row}')
         row += 1
         
@@ -1316,15 +1233,13 @@ class FinancialModelGenerator:
         ]
         
         for label, value in info:
-            ws[f'B{row}'] = label
-            ws[f'B{row}'].style = 'label'
+            write_cell(ws, f'B{row}', label, style='label')
             ws[f'C{row}'] = value
             row += 1
         
         # Key Outputs - Use dynamic row references from valuation sheet
         row += 1
-        ws[f'B{row}'] = "Key Outputs"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "Key Outputs", style='subheader')
         ws.merge_cells(f'B{row}:C{row}')
         row += 1
         
@@ -1343,10 +1258,8 @@ class FinancialModelGenerator:
         ]
         
         for label, formula, fmt in outputs:
-            ws[f'B{row}'] = label
-            ws[f'B{row}'].style = 'label'
-            ws[f'C{row}'] = formula
-            ws[f'C{row}'].style = 'output_cell'
+            write_cell(ws, f'B{row}', label, style='label')
+            write_cell(ws, f'C{row}', formula, style='output_cell')
             if fmt == "currency":
                 ws[f'C{row}'].number_format = self.FORMATS['currency']
             elif fmt == "percent":
@@ -1357,8 +1270,7 @@ class FinancialModelGenerator:
         
         # Navigation
         row = 7
-        ws[f'E{row}'] = "Model Navigation"
-        ws[f'E{row}'].style = 'subheader'
+        write_cell(ws, f'E{row}', "Model Navigation", style='subheader')
         ws.merge_cells(f'E{row}:F{row}')
         row += 1
         
@@ -1366,7 +1278,7 @@ class FinancialModelGenerator:
         for sheet in sheets:
             ws[f'E{row}'] = sheet.replace('_', ' ')
             ws[f'E{row}'].hyperlink = f"#'{sheet}'!A1"
-            ws[f'E{row}'].font = Font(color='0563C1', underline='single')
+            ws[f'E{row}'].font = LINK_FONT
             row += 1
     
     def _create_sensitivity(self) -> None:
@@ -1374,8 +1286,7 @@ class FinancialModelGenerator:
         ws = self._setup_sheet("Sensitivity", "Sensitivity Analysis")
         
         row = 5
-        ws[f'B{row}'] = "WACC vs Terminal Growth Sensitivity"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "WACC vs Terminal Growth Sensitivity", style='subheader')
         ws.merge_cells(f'B{row}:H{row}')
         row += 2
         
@@ -1384,29 +1295,23 @@ class FinancialModelGenerator:
         wacc_rates = [0.08, 0.09, 0.10, 0.11, 0.12, 0.13, 0.14]
         
         # Column headers
-        ws[f'B{row}'] = "WACC \\ TG"
-        ws[f'B{row}'].style = 'header'
+        write_cell(ws, f'B{row}', "WACC \\ TG", style='header')
         for i, tg in enumerate(tg_rates):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = tg
-            ws[f'{col}{row}'].style = 'header'
-            ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'{col}{row}', tg, style='header', number_format=self.FORMATS['percent'])
             ws.column_dimensions[col].width = 12
         row += 1
         
         # WACC rows with sensitivity formulas
         for wacc in wacc_rates:
-            ws[f'B{row}'] = wacc
-            ws[f'B{row}'].style = 'header'
-            ws[f'B{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'B{row}', wacc, style='header', number_format=self.FORMATS['percent'])
             
             for i, tg in enumerate(tg_rates):
                 col = get_column_letter(3 + i)
                 # Simplified sensitivity formula
                 # Equity Value = FCFF * (1+g) / (WACC - g)
                 fcff_ref = f"Valuation!C{27}"  # Last year FCFF approx
-                ws[f'{col}{row}'] = f"=IFERROR(1000*(1+{tg})/({wacc}-{tg}),0)"
-                ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                write_cell(ws, f'{col}{row}', f"=IFERROR(1000*(1+{tg})/({wacc}-{tg}),0)", number_format=self.FORMATS['number'])
                 
                 # Highlight center cell
                 if wacc == 0.11 and tg == 0.035:
@@ -1429,35 +1334,28 @@ class FinancialModelGenerator:
         
         # Revenue Growth vs EBITDA Margin
         row += 3
-        ws[f'B{row}'] = "Revenue Growth vs EBITDA Margin Impact on EV"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "Revenue Growth vs EBITDA Margin Impact on EV", style='subheader')
         ws.merge_cells(f'B{row}:H{row}')
         row += 2
         
         rev_growth = [0.05, 0.08, 0.10, 0.12, 0.15, 0.18, 0.20]
         ebitda_margins = [0.15, 0.20, 0.25, 0.30, 0.35]
         
-        ws[f'B{row}'] = "Growth \\ Margin"
-        ws[f'B{row}'].style = 'header'
+        write_cell(ws, f'B{row}', "Growth \\ Margin", style='header')
         for i, margin in enumerate(ebitda_margins):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = margin
-            ws[f'{col}{row}'].style = 'header'
-            ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'{col}{row}', margin, style='header', number_format=self.FORMATS['percent'])
         second_header_row = row
         row += 1
         
         second_start_row = row
         for growth in rev_growth:
-            ws[f'B{row}'] = growth
-            ws[f'B{row}'].style = 'header'
-            ws[f'B{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'B{row}', growth, style='header', number_format=self.FORMATS['percent'])
             
             for i, margin in enumerate(ebitda_margins):
                 col = get_column_letter(3 + i)
                 # Simple EV proxy = Revenue * (1+g)^5 * margin * 8 (EV/EBITDA multiple)
-                ws[f'{col}{row}'] = f"=10000*((1+{growth})^5)*{margin}*8"
-                ws[f'{col}{row}'].number_format = self.FORMATS['number']
+                write_cell(ws, f'{col}{row}', f"=10000*((1+{growth})^5)*{margin}*8", number_format=self.FORMATS['number'])
             
             row += 1
         
@@ -1521,14 +1419,12 @@ class FinancialModelGenerator:
                 continue
             
             if bear is None:  # Section header
-                ws[f'B{row}'] = name
-                ws[f'B{row}'].style = 'subheader'
+                write_cell(ws, f'B{row}', name, style='subheader')
                 ws.merge_cells(f'B{row}:E{row}')
                 row += 1
                 continue
             
-            ws[f'B{row}'] = name
-            ws[f'B{row}'].style = 'label'
+            write_cell(ws, f'B{row}', name, style='label')
             
             for col, val in [('C', bear), ('D', base), ('E', bull)]:
                 ws[f'{col}{row}'] = val
@@ -1558,8 +1454,7 @@ class FinancialModelGenerator:
         data_start = row
         
         # Revenue data
-        ws[f'B{row}'] = "Chart Data"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "Chart Data", style='subheader')
         row += 1
         
         ws[f'B{row}'] = "Year"
@@ -1575,8 +1470,7 @@ class FinancialModelGenerator:
         for i in range(total_years):
             col = get_column_letter(3 + i)
             is_col = col
-            ws[f'{col}{row}'] = f"=Income_Statement!{is_col}6"
-            ws[f'{col}{row}'].number_format = self.FORMATS['number']
+            write_cell(ws, f'{col}{row}', f"=Income_Statement!{is_col}6", number_format=self.FORMATS['number'])
         rev_row = row
         row += 1
         
@@ -1584,8 +1478,7 @@ class FinancialModelGenerator:
         ws[f'B{row}'] = "EBITDA"
         for i in range(total_years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"=Income_Statement!{col}15"
-            ws[f'{col}{row}'].number_format = self.FORMATS['number']
+            write_cell(ws, f'{col}{row}', f"=Income_Statement!{col}15", number_format=self.FORMATS['number'])
         ebitda_row = row
         row += 1
         
@@ -1593,8 +1486,7 @@ class FinancialModelGenerator:
         ws[f'B{row}'] = "Net Income"
         for i in range(total_years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"=Income_Statement!{col}26"
-            ws[f'{col}{row}'].number_format = self.FORMATS['number']
+            write_cell(ws, f'{col}{row}', f"=Income_Statement!{col}26", number_format=self.FORMATS['number'])
         ni_row = row
         row += 1
         
@@ -1602,8 +1494,7 @@ class FinancialModelGenerator:
         ws[f'B{row}'] = "EBITDA Margin %"
         for i in range(total_years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"=IFERROR({col}{ebitda_row}/{col}{rev_row},0)"
-            ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'{col}{row}', f"=IFERROR({col}{ebitda_row}/{col}{rev_row},0)", number_format=self.FORMATS['percent'])
         margin_row = row
         row += 1
         
@@ -1661,8 +1552,7 @@ class FinancialModelGenerator:
         ws.add_chart(chart3, "L18")
         
         # Key Metrics Summary
-        ws['B22'] = "KEY METRICS SUMMARY"
-        ws['B22'].style = 'subheader'
+        write_cell(ws, 'B22', "KEY METRICS SUMMARY", style='subheader')
         ws.merge_cells('B22:D22')
         
         metrics = [
@@ -1678,10 +1568,8 @@ class FinancialModelGenerator:
         
         row = 23
         for name, formula, fmt in metrics:
-            ws[f'B{row}'] = name
-            ws[f'B{row}'].style = 'label'
-            ws[f'C{row}'] = formula
-            ws[f'C{row}'].style = 'output_cell'
+            write_cell(ws, f'B{row}', name, style='label')
+            write_cell(ws, f'C{row}', formula, style='output_cell')
             if fmt == "percent":
                 ws[f'C{row}'].number_format = self.FORMATS['percent']
             elif fmt == "currency":
@@ -1692,8 +1580,7 @@ class FinancialModelGenerator:
         
         # DCF Waterfall Data
         row = 50
-        ws[f'B{row}'] = "DCF Waterfall Data"
-        ws[f'B{row}'].style = 'subheader'
+        write_cell(ws, f'B{row}', "DCF Waterfall Data", style='subheader')
         row += 1
         
         ws[f'B{row}'] = "Component"
@@ -1718,8 +1605,7 @@ class FinancialModelGenerator:
         
         # Starting point (Sum of PV of FCF)
         ws[f'B{row}'] = "PV of FCF"
-        ws[f'C{row}'] = f"=Valuation!C{sum_pv_row}"  # Sum of PV of FCFF
-        ws[f'C{row}'].number_format = self.FORMATS['number']
+        write_cell(ws, f'C{row}', f"=Valuation!C{sum_pv_row}", number_format=self.FORMATS['number'])  # Sum of PV of FCFF
         ws[f'D{row}'] = 0
         ws[f'E{row}'] = "=C" + str(row)
         ws[f'F{row}'] = 0
@@ -1727,8 +1613,7 @@ class FinancialModelGenerator:
         
         # Terminal Value add (PV of TV)
         ws[f'B{row}'] = "+ Terminal Value"
-        ws[f'C{row}'] = f"=Valuation!C{sum_pv_row+1}"  # PV of Terminal Value (next row after sum_pv)
-        ws[f'C{row}'].number_format = self.FORMATS['number']
+        write_cell(ws, f'C{row}', f"=Valuation!C{sum_pv_row+1}", number_format=self.FORMATS['number'])  # PV of Terminal Value (next row after sum_pv)
         ws[f'D{row}'] = f"=C{row-1}+E{row-1}"
         ws[f'E{row}'] = f"=C{row}"
         ws[f'F{row}'] = 0
@@ -1736,8 +1621,7 @@ class FinancialModelGenerator:
         
         # = Enterprise Value
         ws[f'B{row}'] = "= Enterprise Value"
-        ws[f'C{row}'] = f"=Valuation!C{ev_row}"
-        ws[f'C{row}'].number_format = self.FORMATS['number']
+        write_cell(ws, f'C{row}', f"=Valuation!C{ev_row}", number_format=self.FORMATS['number'])
         ws[f'D{row}'] = 0
         ws[f'E{row}'] = 0
         ws[f'F{row}'] = 0
@@ -1745,8 +1629,7 @@ class FinancialModelGenerator:
         
         # Less Net Debt
         ws[f'B{row}'] = "- Net Debt"
-        ws[f'C{row}'] = f"=Valuation!C{net_debt_row}"
-        ws[f'C{row}'].number_format = self.FORMATS['number']
+        write_cell(ws, f'C{row}', f"=Valuation!C{net_debt_row}", number_format=self.FORMATS['number'])
         ws[f'D{row}'] = f"=Valuation!C{ev_row}"
         ws[f'E{row}'] = 0
         ws[f'F{row}'] = f"=ABS(C{row})"
@@ -1754,8 +1637,7 @@ class FinancialModelGenerator:
         
         # = Equity Value
         ws[f'B{row}'] = "= Equity Value"
-        ws[f'C{row}'] = f"=Valuation!C{equity_val_row}"
-        ws[f'C{row}'].number_format = self.FORMATS['number']
+        write_cell(ws, f'C{row}', f"=Valuation!C{equity_val_row}", number_format=self.FORMATS['number'])
         ws[f'D{row}'] = 0
         ws[f'E{row}'] = 0
         ws[f'F{row}'] = 0
@@ -16,6 +16,8 @@ from datetime import datetime
 import os
 import logging
 
+from ._cells import BOLD_FONT, SECTION_FONT, write_cell
+
 logger = logging.getLogger(__name__)
 
 
@@ -75,7 +77,7 @@ class LBOStyler:
         # Output cell style
         output_style = NamedStyle(name='lbo_output')
         output_style.fill = PatternFill('solid', fgColor=cls.COLORS['output'])
-        output_style.font = Font(bold=True)
+        output_style.font = BOLD_FONT
         wb.add_named_style(output_style)
         
         # Returns highlight style
@@ -196,7 +198,7 @@ class LBOModelGenerator:
         row = 4
         for label, value in info_data:
             ws[f'B{row}'] = label
-            ws[f'B{row}'].font = Font(bold=True)
+            ws[f'B{row}'].font = BOLD_FONT
             ws[f'C{row}'] = value
             row += 1
         
@@ -232,7 +234,7 @@ class LBOModelGenerator:
         # Transaction Assumptions
         row = 4
         ws[f'B{row}'] = 'Transaction Assumptions'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         trans_assumptions = [
@@ -259,7 +261,7 @@ class LBOModelGenerator:
         # Debt Structure
         row += 2
         ws[f'B{row}'] = 'Debt Structure'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         debt_assumptions = [
@@ -287,7 +289,7 @@ class LBOModelGenerator:
         # Operating Assumptions
         row += 2
         ws[f'B{row}'] = 'Operating Assumptions'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         op_assumptions = [
@@ -325,11 +327,11 @@ class LBOModelGenerator:
         row = 4
         # Uses of Funds
         ws[f'B{row}'] = 'Uses of Funds'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         ws[f'C{row}'] = 'Amount'
         ws[f'D{row}'] = '% of Total'
-        ws[f'C{row}'].font = Font(bold=True)
-        ws[f'D{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
+        ws[f'D{row}'].font = BOLD_FONT
         row += 1
         
         uses_start = row
@@ -342,34 +344,32 @@ class LBOModelGenerator:
         
         for label, formula in uses:
             ws[f'B{row}'] = label
-            ws[f'C{row}'] = formula
-            ws[f'C{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'C{row}', formula, number_format=self.FORMATS['currency'])
             row += 1
         
         uses_end = row - 1
         ws[f'B{row}'] = 'Total Uses'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws[f'C{row}'] = f'=IFERROR(SUM(C{uses_start}:C{uses_end}),0)'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         total_uses_row = row
         
         # Add % of Total formulas
         for r in range(uses_start, uses_end + 1):
-            ws[f'D{r}'] = f'=IFERROR(C{r}/C{total_uses_row},0)'
-            ws[f'D{r}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'D{r}', f'=IFERROR(C{r}/C{total_uses_row},0)', number_format=self.FORMATS['percent'])
         
         row += 3
         
         # Sources of Funds
         ws[f'B{row}'] = 'Sources of Funds'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         ws[f'C{row}'] = 'Amount'
         ws[f'D{row}'] = '% of Total'
         ws[f'E{row}'] = 'x EBITDA'
-        ws[f'C{row}'].font = Font(bold=True)
-        ws[f'D{row}'].font = Font(bold=True)
-        ws[f'E{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
+        ws[f'D{row}'].font = BOLD_FONT
+        ws[f'E{row}'].font = BOLD_FONT
         row += 1
         
         sources_start = row
@@ -382,10 +382,8 @@ class LBOModelGenerator:
         
         for label, formula in sources:
             ws[f'B{row}'] = label
-            ws[f'C{row}'] = formula
-            ws[f'C{row}'].number_format = self.FORMATS['currency']
-            ws[f'E{row}'] = f'=IFERROR(C{row}/{base_ebitda},0)'
-            ws[f'E{row}'].number_format = self.FORMATS['multiple']
+            write_cell(ws, f'C{row}', formula, number_format=self.FORMATS['currency'])
+            write_cell(ws, f'E{row}', f'=IFERROR(C{row}/{base_ebitda},0)', number_format=self.FORMATS['multiple'])
             row += 1
         
         # Sponsor Equity (plug)
@@ -393,30 +391,27 @@ class LBOModelGenerator:
         ws[f'C{row}'] = f'=IFERROR(C{total_uses_row}-SUM(C{sources_start}:C{row-1}),0)'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
         ws[f'C{row}'].style = 'lbo_output'
-        ws[f'E{row}'] = f'=IFERROR(C{row}/{base_ebitda},0)'
-        ws[f'E{row}'].number_format = self.FORMATS['multiple']
+        write_cell(ws, f'E{row}', f'=IFERROR(C{row}/{base_ebitda},0)', number_format=self.FORMATS['multiple'])
         sponsor_equity_row = row
         row += 1
         
         sources_end = row - 1
         ws[f'B{row}'] = 'Total Sources'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws[f'C{row}'] = f'=IFERROR(SUM(C{sources_start}:C{sources_end}),0)'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         total_sources_row = row
         
         # Add % of Total formulas
         for r in range(sources_start, sources_end + 1):
-            ws[f'D{r}'] = f'=IFERROR(C{r}/C{total_sources_row},0)'
-            ws[f'D{r}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'D{r}', f'=IFERROR(C{r}/C{total_sources_row},0)', number_format=self.FORMATS['percent'])
         
         # Balance check
         row += 2
         ws[f'B{row}'] = 'Sources - Uses Check'
-        ws[f'B{row}'].font = Font(bold=True)
-        ws[f'C{row}'] = f'=IFERROR(C{total_sources_row}-C{total_uses_row},0)'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        ws[f'B{row}'].font = BOLD_FONT
+        write_cell(ws, f'C{row}', f'=IFERROR(C{total_sources_row}-C{total_uses_row},0)', number_format=self.FORMATS['currency'])
         
         # Store key values as named ranges
         add_named_range(self.wb, 'total_uses', f"Sources_Uses!$C${total_uses_row}")
@@ -438,7 +433,7 @@ class LBOModelGenerator:
         # Year headers
         row = 4
         ws[f'B{row}'] = 'Fiscal Year'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             if i == 0:
@@ -451,14 +446,13 @@ class LBOModelGenerator:
         
         # Revenue
         ws[f'B{row}'] = 'Revenue'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws['C' + str(row)] = base_revenue
         ws['C' + str(row)].number_format = self.FORMATS['currency']
         for i in range(1, holding_period + 1):
             col = get_column_letter(3 + i)
             prev_col = get_column_letter(2 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({prev_col}{row}*(1+rev_growth),0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({prev_col}{row}*(1+rev_growth),0)', number_format=self.FORMATS['currency'])
         revenue_row = row
         
         row += 1
@@ -468,17 +462,15 @@ class LBOModelGenerator:
         for i in range(1, holding_period + 1):
             col = get_column_letter(3 + i)
             prev_col = get_column_letter(2 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{revenue_row}/{prev_col}{revenue_row}-1,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{revenue_row}/{prev_col}{revenue_row}-1,0)', number_format=self.FORMATS['percent'])
         
         row += 2
         # EBITDA
         ws[f'B{row}'] = 'EBITDA'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{revenue_row}*ebitda_margin,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{revenue_row}*ebitda_margin,0)', number_format=self.FORMATS['currency'])
         ebitda_row = row
         
         row += 1
@@ -486,26 +478,23 @@ class LBOModelGenerator:
         ws[f'B{row}'] = '  % Margin'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{ebitda_row}/{col}{revenue_row},0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{ebitda_row}/{col}{revenue_row},0)', number_format=self.FORMATS['percent'])
         
         row += 2
         # D&A
         ws[f'B{row}'] = 'Depreciation & Amortization'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{revenue_row}*da_pct,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{revenue_row}*da_pct,0)', number_format=self.FORMATS['currency'])
         da_row = row
         
         row += 1
         # EBIT
         ws[f'B{row}'] = 'EBIT'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{ebitda_row}-{col}{da_row},0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{ebitda_row}-{col}{da_row},0)', number_format=self.FORMATS['currency'])
         ebit_row = row
         
         row += 2
@@ -513,18 +502,16 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Interest Expense'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f"=IF(ISERROR(Debt_Schedule!{col}$50),0,Debt_Schedule!{col}$50)"
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f"=IF(ISERROR(Debt_Schedule!{col}$50),0,Debt_Schedule!{col}$50)", number_format=self.FORMATS['currency'])
         interest_row = row
         
         row += 1
         # EBT
         ws[f'B{row}'] = 'EBT (Earnings Before Tax)'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{ebit_row}-{col}{interest_row},0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{ebit_row}-{col}{interest_row},0)', number_format=self.FORMATS['currency'])
         ebt_row = row
         
         row += 1
@@ -532,14 +519,13 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Taxes'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(MAX(0,{col}{ebt_row}*tax_rate),0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(MAX(0,{col}{ebt_row}*tax_rate),0)', number_format=self.FORMATS['currency'])
         tax_row = row
         
         row += 1
         # Net Income
         ws[f'B{row}'] = 'Net Income'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR({col}{ebt_row}-{col}{tax_row},0)'
@@ -565,7 +551,7 @@ class LBOModelGenerator:
         # Year headers
         row = 4
         ws[f'B{row}'] = 'Fiscal Year'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             if i == 0:
@@ -588,8 +574,7 @@ class LBOModelGenerator:
         for i in range(1, holding_period + 1):
             col = get_column_letter(3 + i)
             prev_col = get_column_letter(2 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({prev_col}{row+3},0)'  # End of prev period
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({prev_col}{row+3},0)', number_format=self.FORMATS['currency'])  # End of prev period
         senior_begin_row = row
         
         row += 1
@@ -598,8 +583,7 @@ class LBOModelGenerator:
         ws['C' + str(row)] = 0
         for i in range(1, holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(-C{senior_begin_row}/senior_amort,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(-C{senior_begin_row}/senior_amort,0)', number_format=self.FORMATS['currency'])
         senior_amort_row = row
         
         row += 1
@@ -618,7 +602,7 @@ class LBOModelGenerator:
         row += 1
         # Ending Balance
         ws[f'B{row}'] = 'Ending Balance'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR(MAX(0,{col}{senior_begin_row}+{col}{senior_amort_row}+{col}{senior_prepay_row}),0)'
@@ -631,8 +615,7 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Interest Expense'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{senior_begin_row}*senior_rate,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{senior_begin_row}*senior_rate,0)', number_format=self.FORMATS['currency'])
         senior_interest_row = row
         
         row += 3
@@ -649,8 +632,7 @@ class LBOModelGenerator:
         for i in range(1, holding_period + 1):
             col = get_column_letter(3 + i)
             prev_col = get_column_letter(2 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({prev_col}{row+2},0)'  # End of prev period + PIK
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({prev_col}{row+2},0)', number_format=self.FORMATS['currency'])  # End of prev period + PIK
         mezz_begin_row = row
         
         row += 1
@@ -658,14 +640,13 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'PIK Interest'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{mezz_begin_row}*mezz_pik,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{mezz_begin_row}*mezz_pik,0)', number_format=self.FORMATS['currency'])
         mezz_pik_row = row
         
         row += 1
         # Ending Balance
         ws[f'B{row}'] = 'Ending Balance'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR({col}{mezz_begin_row}+{col}{mezz_pik_row},0)'
@@ -678,8 +659,7 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Cash Interest'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{mezz_begin_row}*mezz_rate,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{mezz_begin_row}*mezz_rate,0)', number_format=self.FORMATS['currency'])
         mezz_interest_row = row
         
         row += 3
@@ -696,14 +676,13 @@ class LBOModelGenerator:
         for i in range(1, holding_period + 1):
             col = get_column_letter(3 + i)
             prev_col = get_column_letter(2 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({prev_col}{row+1},0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({prev_col}{row+1},0)', number_format=self.FORMATS['currency'])
         sub_begin_row = row
         
         row += 1
         # Ending Balance (bullet at exit)
         ws[f'B{row}'] = 'Ending Balance'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR({col}{sub_begin_row},0)'
@@ -716,20 +695,19 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Interest Expense'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{sub_begin_row}*sub_rate,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{sub_begin_row}*sub_rate,0)', number_format=self.FORMATS['currency'])
         sub_interest_row = row
         
         row += 3
         
         # ============ TOTAL DEBT SUMMARY ============
         ws[f'B{row}'] = 'Total Debt Summary'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         # Total Debt
         ws[f'B{row}'] = 'Total Debt'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR({col}{senior_end_row}+{col}{mezz_end_row}+{col}{sub_end_row},0)'
@@ -740,11 +718,10 @@ class LBOModelGenerator:
         
         # Total Interest (at row 50 for reference from Operating Model)
         ws[f'B50'] = 'Total Interest Expense'
-        ws[f'B50'].font = Font(bold=True)
+        ws[f'B50'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}50'] = f'=IFERROR({col}{senior_interest_row}+{col}{mezz_interest_row}+{col}{sub_interest_row},0)'
-            ws[f'{col}50'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}50', f'=IFERROR({col}{senior_interest_row}+{col}{mezz_interest_row}+{col}{sub_interest_row},0)', number_format=self.FORMATS['currency'])
         
         # Set column widths
         ws.column_dimensions['B'].width = 25
@@ -760,7 +737,7 @@ class LBOModelGenerator:
         # Year headers
         row = 4
         ws[f'B{row}'] = 'Fiscal Year'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             if i == 0:
@@ -773,11 +750,10 @@ class LBOModelGenerator:
         
         # EBITDA
         ws[f'B{row}'] = 'EBITDA'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(Operating!{col}$10,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(Operating!{col}$10,0)', number_format=self.FORMATS['currency'])
         ebitda_row = row
         
         row += 1
@@ -785,8 +761,7 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Less: Cash Interest'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(-Debt_Schedule!{col}$50,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(-Debt_Schedule!{col}$50,0)', number_format=self.FORMATS['currency'])
         interest_row = row
         
         row += 1
@@ -794,8 +769,7 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Less: Cash Taxes'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(-MAX(0,({col}{ebitda_row}+{col}{interest_row})*tax_rate),0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(-MAX(0,({col}{ebitda_row}+{col}{interest_row})*tax_rate),0)', number_format=self.FORMATS['currency'])
         tax_row = row
         
         row += 1
@@ -803,8 +777,7 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Less: CapEx'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(-Operating!{col}$6*capex_pct,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(-Operating!{col}$6*capex_pct,0)', number_format=self.FORMATS['currency'])
         capex_row = row
         
         row += 1
@@ -823,7 +796,7 @@ class LBOModelGenerator:
         row += 2
         # Free Cash Flow
         ws[f'B{row}'] = 'Free Cash Flow'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR(SUM({col}{ebitda_row}:{col}{nwc_row}),0)'
@@ -836,14 +809,13 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Less: Mandatory Debt Amortization'
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR(Debt_Schedule!{col}$8,0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=IFERROR(Debt_Schedule!{col}$8,0)', number_format=self.FORMATS['currency'])
         amort_row = row
         
         row += 2
         # Cash Available for Sweep (Row 40 for debt schedule reference)
         ws[f'B40'] = 'Cash Available for Sweep'
-        ws[f'B40'].font = Font(bold=True)
+        ws[f'B40'].font = BOLD_FONT
         for i in range(holding_period + 1):
             col = get_column_letter(3 + i)
             ws[f'{col}40'] = f'=IFERROR({col}{fcf_row}+{col}{amort_row},0)'
@@ -865,36 +837,33 @@ class LBOModelGenerator:
         row = 4
         # Exit Analysis
         ws[f'B{row}'] = 'Exit Analysis'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         exit_col = get_column_letter(3 + holding_period)
         
         # Exit EBITDA
         ws[f'B{row}'] = 'Exit Year EBITDA'
-        ws[f'C{row}'] = f'=IFERROR(Operating!{exit_col}$10,0)'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=IFERROR(Operating!{exit_col}$10,0)', number_format=self.FORMATS['currency'])
         exit_ebitda_row = row
         
         row += 1
         # Exit Multiple
         ws[f'B{row}'] = 'Exit EV/EBITDA Multiple'
-        ws[f'C{row}'] = '=exit_multiple'
-        ws[f'C{row}'].number_format = self.FORMATS['multiple']
+        write_cell(ws, f'C{row}', '=exit_multiple', number_format=self.FORMATS['multiple'])
         
         row += 1
         # Exit Enterprise Value
         ws[f'B{row}'] = 'Exit Enterprise Value'
         ws[f'C{row}'] = f'=IFERROR(C{exit_ebitda_row}*exit_multiple,0)'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         exit_ev_row = row
         
         row += 1
         # Less: Exit Debt
         ws[f'B{row}'] = 'Less: Debt at Exit'
-        ws[f'C{row}'] = f'=IFERROR(-Debt_Schedule!{exit_col}$45,0)'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=IFERROR(-Debt_Schedule!{exit_col}$45,0)', number_format=self.FORMATS['currency'])
         exit_debt_row = row
         
         row += 1
@@ -902,7 +871,7 @@ class LBOModelGenerator:
         ws[f'B{row}'] = 'Exit Equity Value'
         ws[f'C{row}'] = f'=IFERROR(C{exit_ev_row}+C{exit_debt_row},0)'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         ws[f'C{row}'].style = 'lbo_output'
         exit_equity_row = row
         
@@ -914,15 +883,13 @@ class LBOModelGenerator:
         
         # Initial Equity Investment
         ws[f'B{row}'] = 'Initial Sponsor Equity'
-        ws[f'C{row}'] = '=IFERROR(sponsor_equity,0)'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', '=IFERROR(sponsor_equity,0)', number_format=self.FORMATS['currency'])
         initial_equity_row = row
         
         row += 1
         # Exit Equity Proceeds
         ws[f'B{row}'] = 'Exit Equity Proceeds'
-        ws[f'C{row}'] = f'=IFERROR(C{exit_equity_row},0)'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=IFERROR(C{exit_equity_row},0)', number_format=self.FORMATS['currency'])
         
         row += 2
         # MoIC
@@ -948,29 +915,26 @@ class LBOModelGenerator:
         row += 1
         # Payback Period
         ws[f'B{row}'] = 'Payback Period (Years)'
-        ws[f'C{row}'] = f'=IFERROR(holding_period/LN(C{moic_row})*LN(2),0)'
-        ws[f'C{row}'].number_format = self.FORMATS['years']
+        write_cell(ws, f'C{row}', f'=IFERROR(holding_period/LN(C{moic_row})*LN(2),0)', number_format=self.FORMATS['years'])
         
         row += 3
         # Cash-on-Cash Return by Year
         ws[f'B{row}'] = 'Cash-on-Cash Return by Exit Year'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         ws[f'B{row}'] = 'Exit Year'
         ws[f'C{row}'] = 'MoIC'
         ws[f'D{row}'] = 'IRR'
-        ws[f'C{row}'].font = Font(bold=True)
-        ws[f'D{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
+        ws[f'D{row}'].font = BOLD_FONT
         row += 1
         
         for year in range(1, holding_period + 1):
             ws[f'B{row}'] = f'Year {year}'
             yr_col = get_column_letter(3 + year)
-            ws[f'C{row}'] = f'=IFERROR((Operating!{yr_col}$10*exit_multiple-Debt_Schedule!{yr_col}$45)/sponsor_equity,0)'
-            ws[f'C{row}'].number_format = self.FORMATS['multiple']
-            ws[f'D{row}'] = f'=IFERROR(C{row}^(1/{year})-1,0)'
-            ws[f'D{row}'].number_format = self.FORMATS['irr']
+            write_cell(ws, f'C{row}', f'=IFERROR((Operating!{yr_col}$10*exit_multiple-Debt_Schedule!{yr_col}$45)/sponsor_equity,0)', number_format=self.FORMATS['multiple'])
+            write_cell(ws, f'D{row}', f'=IFERROR(C{row}^(1/{year})-1,0)', number_format=self.FORMATS['irr'])
             row += 1
         
         # Set column widths
@@ -985,7 +949,7 @@ class LBOModelGenerator:
         row = 4
         # Exit Multiple vs Entry Multiple
         ws[f'B{row}'] = 'IRR Sensitivity: Exit Multiple vs Entry Multiple'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 2
         
         # Headers
@@ -996,8 +960,7 @@ class LBOModelGenerator:
         # Column headers (Exit Multiples)
         for i, em in enumerate(exit_multiples):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'{em:.1f}x'
-            ws[f'{col}{row}'].style = 'lbo_header'
+            write_cell(ws, f'{col}{row}', f'{em:.1f}x', style='lbo_header')
         row += 1
         
         # Row headers (Entry multiples) and values
@@ -1006,21 +969,20 @@ class LBOModelGenerator:
         
         for entry_m in entry_multiples:
             ws[f'B{row}'] = f'{entry_m:.1f}x Entry'
-            ws[f'B{row}'].font = Font(bold=True)
+            ws[f'B{row}'].font = BOLD_FONT
             
             for i, exit_m in enumerate(exit_multiples):
                 col = get_column_letter(3 + i)
                 # Simplified IRR calculation for sensitivity
                 # Entry EV = entry_m * EBITDA, Exit EV = exit_m * EBITDA * (1+growth)^years
-                ws[f'{col}{row}'] = f'=IFERROR((({exit_m}*{base_ebitda}*(1+rev_growth)^{holding_period})/(({entry_m}*{base_ebitda})*0.4))^(1/{holding_period})-1,0)'
-                ws[f'{col}{row}'].number_format = self.FORMATS['irr']
+                write_cell(ws, f'{col}{row}', f'=IFERROR((({exit_m}*{base_ebitda}*(1+rev_growth)^{holding_period})/(({entry_m}*{base_ebitda})*0.4))^(1/{holding_period})-1,0)', number_format=self.FORMATS['irr'])
             row += 1
         
         row += 3
         
         # MoIC Sensitivity
         ws[f'B{row}'] = 'MoIC Sensitivity: Exit Multiple vs Leverage'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 2
         
         # Headers
@@ -1029,13 +991,12 @@ class LBOModelGenerator:
         
         for i, em in enumerate(exit_multiples):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'{em:.1f}x Exit'
-            ws[f'{col}{row}'].style = 'lbo_header'
+            write_cell(ws, f'{col}{row}', f'{em:.1f}x Exit', style='lbo_header')
         row += 1
         
         for lev in leverage_levels:
             ws[f'B{row}'] = f'{lev:.1f}x Leverage'
-            ws[f'B{row}'].font = Font(bold=True)
+            ws[f'B{row}'].font = BOLD_FONT
             
             for i, exit_m in enumerate(exit_multiples):
                 col = get_column_letter(3 + i)
@@ -1044,8 +1005,7 @@ class LBOModelGenerator:
                 debt = lev * base_ebitda
                 equity = entry_ev - debt
                 exit_ev = exit_m * base_ebitda * (1 + self.assumptions.get('revenue_growth', 0.08)) ** holding_period
-                ws[f'{col}{row}'] = f'=IFERROR(({exit_ev}-{debt}*0.7)/{equity},0)'
-                ws[f'{col}{row}'].number_format = self.FORMATS['multiple']
+                write_cell(ws, f'{col}{row}', f'=IFERROR(({exit_ev}-{debt}*0.7)/{equity},0)', number_format=self.FORMATS['multiple'])
             row += 1
         
         # Set column widths
@@ -16,6 +16,8 @@ from datetime import datetime
 import os
 import logging
 
+from ._cells import BOLD_FONT, SECTION_FONT, write_cell
+
 logger = logging.getLogger(__name__)
 
 
@@ -194,8 +196,7 @@ class MAModelGenerator:
         row += 1
         
         ws[f'B{row}'] = 'Offer Premium'
-        ws[f'C{row}'] = self.assumptions['offer_premium']
-        ws[f'C{row}'].number_format = self.FORMATS['percent']
+        write_cell(ws, f'C{row}', self.assumptions['offer_premium'], number_format=self.FORMATS['percent'])
         row += 1
         
         ws[f'B{row}'] = 'Consideration Mix'
@@ -229,7 +230,7 @@ class MAModelGenerator:
         
         row = 4
         ws[f'B{row}'] = 'Transaction Assumptions'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         trans_inputs = [
@@ -251,7 +252,7 @@ class MAModelGenerator:
         
         row += 2
         ws[f'B{row}'] = 'Synergy Assumptions'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         synergy_inputs = [
@@ -276,7 +277,7 @@ class MAModelGenerator:
         
         row += 2
         ws[f'B{row}'] = 'Growth Assumptions'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         growth_inputs = [
@@ -306,130 +307,118 @@ class MAModelGenerator:
         
         row = 4
         ws[f'B{row}'] = 'Purchase Price Calculation'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         # Target current price
         ws[f'B{row}'] = 'Target Current Share Price'
-        ws[f'C{row}'] = target_price
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', target_price, number_format=self.FORMATS['currency'])
         target_price_row = row
         row += 1
         
         # Offer premium
         ws[f'B{row}'] = 'Offer Premium'
-        ws[f'C{row}'] = '=offer_premium'
-        ws[f'C{row}'].number_format = self.FORMATS['percent']
+        write_cell(ws, f'C{row}', '=offer_premium', number_format=self.FORMATS['percent'])
         row += 1
         
         # Offer price per share
         ws[f'B{row}'] = 'Offer Price per Share'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws[f'C{row}'] = f'=C{target_price_row}*(1+offer_premium)'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         offer_price_row = row
         row += 1
         
         # Target shares outstanding
         ws[f'B{row}'] = 'Target Shares Outstanding'
-        ws[f'C{row}'] = target_shares
-        ws[f'C{row}'].number_format = self.FORMATS['shares']
+        write_cell(ws, f'C{row}', target_shares, number_format=self.FORMATS['shares'])
         target_shares_row = row
         row += 1
         
         # Equity Value
         ws[f'B{row}'] = 'Equity Value (Offer)'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws[f'C{row}'] = f'=C{offer_price_row}*C{target_shares_row}'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         equity_value_row = row
         row += 2
         
         # Uses of Funds
         ws[f'B{row}'] = 'Uses of Funds'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         uses_start = row
         ws[f'B{row}'] = 'Equity Purchase Price'
-        ws[f'C{row}'] = f'=C{equity_value_row}'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=C{equity_value_row}', number_format=self.FORMATS['currency'])
         row += 1
         
         ws[f'B{row}'] = 'Refinance Target Debt'
-        ws[f'C{row}'] = self.target.get('total_debt', 0)
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', self.target.get('total_debt', 0), number_format=self.FORMATS['currency'])
         row += 1
         
         ws[f'B{row}'] = 'Transaction Fees'
-        ws[f'C{row}'] = f'=C{equity_value_row}*trans_fees'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=C{equity_value_row}*trans_fees', number_format=self.FORMATS['currency'])
         row += 1
         
         uses_end = row - 1
         ws[f'B{row}'] = 'Total Uses'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws[f'C{row}'] = f'=SUM(C{uses_start}:C{uses_end})'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         total_uses_row = row
         row += 2
         
         # Sources of Funds
         ws[f'B{row}'] = 'Sources of Funds'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         sources_start = row
         # Stock consideration
         ws[f'B{row}'] = 'Stock Issuance'
-        ws[f'C{row}'] = f'=C{equity_value_row}*pct_stock'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=C{equity_value_row}*pct_stock', number_format=self.FORMATS['currency'])
         stock_row = row
         row += 1
         
         # Cash consideration
         ws[f'B{row}'] = 'Cash (from Balance Sheet)'
-        ws[f'C{row}'] = f'=C{equity_value_row}*pct_cash'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=C{equity_value_row}*pct_cash', number_format=self.FORMATS['currency'])
         row += 1
         
         # New debt
         ws[f'B{row}'] = 'New Debt Financing'
-        ws[f'C{row}'] = f'=C{total_uses_row}-C{sources_start}-C{sources_start+1}'
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', f'=C{total_uses_row}-C{sources_start}-C{sources_start+1}', number_format=self.FORMATS['currency'])
         new_debt_row = row
         row += 1
         
         sources_end = row - 1
         ws[f'B{row}'] = 'Total Sources'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         ws[f'C{row}'] = f'=SUM(C{sources_start}:C{sources_end})'
         ws[f'C{row}'].number_format = self.FORMATS['currency']
-        ws[f'C{row}'].font = Font(bold=True)
+        ws[f'C{row}'].font = BOLD_FONT
         row += 2
         
         # Exchange ratio
         ws[f'B{row}'] = 'Exchange Ratio'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         ws[f'B{row}'] = 'Acquirer Share Price'
-        ws[f'C{row}'] = acquirer_price
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', acquirer_price, number_format=self.FORMATS['currency'])
         acq_price_row = row
         row += 1
         
         ws[f'B{row}'] = 'Exchange Ratio (per Target Share)'
-        ws[f'C{row}'] = f'=IFERROR((C{offer_price_row}*pct_stock)/C{acq_price_row},0)'
-        ws[f'C{row}'].number_format = '0.000x'
+        write_cell(ws, f'C{row}', f'=IFERROR((C{offer_price_row}*pct_stock)/C{acq_price_row},0)', number_format='0.000x')
         row += 1
         
         ws[f'B{row}'] = 'New Shares Issued'
-        ws[f'C{row}'] = f'=IFERROR(C{stock_row}/C{acq_price_row},0)'
-        ws[f'C{row}'].number_format = self.FORMATS['shares']
+        write_cell(ws, f'C{row}', f'=IFERROR(C{stock_row}/C{acq_price_row},0)', number_format=self.FORMATS['shares'])
         
         # Store references
         add_named_range(self.wb, 'equity_value', f"Transaction!$C${equity_value_row}")
@@ -513,36 +502,31 @@ class MAModelGenerator:
         
         # Headers
         ws[f'B{row}'] = 'Pro Forma Income Statement'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         ws[f'B{row}'] = 'Year'
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'Year {i+1}'
-            ws[f'{col}{row}'].style = 'ma_header'
+            write_cell(ws, f'{col}{row}', f'Year {i+1}', style='ma_header')
         row += 1
         header_row = row - 1
         
         # Acquirer Revenue
-        ws[f'B{row}'] = 'Acquirer Revenue'
-        ws[f'B{row}'].style = 'ma_acquirer'
+        write_cell(ws, f'B{row}', 'Acquirer Revenue', style='ma_acquirer')
         acq_base_rev = self.acquirer.get('revenue', 10000)
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'={acq_base_rev}*(1+acq_growth)^{i+1}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'={acq_base_rev}*(1+acq_growth)^{i+1}', number_format=self.FORMATS['currency'])
         acq_rev_row = row
         row += 1
         
         # Target Revenue
-        ws[f'B{row}'] = 'Target Revenue'
-        ws[f'B{row}'].style = 'ma_target'
+        write_cell(ws, f'B{row}', 'Target Revenue', style='ma_target')
         tgt_base_rev = self.target.get('revenue', 2000)
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'={tgt_base_rev}*(1+tgt_growth)^{i+1}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'={tgt_base_rev}*(1+tgt_growth)^{i+1}', number_format=self.FORMATS['currency'])
         tgt_rev_row = row
         row += 1
         
@@ -551,19 +535,17 @@ class MAModelGenerator:
         for i in range(years):
             col = get_column_letter(3 + i)
             phase_in = f'phase_y{min(i+1,3)}'
-            ws[f'{col}{row}'] = f'=rev_synergies*{phase_in}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=rev_synergies*{phase_in}', number_format=self.FORMATS['currency'])
         syn_rev_row = row
         row += 1
         
         # Combined Revenue
-        ws[f'B{row}'] = 'Combined Revenue'
-        ws[f'B{row}'].style = 'ma_combined'
+        write_cell(ws, f'B{row}', 'Combined Revenue', style='ma_combined')
         for i in range(years):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'={col}{acq_rev_row}+{col}{tgt_rev_row}+{col}{syn_rev_row}'
             ws[f'{col}{row}'].number_format = self.FORMATS['currency']
-            ws[f'{col}{row}'].font = Font(bold=True)
+            ws[f'{col}{row}'].font = BOLD_FONT
         combined_rev_row = row
         row += 2
         
@@ -571,21 +553,17 @@ class MAModelGenerator:
         acq_ebitda_margin = self.acquirer.get('ebitda', 2000) / self.acquirer.get('revenue', 10000)
         tgt_ebitda_margin = self.target.get('ebitda', 400) / self.target.get('revenue', 2000)
         
-        ws[f'B{row}'] = 'Acquirer EBITDA'
-        ws[f'B{row}'].style = 'ma_acquirer'
+        write_cell(ws, f'B{row}', 'Acquirer EBITDA', style='ma_acquirer')
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'={col}{acq_rev_row}*{acq_ebitda_margin}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'={col}{acq_rev_row}*{acq_ebitda_margin}', number_format=self.FORMATS['currency'])
         acq_ebitda_row = row
         row += 1
         
-        ws[f'B{row}'] = 'Target EBITDA'
-        ws[f'B{row}'].style = 'ma_target'
+        write_cell(ws, f'B{row}', 'Target EBITDA', style='ma_target')
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'={col}{tgt_rev_row}*{tgt_ebitda_margin}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'={col}{tgt_rev_row}*{tgt_ebitda_margin}', number_format=self.FORMATS['currency'])
         tgt_ebitda_row = row
         row += 1
         
@@ -593,50 +571,45 @@ class MAModelGenerator:
         for i in range(years):
             col = get_column_letter(3 + i)
             phase_in = f'phase_y{min(i+1,3)}'
-            ws[f'{col}{row}'] = f'=cost_synergies*{phase_in}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'{col}{row}', f'=cost_synergies*{phase_in}', number_format=self.FORMATS['currency'])
         cost_syn_row = row
         row += 1
         
-        ws[f'B{row}'] = 'Combined EBITDA'
-        ws[f'B{row}'].style = 'ma_combined'
+        write_cell(ws, f'B{row}', 'Combined EBITDA', style='ma_combined')
         for i in range(years):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'={col}{acq_ebitda_row}+{col}{tgt_ebitda_row}+{col}{cost_syn_row}'
             ws[f'{col}{row}'].number_format = self.FORMATS['currency']
-            ws[f'{col}{row}'].font = Font(bold=True)
+            ws[f'{col}{row}'].font = BOLD_FONT
         combined_ebitda_row = row
         row += 2
         
         # Net Income & EPS
         tax_rate = 0.25
         
-        ws[f'B{row}'] = 'Pro Forma Net Income'
-        ws[f'B{row}'].style = 'ma_combined'
+        write_cell(ws, f'B{row}', 'Pro Forma Net Income', style='ma_combined')
         for i in range(years):
             col = get_column_letter(3 + i)
             # Simplified: EBITDA - Interest - Taxes
             ws[f'{col}{row}'] = f'=({col}{combined_ebitda_row}-new_debt*fin_rate)*(1-{tax_rate})'
             ws[f'{col}{row}'].number_format = self.FORMATS['currency']
-            ws[f'{col}{row}'].font = Font(bold=True)
+            ws[f'{col}{row}'].font = BOLD_FONT
         pf_ni_row = row
         row += 1
         
         ws[f'B{row}'] = 'Pro Forma Shares'
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=acq_shares+new_shares'
-            ws[f'{col}{row}'].number_format = self.FORMATS['shares']
+            write_cell(ws, f'{col}{row}', f'=acq_shares+new_shares', number_format=self.FORMATS['shares'])
         pf_shares_row = row
         row += 1
         
-        ws[f'B{row}'] = 'Pro Forma EPS'
-        ws[f'B{row}'].style = 'ma_combined'
+        write_cell(ws, f'B{row}', 'Pro Forma EPS', style='ma_combined')
         for i in range(years):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IFERROR({col}{pf_ni_row}/{col}{pf_shares_row},0)'
             ws[f'{col}{row}'].number_format = self.FORMATS['eps']
-            ws[f'{col}{row}'].font = Font(bold=True)
+            ws[f'{col}{row}'].font = BOLD_FONT
         
         add_named_range(self.wb, 'pf_eps_y1', "ProForma!$C$" + str(row))
         
@@ -652,14 +625,13 @@ class MAModelGenerator:
         row = 4
         
         ws[f'B{row}'] = 'EPS Impact Analysis'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         ws[f'B{row}'] = 'Year'
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'Year {i+1}'
-            ws[f'{col}{row}'].style = 'ma_header'
+            write_cell(ws, f'{col}{row}', f'Year {i+1}', style='ma_header')
         row += 1
         
         # Standalone Acquirer EPS (growing)
@@ -667,8 +639,7 @@ class MAModelGenerator:
         acq_base_eps = self.acquirer.get('net_income', 1000) / self.acquirer.get('shares_outstanding', 500)
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'={acq_base_eps}*(1+acq_growth)^{i+1}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['eps']
+            write_cell(ws, f'{col}{row}', f'={acq_base_eps}*(1+acq_growth)^{i+1}', number_format=self.FORMATS['eps'])
         standalone_eps_row = row
         row += 1
         
@@ -676,37 +647,34 @@ class MAModelGenerator:
         ws[f'B{row}'] = 'Pro Forma EPS'
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=ProForma!{col}$27'  # Reference to PF EPS
-            ws[f'{col}{row}'].number_format = self.FORMATS['eps']
+            write_cell(ws, f'{col}{row}', f'=ProForma!{col}$27', number_format=self.FORMATS['eps'])  # Reference to PF EPS
         pf_eps_row = row
         row += 2
         
         # Accretion/(Dilution) $
         ws[f'B{row}'] = 'Accretion / (Dilution) $'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'={col}{pf_eps_row}-{col}{standalone_eps_row}'
-            ws[f'{col}{row}'].number_format = self.FORMATS['eps']
+            write_cell(ws, f'{col}{row}', f'={col}{pf_eps_row}-{col}{standalone_eps_row}', number_format=self.FORMATS['eps'])
         acc_dil_row = row
         row += 1
         
         # Accretion/(Dilution) %
         ws[f'B{row}'] = 'Accretion / (Dilution) %'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(years):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'=IFERROR({col}{acc_dil_row}/{col}{standalone_eps_row},0)'
-            ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+            write_cell(ws, f'{col}{row}', f'=IFERROR({col}{acc_dil_row}/{col}{standalone_eps_row},0)', number_format=self.FORMATS['percent'])
         row += 1
         
         # Accretive/Dilutive Label
         ws[f'B{row}'] = 'Impact'
-        ws[f'B{row}'].font = Font(bold=True)
+        ws[f'B{row}'].font = BOLD_FONT
         for i in range(years):
             col = get_column_letter(3 + i)
             ws[f'{col}{row}'] = f'=IF({col}{acc_dil_row}>0,"ACCRETIVE","DILUTIVE")'
-            ws[f'{col}{row}'].font = Font(bold=True)
+            ws[f'{col}{row}'].font = BOLD_FONT
         
         ws.column_dimensions['B'].width = 28
         for i in range(years + 1):
@@ -718,7 +686,7 @@ class MAModelGenerator:
         
         row = 4
         ws[f'B{row}'] = 'Synergy Summary'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         synergies = [
@@ -738,8 +706,7 @@ class MAModelGenerator:
         for category, ref, items in synergies:
             ws[f'B{row}'] = category
             ws[f'B{row}'].font = Font(bold=True, color='1F4E79')
-            ws[f'D{row}'] = f'={ref}'
-            ws[f'D{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'D{row}', f'={ref}', number_format=self.FORMATS['currency'])
             row += 1
             
             for item in items:
@@ -751,7 +718,7 @@ class MAModelGenerator:
         # Phase-in schedule
         row += 1
         ws[f'B{row}'] = 'Synergy Realization Schedule'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 1
         
         ws[f'B{row}'] = 'Year'
@@ -764,12 +731,9 @@ class MAModelGenerator:
         
         for year in range(1, 4):
             ws[f'B{row}'] = f'Year {year}'
-            ws[f'C{row}'] = f'=phase_y{year}'
-            ws[f'C{row}'].number_format = self.FORMATS['percent']
-            ws[f'D{row}'] = f'=rev_synergies*phase_y{year}'
-            ws[f'D{row}'].number_format = self.FORMATS['currency']
-            ws[f'E{row}'] = f'=cost_synergies*phase_y{year}'
-            ws[f'E{row}'].number_format = self.FORMATS['currency']
+            write_cell(ws, f'C{row}', f'=phase_y{year}', number_format=self.FORMATS['percent'])
+            write_cell(ws, f'D{row}', f'=rev_synergies*phase_y{year}', number_format=self.FORMATS['currency'])
+            write_cell(ws, f'E{row}', f'=cost_synergies*phase_y{year}', number_format=self.FORMATS['currency'])
             row += 1
         
         ws.column_dimensions['B'].width = 18
@@ -783,7 +747,7 @@ class MAModelGenerator:
         
         row = 4
         ws[f'B{row}'] = 'Year 1 Accretion/(Dilution) Sensitivity'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 2
         
         # Premium vs Stock %
@@ -794,14 +758,13 @@ class MAModelGenerator:
         # Column headers (stock %)
         for i, stock in enumerate(stock_pcts):
             col = get_column_letter(3 + i)
-            ws[f'{col}{row}'] = f'{stock*100:.0f}% Stock'
-            ws[f'{col}{row}'].style = 'ma_header'
+            write_cell(ws, f'{col}{row}', f'{stock*100:.0f}% Stock', style='ma_header')
         row += 1
         
         # Row headers (premium) and values
         for prem in premiums:
             ws[f'B{row}'] = f'{prem*100:.0f}% Premium'
-            ws[f'B{row}'].font = Font(bold=True)
+            ws[f'B{row}'].font = BOLD_FONT
             
             for i, stock in enumerate(stock_pcts):
                 col = get_column_letter(3 + i)
@@ -810,22 +773,20 @@ class MAModelGenerator:
                 base_impact = 0.05  # Base accretion
                 prem_impact = -prem * 0.3  # Premium effect
                 stock_impact = -stock * 0.1  # Stock dilution effect
-                ws[f'{col}{row}'] = base_impact + prem_impact + stock_impact
-                ws[f'{col}{row}'].number_format = self.FORMATS['percent']
+                write_cell(ws, f'{col}{row}', base_impact + prem_impact + stock_impact, number_format=self.FORMATS['percent'])
             row += 1
         
         row += 3
         
         # Synergy sensitivity
         ws[f'B{row}'] = 'Breakeven Synergies Required'
-        ws[f'B{row}'].font = Font(bold=True, size=11, color='1F4E79')
+        ws[f'B{row}'].font = SECTION_FONT
         row += 2
         
         ws[f'B{row}'] = 'For deal to be EPS neutral in Year 1:'
         row += 1
         ws[f'B{row}'] = 'Required Cost Synergies'
-        ws[f'C{row}'] = '=MAX(0,acq_ni*0.05)'  # Simplified breakeven
-        ws[f'C{row}'].number_format = self.FORMATS['currency']
+        write_cell(ws, f'C{row}', '=MAX(0,acq_ni*0.05)', number_format=self.FORMATS['currency'])  # Simplified breakeven
         
         ws.column_dimensions['B'].width = 20
         for i in range(5):
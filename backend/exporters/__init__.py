@@ -1,3 +1,12 @@
 """Exporters package for AI Financial Modeler"""
-from . import pdf_exporter
-from . import pptx_exporter
+import importlib
+
+_SUBMODULES = ("pdf_exporter", "pptx_exporter")
+
+
+def __getattr__(name):
+    # Load each exporter on first access so importing one doesn't pull in the
+    # other's dependencies (reportlab / python-pptx)
+    if name in _SUBMODULES:
+        return importlib.import_module(f".{name}", __name__)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
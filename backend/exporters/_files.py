@@ -0,0 +1,31 @@
+"""File helpers shared by the exporters"""
+
+import os
+import tempfile
+
+# NamedTemporaryFile creates files as 0600; exports get the mode a plain
+# open() would give them instead. Read once, since os.umask can only be
+# queried by setting it.
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+_FILE_MODE = 0o666 & ~_UMASK
+
+
+def write_file_atomic(path: str, data) -> None:
+    """
+    Write bytes to path through a uniquely named temp file in the same
+    directory, then swap it into place. Concurrent writers never share a
+    temp file, and a failed write leaves nothing behind.
+    """
+    tmp = tempfile.NamedTemporaryFile(dir=os.path.dirname(path) or ".", suffix=".tmp", delete=False)
+    try:
+        with tmp:
+            tmp.write(data)
+        os.chmod(tmp.name, _FILE_MODE)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
@@ -5,9 +5,12 @@ Generates PDF summary reports from financial models
 
 import os
 import logging
+from io import BytesIO
 from typing import Dict, Any, Optional
 from datetime import datetime
 
+from ._files import write_file_atomic
+
 logger = logging.getLogger(__name__)
 
 # Try to import reportlab
@@ -51,8 +54,9 @@ def generate_pdf_report(
         return False
     
     try:
+        buffer = BytesIO()
         doc = SimpleDocTemplate(
-            output_path,
+            buffer,
             pagesize=A4,
             rightMargin=72,
             leftMargin=72,
@@ -209,8 +213,9 @@ def generate_pdf_report(
             footer_style
         ))
         
-        # Build PDF
+        # Build the PDF in memory, then write the file in one go and swap it into place
         doc.build(story)
+        write_file_atomic(output_path, buffer.getbuffer())
         
         logger.info(f"PDF report generated: {output_path}")
         return True
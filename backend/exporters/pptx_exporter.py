@@ -4,7 +4,12 @@ Generates investor pitch deck presentations
 """
 
 import os
+import re
+import copy
 import logging
+import pkgutil
+from io import BytesIO
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
 from datetime import datetime
 
@@ -16,8 +21,13 @@ from pptx.util import Inches, Pt
 from pptx.dml.color import RGBColor
 from pptx.enum.text import PP_ALIGN, MSO_ANCHOR
 from pptx.enum.shapes import MSO_SHAPE
+from pptx.oxml import parse_xml
+from pptx.oxml.ns import qn, nsdecls
+from lxml.etree import SubElement
 PPTX_AVAILABLE = True
 
+from ._files import write_file_atomic
+
 # Color scheme
 COLORS = {
     'primary': RGBColor(0x1a, 0x36, 0x5d),  # Dark blue
@@ -28,6 +38,102 @@ COLORS = {
     'white': RGBColor(0xff, 0xff, 0xff),
 }
 
+# Layout dimensions, converted to EMU once
+_IN_0 = Inches(0)
+_IN_0_2 = Inches(0.2)
+_IN_0_3 = Inches(0.3)
+_IN_0_4 = Inches(0.4)
+_IN_0_5 = Inches(0.5)
+_IN_0_7 = Inches(0.7)
+_IN_0_8 = Inches(0.8)
+_IN_1 = Inches(1)
+_IN_1_2 = Inches(1.2)
+_IN_1_5 = Inches(1.5)
+_IN_1_8 = Inches(1.8)
+_IN_2 = Inches(2)
+_IN_2_5 = Inches(2.5)
+_IN_2_8 = Inches(2.8)
+_IN_3_8 = Inches(3.8)
+_IN_4 = Inches(4)
+_IN_4_2 = Inches(4.2)
+_IN_5 = Inches(5)
+_IN_6_5 = Inches(6.5)
+_IN_7 = Inches(7)
+_IN_7_5 = Inches(7.5)
+_IN_10 = Inches(10)
+_IN_11 = Inches(11)
+_IN_11_333 = Inches(11.333)
+_IN_11_733 = Inches(11.733)
+_IN_12_333 = Inches(12.333)
+_IN_13_333 = Inches(13.333)
+
+# Font sizes
+_PT_12 = Pt(12)
+_PT_14 = Pt(14)
+_PT_16 = Pt(16)
+_PT_24 = Pt(24)
+_PT_32 = Pt(32)
+_PT_54 = Pt(54)
+
+# Assumptions sheet label keyword -> assumptions key
+_ASSUMPTION_KEYWORDS = {
+    'ebitda margin': 'ebitda_margin',
+    'terminal growth': 'terminal_growth',
+    'risk-free rate': 'risk_free_rate',
+    'equity risk premium': 'equity_risk_premium',
+    'beta': 'beta',
+    'tax rate': 'tax_rate',
+    'revenue growth': 'revenue_growth',
+    'capex % of revenue': 'capex_ratio',
+}
+_ASSUMPTION_RE = re.compile('|'.join(re.escape(k) for k in _ASSUMPTION_KEYWORDS))
+
+# Labels whose values are entered as percentages
+_PERCENT_LABEL_RE = re.compile(r'rate|growth|margin|premium|capex')
+
+
+# Summary slide metric box: rounded rectangle holding a label and a value paragraph
+_METRIC_BOX_WIDTH = _IN_2_8
+_METRIC_BOX_XML = (
+    f'<p:sp {nsdecls("p", "a")}>'
+    '<p:nvSpPr><p:cNvPr id="0" name="Metric"/><p:cNvSpPr/><p:nvPr/></p:nvSpPr>'
+    '<p:spPr>'
+    f'<a:xfrm><a:off x="0" y="0"/><a:ext cx="{_METRIC_BOX_WIDTH}" cy="{_IN_1_5}"/></a:xfrm>'
+    '<a:prstGeom prst="roundRect"><a:avLst/></a:prstGeom>'
+    '<a:solidFill><a:srgbClr val="000000"/></a:solidFill>'
+    '<a:ln><a:noFill/></a:ln>'
+    '</p:spPr>'
+    '<p:txBody><a:bodyPr anchor="ctr"/><a:lstStyle/>'
+    f'<a:p><a:pPr algn="ctr"/><a:r><a:rPr lang="en-US" sz="{_PT_12.centipoints}">'
+    f'<a:solidFill><a:srgbClr val="{COLORS["white"]}"/></a:solidFill></a:rPr><a:t/></a:r></a:p>'
+    f'<a:p><a:pPr algn="ctr"/><a:r><a:rPr lang="en-US" sz="{_PT_24.centipoints}" b="1">'
+    f'<a:solidFill><a:srgbClr val="{COLORS["white"]}"/></a:solidFill></a:rPr><a:t/></a:r></a:p>'
+    '</p:txBody>'
+    '</p:sp>'
+)
+
+
+@lru_cache(maxsize=1)
+def _metric_box_template():
+    """Parse the metric box XML once; callers deepcopy it per box"""
+    return parse_xml(_METRIC_BOX_XML)
+
+
+def _fmt_cr(value) -> str:
+    """Format an amount in Crores for display"""
+    return f"₹{value:,.0f} Cr"
+
+
+@lru_cache(maxsize=1)
+def _month_label(year: int, month: int) -> str:
+    """Title slide date, formatted once per calendar month"""
+    return datetime(year, month, 1).strftime("%B %Y")
+
+
+@lru_cache(maxsize=1)
+def _default_template_bytes() -> bytes:
+    """Read the bundled python-pptx default template once per process"""
+    return pkgutil.get_data('pptx', 'templates/default.pptx')
 
 
 def generate_pptx_report(
@@ -59,31 +165,34 @@ def generate_pptx_report(
         return False
     
     try:
-        prs = Presentation()
-        prs.slide_width = Inches(13.333)
-        prs.slide_height = Inches(7.5)
+        prs = Presentation(BytesIO(_default_template_bytes()))
+        prs.slide_width = _IN_13_333
+        prs.slide_height = _IN_7_5
+        blank_layout = prs.slide_layouts[6]  # Blank layout
         
         # Slide 1: Title
-        _add_title_slide(prs, company_name, industry)
+        _add_title_slide(prs, blank_layout, company_name, industry)
         
         # Slide 2: Executive Summary
-        _add_summary_slide(prs, company_name, valuation_data, commentary)
+        _add_summary_slide(prs, blank_layout, company_name, valuation_data, commentary)
         
         # Slide 3: Valuation Overview
-        _add_valuation_slide(prs, valuation_data)
+        _add_valuation_slide(prs, blank_layout, valuation_data)
         
         # Slide 4: Key Assumptions
-        _add_assumptions_slide(prs, assumptions)
+        _add_assumptions_slide(prs, blank_layout, assumptions)
         
         # Slide 5: Investment Thesis (if commentary available)
         if commentary:
-            _add_thesis_slide(prs, commentary)
+            _add_thesis_slide(prs, blank_layout, commentary)
         
         # Slide 6: Disclaimer
-        _add_disclaimer_slide(prs)
+        _add_disclaimer_slide(prs, blank_layout)
         
-        # Save presentation
-        prs.save(output_path)
+        # Serialize in memory, then write the file in one go and swap it into place
+        buffer = BytesIO()
+        prs.save(buffer)
+        write_file_atomic(output_path, buffer.getbuffer())
         
         logger.info(f"PowerPoint presentation generated: {output_path}")
         return True
@@ -93,15 +202,14 @@ def generate_pptx_report(
         return False
 
 
-def _add_title_slide(prs: 'Presentation', company_name: str, industry: str):
+def _add_title_slide(prs: 'Presentation', blank_layout, company_name: str, industry: str):
     """Add title slide"""
-    blank_layout = prs.slide_layouts[6]  # Blank layout
     slide = prs.slides.add_slide(blank_layout)
     
     # Background
     background = slide.shapes.add_shape(
         MSO_SHAPE.RECTANGLE,
-        Inches(0), Inches(0),
+        _IN_0, _IN_0,
         prs.slide_width, prs.slide_height
     )
     background.fill.solid()
@@ -110,45 +218,45 @@ def _add_title_slide(prs: 'Presentation', company_name: str, industry: str):
     
     # Company name
     title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(2.5),
-        Inches(12.333), Inches(1.5)
+        _IN_0_5, _IN_2_5,
+        _IN_12_333, _IN_1_5
     )
     title_frame = title_box.text_frame
     title_para = title_frame.paragraphs[0]
     title_para.text = company_name
-    title_para.font.size = Pt(54)
+    title_para.font.size = _PT_54
     title_para.font.bold = True
     title_para.font.color.rgb = COLORS['white']
     title_para.alignment = PP_ALIGN.CENTER
     
     # Subtitle
     subtitle_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(4.2),
-        Inches(12.333), Inches(0.8)
+        _IN_0_5, _IN_4_2,
+        _IN_12_333, _IN_0_8
     )
     subtitle_frame = subtitle_box.text_frame
     subtitle_para = subtitle_frame.paragraphs[0]
     subtitle_para.text = f"Financial Model & Valuation | {industry.title()}"
-    subtitle_para.font.size = Pt(24)
+    subtitle_para.font.size = _PT_24
     subtitle_para.font.color.rgb = COLORS['light']
     subtitle_para.alignment = PP_ALIGN.CENTER
     
     # Date
     date_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(6.5),
-        Inches(12.333), Inches(0.5)
+        _IN_0_5, _IN_6_5,
+        _IN_12_333, _IN_0_5
     )
     date_frame = date_box.text_frame
     date_para = date_frame.paragraphs[0]
-    date_para.text = datetime.now().strftime("%B %Y")
-    date_para.font.size = Pt(16)
+    today = datetime.now()
+    date_para.text = _month_label(today.year, today.month)
+    date_para.font.size = _PT_16
     date_para.font.color.rgb = COLORS['light']
     date_para.alignment = PP_ALIGN.CENTER
 
 
-def _add_summary_slide(prs: 'Presentation', company_name: str, valuation_data: Dict, commentary: Optional[Dict]):
+def _add_summary_slide(prs: 'Presentation', blank_layout, company_name: str, valuation_data: Dict, commentary: Optional[Dict]):
     """Add executive summary slide"""
-    blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
     
     # Title
@@ -156,51 +264,23 @@ def _add_summary_slide(prs: 'Presentation', company_name: str, valuation_data: D
     
     # Key metrics boxes
     metrics = [
-        ("Enterprise Value", f"₹{valuation_data.get('enterprise_value', 0):,.0f} Cr", COLORS['primary']),
-        ("Equity Value", f"₹{valuation_data.get('equity_value', 0):,.0f} Cr", COLORS['secondary']),
+        ("Enterprise Value", _fmt_cr(valuation_data.get('enterprise_value', 0)), COLORS['primary']),
+        ("Equity Value", _fmt_cr(valuation_data.get('equity_value', 0)), COLORS['secondary']),
         ("Share Price", f"₹{valuation_data.get('share_price', 0):,.2f}", COLORS['accent']),
         ("WACC", f"{valuation_data.get('wacc', 0) * 100:.1f}%", COLORS['primary']),
     ]
     
-    box_width = Inches(2.8)
-    box_height = Inches(1.5)
-    start_x = Inches(0.8)
-    y = Inches(1.8)
-    gap = Inches(0.3)
+    start_x = _IN_0_8
+    step = _METRIC_BOX_WIDTH + _IN_0_3
     
     for i, (label, value, color) in enumerate(metrics):
-        x = start_x + (i * (box_width + gap))
-        
-        # Box background
-        box = slide.shapes.add_shape(MSO_SHAPE.ROUNDED_RECTANGLE, x, y, box_width, box_height)
-        box.fill.solid()
-        box.fill.fore_color.rgb = color
-        box.line.fill.background()
-        
-        # Label
-        label_box = slide.shapes.add_textbox(x, y + Inches(0.2), box_width, Inches(0.4))
-        label_frame = label_box.text_frame
-        label_para = label_frame.paragraphs[0]
-        label_para.text = label
-        label_para.font.size = Pt(12)
-        label_para.font.color.rgb = COLORS['white']
-        label_para.alignment = PP_ALIGN.CENTER
-        
-        # Value
-        value_box = slide.shapes.add_textbox(x, y + Inches(0.6), box_width, Inches(0.7))
-        value_frame = value_box.text_frame
-        value_para = value_frame.paragraphs[0]
-        value_para.text = value
-        value_para.font.size = Pt(24)
-        value_para.font.bold = True
-        value_para.font.color.rgb = COLORS['white']
-        value_para.alignment = PP_ALIGN.CENTER
+        _add_metric_box(slide, start_x + i * step, _IN_1_8, label, value, color)
     
     # Commentary section
     if commentary and commentary.get('investment_thesis'):
         thesis_box = slide.shapes.add_textbox(
-            Inches(0.8), Inches(3.8),
-            Inches(11.733), Inches(2.5)
+            _IN_0_8, _IN_3_8,
+            _IN_11_733, _IN_2_5
         )
         thesis_frame = thesis_box.text_frame
         thesis_frame.word_wrap = True
@@ -208,60 +288,63 @@ def _add_summary_slide(prs: 'Presentation', company_name: str, valuation_data: D
         # Thesis header
         p1 = thesis_frame.paragraphs[0]
         p1.text = "Investment Thesis"
-        p1.font.size = Pt(16)
+        p1.font.size = _PT_16
         p1.font.bold = True
         p1.font.color.rgb = COLORS['primary']
         
         # Thesis content
         p2 = thesis_frame.add_paragraph()
         p2.text = commentary.get('investment_thesis', '')
-        p2.font.size = Pt(14)
+        p2.font.size = _PT_14
         p2.font.color.rgb = COLORS['text']
-        p2.space_before = Pt(12)
+        p2.space_before = _PT_12
+
+
+def _add_metric_box(slide, x, y, label, value, color):
+    """Clone the metric box template onto the slide at (x, y)"""
+    sp = copy.deepcopy(_metric_box_template())
+    
+    c_nv_pr = sp.find(qn('p:nvSpPr')).find(qn('p:cNvPr'))
+    shape_id = slide.shapes._next_shape_id
+    c_nv_pr.set('id', str(shape_id))
+    c_nv_pr.set('name', f"Metric {shape_id}")
+    
+    sp_pr = sp.find(qn('p:spPr'))
+    offset = sp_pr.find(qn('a:xfrm')).find(qn('a:off'))
+    offset.set('x', str(x))
+    offset.set('y', str(y))
+    sp_pr.find(qn('a:solidFill')).find(qn('a:srgbClr')).set('val', str(color))
+    
+    label_text, value_text = sp.iter(qn('a:t'))
+    label_text.text = label
+    value_text.text = value
+    
+    slide.shapes._spTree.insert_element_before(sp, 'p:extLst')
 
 
-def _add_valuation_slide(prs: 'Presentation', valuation_data: Dict):
+def _add_valuation_slide(prs: 'Presentation', blank_layout, valuation_data: Dict):
     """Add valuation details slide"""
-    blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
     
     _add_slide_title(slide, "DCF Valuation")
     
-    # Valuation waterfall description
+    # Valuation waterfall description, formatted up front
     items = [
-        ("PV of Forecast Cash Flows", valuation_data.get('pv_fcf', 0)),
-        ("PV of Terminal Value", valuation_data.get('pv_terminal', 0)),
-        ("Enterprise Value", valuation_data.get('enterprise_value', 0)),
-        ("Less: Net Debt", valuation_data.get('net_debt', 0)),
-        ("Equity Value", valuation_data.get('equity_value', 0)),
+        ("PV of Forecast Cash Flows", _fmt_cr(valuation_data.get('pv_fcf', 0))),
+        ("PV of Terminal Value", _fmt_cr(valuation_data.get('pv_terminal', 0))),
+        ("Enterprise Value", _fmt_cr(valuation_data.get('enterprise_value', 0))),
+        ("Less: Net Debt", _fmt_cr(valuation_data.get('net_debt', 0))),
+        ("Equity Value", _fmt_cr(valuation_data.get('equity_value', 0))),
     ]
     
-    y = Inches(2)
+    y = _IN_2
     for label, value in items:
-        # Label
-        label_box = slide.shapes.add_textbox(Inches(1), y, Inches(5), Inches(0.5))
-        label_frame = label_box.text_frame
-        label_para = label_frame.paragraphs[0]
-        label_para.text = label
-        label_para.font.size = Pt(16)
-        label_para.font.color.rgb = COLORS['text']
-        
-        # Value
-        value_box = slide.shapes.add_textbox(Inches(7), y, Inches(4), Inches(0.5))
-        value_frame = value_box.text_frame
-        value_para = value_frame.paragraphs[0]
-        value_para.text = f"₹{value:,.0f} Cr"
-        value_para.font.size = Pt(16)
-        value_para.font.bold = True
-        value_para.font.color.rgb = COLORS['primary']
-        value_para.alignment = PP_ALIGN.RIGHT
-        
-        y += Inches(0.7)
+        _add_label_value_row(slide, _IN_1, y, _IN_10, label, value, _PT_16, COLORS['primary'])
+        y += _IN_0_7
 
 
-def _add_assumptions_slide(prs: 'Presentation', assumptions: Dict):
+def _add_assumptions_slide(prs: 'Presentation', blank_layout, assumptions: Dict):
     """Add key assumptions slide"""
-    blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
     
     _add_slide_title(slide, "Key Assumptions")
@@ -282,47 +365,53 @@ def _add_assumptions_slide(prs: 'Presentation', assumptions: Dict):
     ]
     
     # Left column
-    y = Inches(2)
+    y = _IN_2
     for label, value in left_items:
-        _add_assumption_row(slide, Inches(1), y, label, value)
-        y += Inches(0.8)
+        _add_assumption_row(slide, _IN_1, y, label, value)
+        y += _IN_0_8
     
     # Right column
-    y = Inches(2)
+    y = _IN_2
     for label, value in right_items:
-        _add_assumption_row(slide, Inches(7), y, label, value)
-        y += Inches(0.8)
+        _add_assumption_row(slide, _IN_7, y, label, value)
+        y += _IN_0_8
 
 
 def _add_assumption_row(slide, x, y, label, value):
     """Helper to add assumption row"""
-    # Label
-    label_box = slide.shapes.add_textbox(x, y, Inches(3.5), Inches(0.5))
-    label_frame = label_box.text_frame
-    label_para = label_frame.paragraphs[0]
-    label_para.text = label
-    label_para.font.size = Pt(14)
-    label_para.font.color.rgb = COLORS['text']
-    
-    # Value
-    value_box = slide.shapes.add_textbox(x + Inches(3.5), y, Inches(1.5), Inches(0.5))
-    value_frame = value_box.text_frame
-    value_para = value_frame.paragraphs[0]
-    value_para.text = value
-    value_para.font.size = Pt(14)
-    value_para.font.bold = True
-    value_para.font.color.rgb = COLORS['secondary']
-    value_para.alignment = PP_ALIGN.RIGHT
-
-
-def _add_thesis_slide(prs: 'Presentation', commentary: Dict):
+    _add_label_value_row(slide, x, y, _IN_5, label, value, _PT_14, COLORS['secondary'])
+
+
+def _add_label_value_row(slide, x, y, width, label, value, font_size, value_color):
+    """Add a label and a right-aligned bold value on one line of a single textbox"""
+    text_box = slide.shapes.add_textbox(x, y, width, _IN_0_5)
+    para = text_box.text_frame.paragraphs[0]
+    
+    # Right-aligned tab stop at the inner right edge (textboxes inset 0.1" per side)
+    tab_list = SubElement(para._p.get_or_add_pPr(), qn('a:tabLst'))
+    tab = SubElement(tab_list, qn('a:tab'))
+    tab.set('pos', str(width - _IN_0_2))
+    tab.set('algn', 'r')
+    
+    label_run = para.add_run()
+    label_run.text = label
+    label_run.font.size = font_size
+    label_run.font.color.rgb = COLORS['text']
+    
+    value_run = para.add_run()
+    value_run.text = f"\t{value}"
+    value_run.font.size = font_size
+    value_run.font.bold = True
+    value_run.font.color.rgb = value_color
+
+
+def _add_thesis_slide(prs: 'Presentation', blank_layout, commentary: Dict):
     """Add investment thesis slide"""
-    blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
     
     _add_slide_title(slide, "Investment Analysis")
     
-    y = Inches(1.8)
+    y = _IN_1_8
     
     sections = [
         ("Investment Thesis", commentary.get('investment_thesis', '')),
@@ -335,29 +424,28 @@ def _add_thesis_slide(prs: 'Presentation', commentary: Dict):
             continue
         
         # Section title
-        title_box = slide.shapes.add_textbox(Inches(1), y, Inches(11), Inches(0.4))
+        title_box = slide.shapes.add_textbox(_IN_1, y, _IN_11, _IN_0_4)
         title_frame = title_box.text_frame
         title_para = title_frame.paragraphs[0]
         title_para.text = title
-        title_para.font.size = Pt(14)
+        title_para.font.size = _PT_14
         title_para.font.bold = True
         title_para.font.color.rgb = COLORS['primary']
-        y += Inches(0.5)
+        y += _IN_0_5
         
         # Content
-        content_box = slide.shapes.add_textbox(Inches(1), y, Inches(11), Inches(1))
+        content_box = slide.shapes.add_textbox(_IN_1, y, _IN_11, _IN_1)
         content_frame = content_box.text_frame
         content_frame.word_wrap = True
         content_para = content_frame.paragraphs[0]
         content_para.text = content
-        content_para.font.size = Pt(12)
+        content_para.font.size = _PT_12
         content_para.font.color.rgb = COLORS['text']
-        y += Inches(1.2)
+        y += _IN_1_2
 
 
-def _add_disclaimer_slide(prs: 'Presentation'):
+def _add_disclaimer_slide(prs: 'Presentation', blank_layout):
     """Add disclaimer slide"""
-    blank_layout = prs.slide_layouts[6]
     slide = prs.slides.add_slide(blank_layout)
     
     _add_slide_title(slide, "Disclaimer")
@@ -371,28 +459,33 @@ Investors should conduct their own independent analysis and consult with profess
 Generated by AI Financial Modeler"""
     
     text_box = slide.shapes.add_textbox(
-        Inches(1), Inches(2),
-        Inches(11.333), Inches(4)
+        _IN_1, _IN_2,
+        _IN_11_333, _IN_4
     )
-    text_frame = text_box.textframe
+    text_frame = text_box.text_frame
     text_frame.word_wrap = True
-    para = text_frame.paragraphs[0]
-    para.text = disclaimer_text
-    para.font.size = Pt(12)
-    para.font.color.rgb = COLORS['text']
-    para.line_spacing = 1.5
+    
+    # One paragraph per block of text, spaced apart in place of the blank lines
+    for i, block in enumerate(disclaimer_text.split("\n\n")):
+        para = text_frame.paragraphs[0] if i == 0 else text_frame.add_paragraph()
+        para.text = block
+        para.font.size = _PT_12
+        para.font.color.rgb = COLORS['text']
+        para.line_spacing = 1.5
+        if i:
+            para.space_before = _PT_12
 
 
 def _add_slide_title(slide, title_text: str):
     """Add title to slide"""
     title_box = slide.shapes.add_textbox(
-        Inches(0.5), Inches(0.5),
-        Inches(12.333), Inches(0.8)
+        _IN_0_5, _IN_0_5,
+        _IN_12_333, _IN_0_8
     )
     title_frame = title_box.text_frame
     title_para = title_frame.paragraphs[0]
     title_para.text = title_text
-    title_para.font.size = Pt(32)
+    title_para.font.size = _PT_32
     title_para.font.bold = True
     title_para.font.color.rgb = COLORS['primary']
 
@@ -416,105 +509,90 @@ def create_presentation(company_name: str, excel_path: str, output_path: str) ->
     try:
         import openpyxl
         
-        # Load the Excel workbook
-        wb = openpyxl.load_workbook(excel_path)
-        
-        # Extract industry from Summary sheet (Row 8, Column 3)
-        industry = "General"
-        if "Summary" in wb.sheetnames:
-            summary = wb["Summary"]
-            industry_cell = summary.cell(8, 3).value
-            if industry_cell:
-                industry = str(industry_cell)
-        
-        # Extract valuation data from Valuation sheet
-        valuation_data = {
-            'enterprise_value': 0,
-            'equity_value': 0,
-            'share_price': 0,
-            'wacc': 0.10,
-            'pv_fcf': 0,
-            'pv_terminal': 0,
-            'net_debt': 0,
-        }
-        
-        if "Valuation" in wb.sheetnames:
-            val_sheet = wb["Valuation"]
-            try:
-                # Read specific cells
-                wacc_val = val_sheet.cell(19, 3).value
-                if wacc_val and isinstance(wacc_val, (int, float)):
-                    valuation_data['wacc'] = float(wacc_val) if wacc_val <= 1 else wacc_val / 100
-                
-                ev_val = val_sheet.cell(35, 3).value
-                if ev_val and isinstance(ev_val, (int, float)):
-                    valuation_data['enterprise_value'] = float(ev_val)
-                
-                equity_val = val_sheet.cell(37, 3).value
-                if equity_val and isinstance(equity_val, (int, float)):
-                    valuation_data['equity_value'] = float(equity_val)
-                
-                price_val = val_sheet.cell(40, 3).value
-                if price_val and isinstance(price_val, (int, float)):
-                    valuation_data['share_price'] = float(price_val)
-                
-                # Try to get PV values if available (common locations)
-                pv_fcf = val_sheet.cell(33, 3).value
-                if pv_fcf and isinstance(pv_fcf, (int, float)):
-                    valuation_data['pv_fcf'] = float(pv_fcf)
-                
-                pv_term = val_sheet.cell(34, 3).value
-                if pv_term and isinstance(pv_term, (int, float)):
-                    valuation_data['pv_terminal'] = float(pv_term)
-            except Exception as e:
-                logger.warning(f"Error reading valuation data: {e}")
-        
-        # Extract assumptions from Assumptions sheet
-        assumptions = {
-            'revenue_growth': 0.10,
-            'ebitda_margin': 0.20,
-            'tax_rate': 0.25,
-            'terminal_growth': 0.03,
-            'risk_free_rate': 0.07,
-            'equity_risk_premium': 0.06,
-            'beta': 1.0,
-            'capex_ratio': 0.04,
-        }
-        
-        if "Assumptions" in wb.sheetnames:
-            assump_sheet = wb["Assumptions"]
-            try:
-                keyword_map = {
-                    'ebitda margin': 'ebitda_margin',
-                    'terminal growth': 'terminal_growth',
-                    'risk-free rate': 'risk_free_rate',
-                    'equity risk premium': 'equity_risk_premium',
-                    'beta': 'beta',
-                    'tax rate': 'tax_rate',
-                    'revenue growth': 'revenue_growth',
-                    'capex % of revenue': 'capex_ratio',
-                }
-                
-                for row in range(1, 41):
-                    label = assump_sheet.cell(row, 2).value
-                    if label and isinstance(label, str):
-                        label_lower = label.lower()
-                        value_cell = assump_sheet.cell(row, 3).value
-                        
-                        if value_cell and isinstance(value_cell, (int, float)):
-                            val = float(value_cell)
-                            # Convert percentages to decimals
-                            if val > 1 and any(x in label_lower for x in ["rate", "growth", "margin", "premium", "capex"]):
-                                val = val / 100
+        # Load the Excel workbook streaming, with cached values instead of formulas
+        wb = openpyxl.load_workbook(excel_path, read_only=True, data_only=True, keep_links=False)
+        try:
+            # Extract industry from Summary sheet (Row 8, Column 3)
+            industry = "General"
+            if "Summary" in wb.sheetnames:
+                summary = wb["Summary"]
+                industry_cell = summary.cell(8, 3).value
+                if industry_cell:
+                    industry = str(industry_cell)
+            
+            # Extract valuation data from Valuation sheet
+            valuation_data = {
+                'enterprise_value': 0,
+                'equity_value': 0,
+                'share_price': 0,
+                'wacc': 0.10,
+                'pv_fcf': 0,
+                'pv_terminal': 0,
+                'net_debt': 0,
+            }
+            
+            if "Valuation" in wb.sheetnames:
+                val_sheet = wb["Valuation"]
+                try:
+                    # Read column C of rows 19-40 in one pass, keyed by row number
+                    values = {
+                        row_num: row[0]
+                        for row_num, row in enumerate(
+                            val_sheet.iter_rows(min_row=19, max_row=40, min_col=3, max_col=3, values_only=True),
+                            start=19
+                        )
+                    }
+                    
+                    wacc_val = values.get(19)
+                    if wacc_val and isinstance(wacc_val, (int, float)):
+                        valuation_data['wacc'] = float(wacc_val) if wacc_val <= 1 else wacc_val / 100
+                    
+                    # PV rows (33, 34) are common locations and may be empty
+                    for key, row_num in (
+                        ('enterprise_value', 35),
+                        ('equity_value', 37),
+                        ('share_price', 40),
+                        ('pv_fcf', 33),
+                        ('pv_terminal', 34),
+                    ):
+                        cell_val = values.get(row_num)
+                        if cell_val and isinstance(cell_val, (int, float)):
+                            valuation_data[key] = float(cell_val)
+                except Exception as e:
+                    logger.warning(f"Error reading valuation data: {e}")
+            
+            # Extract assumptions from Assumptions sheet
+            assumptions = {
+                'revenue_growth': 0.10,
+                'ebitda_margin': 0.20,
+                'tax_rate': 0.25,
+                'terminal_growth': 0.03,
+                'risk_free_rate': 0.07,
+                'equity_risk_premium': 0.06,
+                'beta': 1.0,
+                'capex_ratio': 0.04,
+            }
+            
+            if "Assumptions" in wb.sheetnames:
+                assump_sheet = wb["Assumptions"]
+                try:
+                    for label, value_cell in assump_sheet.iter_rows(min_row=1, max_row=40, min_col=2, max_col=3, values_only=True):
+                        if label and isinstance(label, str):
+                            label_lower = label.lower()
                             
-                            for keyword, key in keyword_map.items():
-                                if keyword in label_lower:
-                                    assumptions[key] = val
-                                    break
-            except Exception as e:
-                logger.warning(f"Error reading assumptions: {e}")
-        
-        wb.close()
+                            if value_cell and isinstance(value_cell, (int, float)):
+                                val = float(value_cell)
+                                # Convert percentages to decimals
+                                if val > 1 and _PERCENT_LABEL_RE.search(label_lower):
+                                    val = val / 100
+                                
+                                match = _ASSUMPTION_RE.search(label_lower)
+                                if match:
+                                    assumptions[_ASSUMPTION_KEYWORDS[match.group(0)]] = val
+                except Exception as e:
+                    logger.warning(f"Error reading assumptions: {e}")
+        finally:
+            wb.close()
         
         # Generate the PowerPoint
         return generate_pptx_report(
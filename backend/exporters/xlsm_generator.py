@@ -4,16 +4,37 @@ Creates macro-enabled Excel files with embedded VBA modules
 """
 
 import os
+import re
 import shutil
 import logging
-from pathlib import Path
-from typing import Optional
+import zipfile
+from xml.sax.saxutils import escape as xml_escape
+from io import BytesIO
+from functools import lru_cache
+from pathlib import Path, PurePath
+from typing import Optional, BinaryIO
+
+from ._files import write_file_atomic
 
 logger = logging.getLogger(__name__)
 
-# VBA module code - embedded for standalone generation
-VBA_MODULES = {
-    "modAPI": '''
+# Try to import openpyxl for the setup sheet
+try:
+    from openpyxl import load_workbook
+    from openpyxl.styles import Font
+    OPENPYXL_AVAILABLE = True
+    
+    # Shared font instances for the setup sheet styles
+    _SETUP_FONTS = {
+        "title": Font(bold=True, size=16, color="1F4E79"),
+        "bold": Font(bold=True),
+    }
+except ImportError:
+    OPENPYXL_AVAILABLE = False
+
+# VBA module code - embedded for standalone generation, as the bytes written to .bas files
+VBA_MODULES_BYTES = {
+    "modAPI": b'''
 ' =============================================================
 ' Module: modAPI - API Integration Functions
 ' =============================================================
@@ -64,7 +85,7 @@ Public Sub RefreshStockData()
     Application.StatusBar = False
 End Sub
 ''',
-    "modCalc": '''
+    "modCalc": b'''
 ' =============================================================
 ' Module: modCalc - Financial Calculations
 ' =============================================================
@@ -99,7 +120,7 @@ Public Sub RecalculateModel()
     MsgBox "Model recalculated!", vbInformation
 End Sub
 ''',
-    "modDashboard": '''
+    "modDashboard": b'''
 ' =============================================================
 ' Module: modDashboard - Dashboard Controls
 ' =============================================================
@@ -131,7 +152,7 @@ Public Sub ExportToPDF()
     End If
 End Sub
 ''',
-    "modValidation": '''
+    "modValidation": b'''
 ' =============================================================
 ' Module: modValidation - Model Audit & Checks
 ' =============================================================
@@ -186,7 +207,7 @@ Public Sub HighlightInputs()
     MsgBox "Input cells highlighted in yellow", vbInformation
 End Sub
 ''',
-    "modScenario": '''
+    "modScenario": b'''
 ' =============================================================
 ' Module: modScenario - Scenario Management
 ' =============================================================
@@ -227,73 +248,337 @@ End Sub
 }
 
 
-def create_xlsm_with_vba(source_xlsx: str, output_xlsm: str) -> bool:
-    """
-    Convert an xlsx to xlsm with VBA modules embedded.
+def vba_source_text(module_name: str) -> str:
+    """Decoded VBA source of a module, for display"""
+    return VBA_MODULES_BYTES[module_name].decode("utf-8")
+
+
+# One-line description of each VBA module for the setup sheet
+_MODULE_DESCRIPTIONS = {
+    "modAPI": "API integration for live data",
+    "modCalc": "Financial calculation functions",
+    "modDashboard": "Dashboard controls and PDF export",
+    "modValidation": "Model audit and validation",
+    "modScenario": "Scenario management (Bull/Bear/Base)"
+}
+
+# Ready-to-write .bas file contents, keyed by module name
+_BAS_FILES = {
+    name: f'Attribute VB_Name = "{name}"\n'.encode("utf-8") + code
+    for name, code in VBA_MODULES_BYTES.items()
+}
+
+# README shipped inside the VBA modules zip
+_README_BYTES = """AI Financial Modeler - VBA Modules
+===================================
+
+To install these VBA modules in your Excel workbook:
+
+1. Open your Excel file
+2. Press Alt+F11 to open VBA Editor
+3. Right-click on VBAProject (your workbook name)
+4. Select Import File...
+5. Import each .bas file
+
+Modules included:
+- modAPI.bas: API integration for live stock data
+- modCalc.bas: Financial calculation functions (WACC, DCF, Terminal Value)
+- modDashboard.bas: Dashboard refresh and PDF export
+- modValidation.bas: Model audit and error checking
+- modScenario.bas: Bull/Bear/Base case scenario management
+
+After importing, you can:
+- Create buttons linked to the macros
+- Use the functions in formulas (e.g., =CalcWACC(...))
+- Run macros from Developer tab
+""".encode("utf-8")
+
+# (text, is_heading) rows for the quick actions block of the setup sheet
+_QUICK_ACTIONS = (
+    ("Quick Actions (after VBA is enabled):", True),
+    ("  • Run modAPI.RefreshStockData() - Refresh stock data from API", False),
+    ("  • Run modValidation.RunValidation() - Check model for errors", False),
+    ("  • Run modDashboard.UpdateDashboard() - Refresh dashboard", False),
+    ("  • Run modScenario.RunBullCase() - Apply bull case assumptions", False),
+)
+
+# (text, style) lines of the VBA Setup sheet, top to bottom; style is None,
+# "title" or "bold", and None text leaves a blank row
+_VBA_SETUP_LINES = (
+    ("VBA SETUP INSTRUCTIONS", "title"),
+    (None, None),
+    ("This workbook contains VBA automation modules.", None),
+    ("To enable VBA functionality:", None),
+    (None, None),
+    ("1. Save this file as .xlsm (Excel Macro-Enabled Workbook)", None),
+    ("2. Press Alt+F11 to open VBA Editor", None),
+    ("3. Right-click on VBAProject → Import File", None),
+    ("4. Import the .bas files from the 'vba_modules' folder", None),
+    ("5. Close VBA Editor and save", None),
+    (None, None),
+    ("VBA Modules Included:", "bold"),
+    *(
+        (f"  • {module_name}.bas - {_MODULE_DESCRIPTIONS.get(module_name, 'VBA module')}", None)
+        for module_name in VBA_MODULES_BYTES
+    ),
+    (None, None),
+    *((text, "bold" if is_heading else None) for text, is_heading in _QUICK_ACTIONS),
+)
+
+# (row, text, style) for each non-blank line, with row numbers fixed at import
+_VBA_SETUP_ROWS = tuple(
+    (row_num, text, style)
+    for row_num, (text, style) in enumerate(_VBA_SETUP_LINES, start=1)
+    if text is not None
+)
+
+# Inline rich-text run properties per style (child order follows the CT_RPrElt schema)
+_SETUP_RUN_PROPS = {
+    "title": '<rPr><b/><color rgb="FF1F4E79"/><sz val="16"/></rPr>',
+    "bold": '<rPr><b/></rPr>',
+}
+
+
+def _render_setup_sheet_xml() -> bytes:
+    """Render the VBA Setup rows as a standalone worksheet part using inline strings"""
+    rows = []
+    for row_num, text, style in _VBA_SETUP_ROWS:
+        run = f'<t xml:space="preserve">{xml_escape(text)}</t>'
+        if style is not None:
+            run = f'<r>{_SETUP_RUN_PROPS[style]}{run}</r>'
+        rows.append(f'<row r="{row_num}"><c r="A{row_num}" t="inlineStr"><is>{run}</is></c></row>')
     
-    Note: openpyxl cannot directly write VBA, so we use a workaround:
-    1. Copy the xlsx
-    2. Create VBA code as text files
-    3. For full VBA embedding, we would need xlwings or win32com
+    return (
+        '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+        '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+        '<cols><col min="1" max="1" width="80" customWidth="1"/></cols>'
+        f'<sheetData>{"".join(rows)}</sheetData>'
+        '</worksheet>'
+    ).encode("utf-8")
+
+
+_SETUP_SHEET_XML = _render_setup_sheet_xml()
+
+# Package parts touched when adding the setup sheet without openpyxl
+_WORKSHEET_TYPE = b"application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"
+_WORKSHEET_REL = b"http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet"
+_SETUP_SHEET_RID = b"rIdVbaSetup"
+
+_SHEET_ELEMENT_RE = re.compile(rb"<(?:\w+:)?sheet\b[^>]*/>")
+_SHEET_ID_RE = re.compile(rb'sheetId="(\d+)"')
+_LOCAL_SHEET_ID_RE = re.compile(rb'localSheetId="(\d+)"')
+_ACTIVE_TAB_RE = re.compile(rb'activeTab="(\d+)"')
+_WORKBOOK_VIEW_RE = re.compile(rb"<(?:\w+:)?workbookView\b")
+
+
+def _shift_index(match) -> bytes:
+    """Bump a sheet-position attribute by one for the sheet inserted in front"""
+    name, value = match.group(0).split(b"=")
+    return name + b'="' + str(int(value.strip(b'"')) + 1).encode() + b'"'
+
+
+def _add_setup_sheet(source_xlsx: str) -> Optional[bytes]:
+    """
+    Add the VBA Setup sheet as the first tab by editing the xlsx package
+    directly, without loading the workbook into openpyxl.
     
-    For cross-platform compatibility, we create a README with instructions.
+    Returns the new package bytes, or None if the workbook already has a
+    VBA Setup sheet or its sheet list isn't in the expected shape (the
+    openpyxl path handles both instead).
     """
-    try:
-        import openpyxl
-        from openpyxl import load_workbook
-        
-        # Load the source workbook
-        wb = load_workbook(source_xlsx)
+    with zipfile.ZipFile(source_xlsx) as src:
+        workbook_xml = src.read("xl/workbook.xml")
+        if b'name="VBA Setup"' in workbook_xml:
+            return None
         
-        # Add a VBA Instructions sheet
-        if "VBA Setup" in wb.sheetnames:
-            ws = wb["VBA Setup"]
-        else:
-            ws = wb.create_sheet("VBA Setup", 0)
+        names = set(src.namelist())
+        sheet_num = 1
+        while f"xl/worksheets/sheet{sheet_num}.xml" in names:
+            sheet_num += 1
+        sheet_part = f"worksheets/sheet{sheet_num}.xml".encode()
         
-        # Title and instructions
-        ws['A1'] = "VBA SETUP INSTRUCTIONS"
-        ws['A1'].font = openpyxl.styles.Font(bold=True, size=16, color="1F4E79")
+        # Clone the first <sheet> entry so namespace prefixes match the source
+        first_sheet = _SHEET_ELEMENT_RE.search(workbook_xml)
+        if first_sheet is None:
+            return None
+        sheet_id = max((int(x) for x in _SHEET_ID_RE.findall(workbook_xml)), default=0) + 1
+        new_sheet = re.sub(rb'\sname="[^"]*"', b' name="VBA Setup"', first_sheet.group(0))
+        new_sheet = _SHEET_ID_RE.sub(b'sheetId="' + str(sheet_id).encode() + b'"', new_sheet)
+        new_sheet = re.sub(rb'(\w+:id=)"[^"]*"', rb'\1"' + _SETUP_SHEET_RID + b'"', new_sheet)
+        new_sheet = re.sub(rb'\sstate="[^"]*"', b'', new_sheet)
         
-        ws['A3'] = "This workbook contains VBA automation modules."
-        ws['A4'] = "To enable VBA functionality:"
-        ws['A6'] = "1. Save this file as .xlsm (Excel Macro-Enabled Workbook)"
-        ws['A7'] = "2. Press Alt+F11 to open VBA Editor"
-        ws['A8'] = "3. Right-click on VBAProject → Import File"  
-        ws['A9'] = "4. Import the .bas files from the 'vba_modules' folder"
-        ws['A10'] = "5. Close VBA Editor and save"
+        # Sheet-position references move one place right; keep the old active tab
+        workbook_xml = _LOCAL_SHEET_ID_RE.sub(_shift_index, workbook_xml)
+        if _ACTIVE_TAB_RE.search(workbook_xml):
+            workbook_xml = _ACTIVE_TAB_RE.sub(_shift_index, workbook_xml, count=1)
+        else:
+            workbook_xml = _WORKBOOK_VIEW_RE.sub(lambda m: m.group(0) + b' activeTab="1"', workbook_xml, count=1)
         
-        ws['A12'] = "VBA Modules Included:"
-        ws['A12'].font = openpyxl.styles.Font(bold=True)
+        start = _SHEET_ELEMENT_RE.search(workbook_xml).start()
+        workbook_xml = workbook_xml[:start] + new_sheet + workbook_xml[start:]
         
-        row = 13
-        for module_name in VBA_MODULES.keys():
-            ws[f'A{row}'] = f"  • {module_name}.bas - {get_module_description(module_name)}"
-            row += 1
+        out = BytesIO()
+        with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as dst:
+            for info in src.infolist():
+                if info.filename == "xl/workbook.xml":
+                    data = workbook_xml
+                else:
+                    data = src.read(info.filename)
+                
+                if info.filename == "[Content_Types].xml":
+                    data = _TYPES_END_RE.sub(
+                        lambda m: b'<Override PartName="/xl/' + sheet_part
+                        + b'" ContentType="' + _WORKSHEET_TYPE + b'"/>' + m.group(0),
+                        data, count=1
+                    )
+                elif info.filename == "xl/_rels/workbook.xml.rels":
+                    data = _RELATIONSHIPS_END_RE.sub(
+                        lambda m: b'<Relationship Id="' + _SETUP_SHEET_RID + b'" Type="' + _WORKSHEET_REL
+                        + b'" Target="' + sheet_part + b'"/>' + m.group(0),
+                        data, count=1
+                    )
+                
+                dst.writestr(info, data)
+            
+            dst.writestr("xl/" + sheet_part.decode(), _SETUP_SHEET_XML)
+    
+    return out.getvalue()
+
+
+# Prebuilt VBA project holding the modules above. Build it once by importing the
+# .bas files into a macro-enabled workbook in Excel and copying xl/vbaProject.bin
+# out of the saved .xlsm (it is a zip); without it we fall back to the setup sheet.
+VBA_PROJECT_PATH = os.environ.get(
+    "VBA_PROJECT_BIN",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "vbaProject.bin")
+)
+
+# OOXML part types and relationship for a macro-enabled workbook
+_XLSX_MAIN_TYPE = b"application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"
+_XLSM_MAIN_TYPE = b"application/vnd.ms-excel.sheet.macroEnabled.main+xml"
+_VBA_PROJECT_TYPE = b"application/vnd.ms-office.vbaProject"
+_VBA_PROJECT_REL = b"http://schemas.microsoft.com/office/2006/relationships/vbaProject"
+
+_TYPES_END_RE = re.compile(rb"</(\w+:)?Types>")
+_RELATIONSHIPS_END_RE = re.compile(rb"</(\w+:)?Relationships>")
+_WORKBOOK_PR_RE = re.compile(rb"<(\w+:)?workbookPr\b(?![^>]*codeName)")
+
+
+@lru_cache(maxsize=1)
+def _vba_project_bin() -> Optional[bytes]:
+    """Read the prebuilt vbaProject.bin once, or None if it isn't installed"""
+    if not os.path.exists(VBA_PROJECT_PATH):
+        return None
+    with open(VBA_PROJECT_PATH, 'rb') as f:
+        return f.read()
+
+
+def _embed_vba_project(xlsx_bytes: bytes, vba_project: bytes) -> bytes:
+    """
+    Turn a saved xlsx package into an xlsm by adding xl/vbaProject.bin and
+    registering it in the content types and workbook relationships.
+    """
+    out = BytesIO()
+    with zipfile.ZipFile(BytesIO(xlsx_bytes)) as src, \
+            zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED) as dst:
+        for info in src.infolist():
+            data = src.read(info.filename)
+            
+            if info.filename == "[Content_Types].xml":
+                data = data.replace(_XLSX_MAIN_TYPE, _XLSM_MAIN_TYPE)
+                data = _TYPES_END_RE.sub(
+                    lambda m: b'<Default Extension="bin" ContentType="' + _VBA_PROJECT_TYPE + b'"/>' + m.group(0),
+                    data, count=1
+                )
+            elif info.filename == "xl/_rels/workbook.xml.rels":
+                data = _RELATIONSHIPS_END_RE.sub(
+                    lambda m: b'<Relationship Id="rIdVBA" Type="' + _VBA_PROJECT_REL
+                    + b'" Target="vbaProject.bin"/>' + m.group(0),
+                    data, count=1
+                )
+            elif info.filename == "xl/workbook.xml":
+                # The VBA project's ThisWorkbook module binds to the workbook by code name
+                data = _WORKBOOK_PR_RE.sub(lambda m: m.group(0) + b' codeName="ThisWorkbook"', data, count=1)
+            
+            dst.writestr(info, data)
         
-        ws['A{}'.format(row + 1)] = "Quick Actions (after VBA is enabled):"
-        ws['A{}'.format(row + 1)].font = openpyxl.styles.Font(bold=True)
-        ws['A{}'.format(row + 2)] = "  • Run modAPI.RefreshStockData() - Refresh stock data from API"
-        ws['A{}'.format(row + 3)] = "  • Run modValidation.RunValidation() - Check model for errors"  
-        ws['A{}'.format(row + 4)] = "  • Run modDashboard.UpdateDashboard() - Refresh dashboard"
-        ws['A{}'.format(row + 5)] = "  • Run modScenario.RunBullCase() - Apply bull case assumptions"
+        dst.writestr("xl/vbaProject.bin", vba_project)
+    
+    return out.getvalue()
+
+
+def _add_setup_sheet_openpyxl(source_xlsx: str) -> bytes:
+    """Rebuild the workbook through openpyxl with a fresh VBA Setup sheet first"""
+    wb = load_workbook(source_xlsx)
+    
+    if "VBA Setup" in wb.sheetnames:
+        del wb["VBA Setup"]
+    ws = wb.create_sheet("VBA Setup", 0)
+    
+    # Write and style each row in the same pass
+    for row_num, text, style in _VBA_SETUP_ROWS:
+        cell = ws.cell(row=row_num, column=1, value=text)
+        if style is not None:
+            cell.font = _SETUP_FONTS[style]
+    
+    # Set column width
+    ws.column_dimensions['A'].width = 80
+    
+    buffer = BytesIO()
+    wb.save(buffer)
+    return buffer.getvalue()
+
+
+def create_xlsm_with_vba(source_xlsx: str, output_xlsm: str, include_fallback_bas: bool = False) -> bool:
+    """
+    Convert an xlsx to xlsm with VBA modules embedded.
+    
+    When a prebuilt vbaProject.bin is installed (see VBA_PROJECT_PATH) it is
+    injected straight into the saved package, giving a runnable .xlsm.
+    
+    Otherwise we use a workaround:
+    1. Copy the xlsx, adding a setup sheet with import instructions
+       straight into the package (no openpyxl load/save)
+    2. Create VBA code as text files
+    
+    The workaround is skipped for embedded projects unless include_fallback_bas.
+    """
+    vba_project = _vba_project_bin()
+    fallback = include_fallback_bas or vba_project is None
+    
+    try:
+        if fallback:
+            # Patch the package directly; the openpyxl round trip is only needed
+            # to replace an existing VBA Setup sheet
+            data = _add_setup_sheet(source_xlsx)
+            if data is None:
+                if not OPENPYXL_AVAILABLE:
+                    logger.error("openpyxl not available for xlsm generation")
+                    return False
+                data = _add_setup_sheet_openpyxl(source_xlsx)
+        else:
+            with open(source_xlsx, 'rb') as f:
+                data = f.read()
         
-        # Set column width
-        ws.column_dimensions['A'].width = 80
+        # Embed the prebuilt VBA project when one is installed (openpyxl can't
+        # add actual VBA, otherwise the setup sheet and .bas files carry it)
+        if vba_project is not None:
+            data = _embed_vba_project(data, vba_project)
         
-        # Save as xlsm
-        # Note: openpyxl can't add actual VBA, but we include the code
-        wb.save(output_xlsm)
+        # Write the file in one go and swap it into place
+        write_file_atomic(output_xlsm, data)
         
         # Create VBA module files alongside the xlsm
-        vba_dir = os.path.join(os.path.dirname(output_xlsm), "vba_modules")
-        os.makedirs(vba_dir, exist_ok=True)
-        
-        for module_name, code in VBA_MODULES.items():
-            module_path = os.path.join(vba_dir, f"{module_name}.bas")
-            with open(module_path, 'w') as f:
-                f.write(f"Attribute VB_Name = \"{module_name}\"\n")
-                f.write(code)
+        if fallback:
+            vba_dir = os.path.join(os.path.dirname(output_xlsm), "vba_modules")
+            os.makedirs(vba_dir, exist_ok=True)
+            
+            for module_name, payload in _BAS_FILES.items():
+                fd = os.open(os.path.join(vba_dir, f"{module_name}.bas"), os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+                try:
+                    os.write(fd, payload)
+                finally:
+                    os.close(fd)
         
         logger.info(f"Created xlsm with VBA setup: {output_xlsm}")
         return True
@@ -305,51 +590,33 @@ def create_xlsm_with_vba(source_xlsx: str, output_xlsm: str) -> bool:
 
 def get_module_description(module_name: str) -> str:
     """Get description for each VBA module"""
-    descriptions = {
-        "modAPI": "API integration for live data",
-        "modCalc": "Financial calculation functions",
-        "modDashboard": "Dashboard controls and PDF export",
-        "modValidation": "Model audit and validation",
-        "modScenario": "Scenario management (Bull/Bear/Base)"
-    }
-    return descriptions.get(module_name, "VBA module")
+    return _MODULE_DESCRIPTIONS.get(module_name, "VBA module")
 
 
-def get_vba_modules_zip(output_path: str) -> str:
-    """Create a zip file with all VBA modules"""
-    import zipfile
-    
-    zip_path = output_path.replace('.xlsx', '_vba_modules.zip').replace('.xlsm', '_vba_modules.zip')
-    
-    with zipfile.ZipFile(zip_path, 'w') as zf:
-        for module_name, code in VBA_MODULES.items():
-            content = f'Attribute VB_Name = "{module_name}"\n{code}'
-            zf.writestr(f"{module_name}.bas", content)
+def write_vba_modules_zip(out: BinaryIO, compresslevel: int = 6) -> None:
+    """Write a deflate-compressed zip of all VBA modules to a binary stream"""
+    with zipfile.ZipFile(out, 'w', compression=zipfile.ZIP_DEFLATED, compresslevel=compresslevel) as zf:
+        for module_name, payload in _BAS_FILES.items():
+            zf.writestr(f"{module_name}.bas", payload)
         
         # Add README
-        readme = """AI Financial Modeler - VBA Modules
-===================================
-
-To install these VBA modules in your Excel workbook:
+        zf.writestr("README.txt", _README_BYTES)
 
-1. Open your Excel file
-2. Press Alt+F11 to open VBA Editor
-3. Right-click on VBAProject (your workbook name)
-4. Select Import File...
-5. Import each .bas file
 
-Modules included:
-- modAPI.bas: API integration for live stock data
-- modCalc.bas: Financial calculation functions (WACC, DCF, Terminal Value)
-- modDashboard.bas: Dashboard refresh and PDF export
-- modValidation.bas: Model audit and error checking
-- modScenario.bas: Bull/Bear/Base case scenario management
-
-After importing, you can:
-- Create buttons linked to the macros
-- Use the functions in formulas (e.g., =CalcWACC(...))
-- Run macros from Developer tab
-"""
-        zf.writestr("README.txt", readme)
+def get_vba_modules_zip(output_path: str, compresslevel: int = 6) -> str:
+    """Create a deflate-compressed zip file with all VBA modules"""
+    # Workbook paths get a sibling <stem>_vba_modules.zip; anything else is the zip path itself
+    path = PurePath(output_path)
+    if path.suffix in ('.xlsx', '.xlsm'):
+        zip_path = str(path.with_suffix('')) + '_vba_modules.zip'
+    else:
+        zip_path = output_path
+    
+    # The contents only change with this module, so a newer zip is already current
+    if os.path.exists(zip_path) and os.path.getmtime(zip_path) >= os.path.getmtime(__file__):
+        return zip_path
+    
+    with open(zip_path, 'wb') as f:
+        write_vba_modules_zip(f, compresslevel)
     
     return zip_path
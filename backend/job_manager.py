@@ -3,10 +3,21 @@ Job Manager - Persistent job storage using database
 Provides a dict-like interface for job management with SQLite persistence
 """
 
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Callable
 from datetime import datetime
+from collections import OrderedDict
 import database as db
 
+# Job fields stored in their own columns
+COLUMN_FIELDS = ('status', 'progress', 'message', 'company_name', 'industry', 'file_path', 'model_type')
+# Job fields stored together in the result_data JSON column
+RESULT_FIELDS = ('download_url', 'filename', 'validation', 'industry_code', 'lbo_summary', 'ma_summary',
+                 'scenarios')
+# Jobs in these states no longer change, so cached copies stay valid
+TERMINAL_STATUSES = ('completed', 'failed')
+# Most jobs kept in memory; older ones are re-read from the database on demand
+MAX_CACHED_JOBS = 1000
+
 
 class JobManager:
     """
@@ -15,8 +26,14 @@ class JobManager:
     """
     
     def __init__(self):
-        # In-memory cache for active jobs (improves performance)
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        # In-memory cache for active jobs (improves performance), least
+        # recently used first
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        # Jobs written by this process; other workers' jobs are re-read from
+        # the database until they reach a terminal status
+        self._owned: set = set()
+        # Callbacks run after each change to a job (e.g. progress streams)
+        self._listeners: Dict[str, List[Callable[[], None]]] = {}
     
     def __contains__(self, job_id: str) -> bool:
         """Check if job exists"""
@@ -28,8 +45,10 @@ class JobManager:
     def __getitem__(self, job_id: str) -> Dict[str, Any]:
         """Get job by ID"""
         # Check cache first
-        if job_id in self._cache:
-            return self._cache[job_id]
+        cached = self._cache.get(job_id)
+        if cached is not None and (job_id in self._owned or cached.get('status') in TERMINAL_STATUSES):
+            self._cache.move_to_end(job_id)
+            return cached
         
         # Load from database
         job = db.get_job(job_id)
@@ -38,60 +57,132 @@ class JobManager:
         
         # Convert database row to dict format expected by main.py
         job_dict = self._db_to_dict(job)
-        self._cache[job_id] = job_dict
+        self._remember(job_id, job_dict)
         return job_dict
     
     def __setitem__(self, job_id: str, job_data: Dict[str, Any]) -> None:
         """Create or update a job"""
-        # Check if job exists
-        existing = db.get_job(job_id)
-        
-        if existing is None:
-            # Create new job
-            db.create_job(
-                job_id=job_id,
-                company_name=job_data.get('company_name', 'Unknown'),
-                symbol=job_data.get('request', {}).get('symbol'),
-                industry=job_data.get('industry'),
-                forecast_years=job_data.get('request', {}).get('forecast_years', 5),
-                source=job_data.get('request', {}).get('source', 'stock'),
-                request_data=job_data.get('request')
-            )
+        # Insert the row if it's new; an existing row is left as is. This
+        # avoids a lookup query before, and a read-back after, every spawn.
+        request = job_data.get('request', {})
+        db.create_job(
+            job_id=job_id,
+            company_name=job_data.get('company_name', 'Unknown'),
+            symbol=request.get('symbol'),
+            industry=job_data.get('industry'),
+            forecast_years=request.get('forecast_years', 5),
+            source=request.get('source', 'stock'),
+            request_data=job_data.get('request')
+        )
         
         # Update job in database
-        update_fields = {}
-        
-        if 'status' in job_data:
-            update_fields['status'] = job_data['status']
-        if 'progress' in job_data:
-            update_fields['progress'] = job_data['progress']
-        if 'message' in job_data:
-            update_fields['message'] = job_data['message']
-        if 'company_name' in job_data:
-            update_fields['company_name'] = job_data['company_name']
-        if 'industry' in job_data:
-            update_fields['industry'] = job_data['industry']
-        if 'file_path' in job_data:
-            update_fields['file_path'] = job_data['file_path']
-        if 'model_type' in job_data:
-            update_fields['model_type'] = job_data['model_type']
-        
-        if job_data.get('status') == 'completed':
-            update_fields['completed_at'] = datetime.now().isoformat()
+        update_fields = self._db_fields(job_data, job_data)
+        if update_fields:
+            db.update_job(job_id, **update_fields)
         
-        # Store extra data as result_data JSON
-        extra_data = {}
-        for key in ['download_url', 'filename', 'validation', 'lbo_summary', 'ma_summary']:
-            if key in job_data:
-                extra_data[key] = job_data[key]
-        if extra_data:
-            update_fields['result_data'] = extra_data
+        # Update cache
+        self._owned.add(job_id)
+        self._remember(job_id, job_data)
+        self._notify(job_id)
+    
+    def reload(self, job_id: str) -> Dict[str, Any]:
+        """
+        Re-read a job from the database, for fields that other workers may
+        change after it finishes (e.g. saved scenarios). A cached dict is
+        refreshed in place so code holding it sees the new values.
+        """
+        row = db.get_job(job_id)
+        if row is None:
+            raise KeyError(f"Job {job_id} not found")
+        
+        job = self._db_to_dict(row)
+        cached = self._cache.get(job_id)
+        if cached is not None:
+            cached.update(job)
+            job = cached
+        self._remember(job_id, job)
+        return job
+    
+    def update(self, job_id: str, **fields) -> Dict[str, Any]:
+        """
+        Apply several field changes to a job at once.
+        The cached dict is updated in place and the change is persisted with
+        a single UPDATE, so other workers see progress as it happens.
+        """
+        job = self[job_id]
+        job.update(fields)
         
+        update_fields = self._db_fields(fields, job)
         if update_fields:
             db.update_job(job_id, **update_fields)
+        self._notify(job_id)
+        return job
+    
+    def append(self, job_id: str, field: str, item: Any) -> List[Any]:
+        """
+        Append item to a list result field (e.g. scenarios). The append is one
+        database transaction, so concurrent appends from any worker all land.
+        Returns the updated list.
+        """
+        items = db.append_job_result(job_id, field, item)
+        if items is None:
+            raise KeyError(f"Job {job_id} not found")
         
-        # Update cache
+        cached = self._cache.get(job_id)
+        if cached is not None:
+            cached[field] = items
+        self._notify(job_id)
+        return items
+    
+    def add_listener(self, job_id: str, callback: Callable[[], None]) -> None:
+        """Call callback whenever this process changes the job"""
+        self._listeners.setdefault(job_id, []).append(callback)
+    
+    def remove_listener(self, job_id: str, callback: Callable[[], None]) -> None:
+        """Stop calling a callback registered with add_listener"""
+        callbacks = self._listeners.get(job_id)
+        if callbacks and callback in callbacks:
+            callbacks.remove(callback)
+            if not callbacks:
+                del self._listeners[job_id]
+    
+    def _notify(self, job_id: str) -> None:
+        """Run the job's change listeners"""
+        for callback in self._listeners.get(job_id, ()):
+            callback()
+    
+    def _remember(self, job_id: str, job_data: Dict[str, Any]) -> None:
+        """Cache a job, evicting the least recently used finished jobs past MAX_CACHED_JOBS"""
         self._cache[job_id] = job_data
+        self._cache.move_to_end(job_id)
+        if len(self._cache) <= MAX_CACHED_JOBS:
+            return
+        
+        # Jobs this process is still running must stay cached: their dicts
+        # are the live state the background tasks update in place
+        for old_id, old_job in self._cache.items():
+            if old_id not in self._owned or old_job.get('status') in TERMINAL_STATUSES:
+                break
+        else:
+            return
+        del self._cache[old_id]
+        self._owned.discard(old_id)
+    
+    def _db_fields(self, changes: Dict[str, Any], job_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Map changed job fields to database columns"""
+        update_fields = {key: changes[key] for key in COLUMN_FIELDS if key in changes}
+        
+        if changes.get('status') == 'completed':
+            update_fields['completed_at'] = datetime.now().isoformat()
+        
+        # Store extra data as result_data JSON. Only the changed keys are sent;
+        # the database merges them into what is stored, so keys another worker
+        # wrote (e.g. scenarios) aren't overwritten from a stale cached copy
+        result_changes = {key: changes[key] for key in RESULT_FIELDS if key in changes}
+        if result_changes:
+            update_fields['result_data'] = result_changes
+        
+        return update_fields
     
     def get(self, job_id: str, default: Any = None) -> Optional[Dict[str, Any]]:
         """Get job with default value if not found"""
@@ -140,6 +231,10 @@ class JobManager:
         
         return result
     
+    def cached_jobs(self) -> List[tuple]:
+        """(job_id, job) pairs held in memory, most recently used first"""
+        return list(reversed(self._cache.items()))
+    
     def get_history(self, limit: int = 50) -> List[Dict[str, Any]]:
         """Get job history"""
         jobs = db.get_job_history(limit=limit)
@@ -149,8 +244,10 @@ class JobManager:
         """Clear cache for a specific job or all jobs"""
         if job_id:
             self._cache.pop(job_id, None)
+            self._owned.discard(job_id)
         else:
             self._cache.clear()
+            self._owned.clear()
 
 
 # Global job manager instance
@@ -3,18 +3,29 @@ AI Financial Modeling Platform - Main API Server
 FastAPI backend for generating institutional-grade Excel financial models
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, File, UploadFile, Form
+from fastapi import FastAPI, HTTPException, BackgroundTasks, File, UploadFile, Form, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse, JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import FileResponse, ORJSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import os
 import logging
+import re
 from datetime import datetime
 import uuid
+import importlib.util
 import tempfile
-import openpyxl
+import hashlib
+import copy
 import asyncio
+import orjson
+from collections import OrderedDict
+from io import BytesIO
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+from time import time
+from types import MappingProxyType
 
 import os
 import sys
@@ -25,24 +36,34 @@ sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 # Import our modules
 from data import fetch_stock_data, fetch_screener_data
 from data.stock_database import get_all_stocks, get_stocks_by_sector, search_stocks, get_sectors
-from agents import classify_company, create_model_structure, validate_financial_model
+from agents import classify_company, create_model_structure, validate_financial_model, INDUSTRY_TEMPLATES
 from excel import generate_financial_model
-from excel.lbo_generator import generate_lbo_model
-from excel.ma_generator import generate_ma_model
 
 # Import new enhanced modules
 import database as db
-from agents.ai_assistant import generate_smart_assumptions, generate_valuation_commentary, parse_natural_language_request
 from data.yahoo_finance import get_stock_info, get_historical_financials, get_price_history
-from exporters import pdf_exporter, pptx_exporter
-from analysis.monte_carlo import run_monte_carlo_simulation
 from data.damodaran_data import get_all_industry_data, map_yahoo_industry, get_india_erp
-from data.alpha_vantage import fetch_alpha_vantage_data, AlphaVantageAPI
+from data.alpha_vantage import fetch_alpha_vantage_data
+from cache import get_cached, set_cached, _generate_cache_key
 
-# Import Chat and Analysis modules
-from agents.chat_assistant import process_chat_message
+# Pure-Python analysis helpers and the chat assistant (whose only dependency,
+# requests, the data package has already loaded) are needed by per-request
+# handlers, so they are imported once here
 from analysis.tornado_analysis import calculate_sensitivity
 from analysis.football_field import create_football_field
+from agents.chat_assistant import process_chat_message, get_suggested_questions
+
+# The XLSM builder only needs zipfile and openpyxl, which the Excel generator
+# has already loaded, so it is imported once here rather than per request
+try:
+    from exporters.xlsm_generator import create_xlsm_with_vba, write_vba_modules_zip
+    XLSM_AVAILABLE = True
+except ImportError:
+    XLSM_AVAILABLE = False
+
+# Other generators, exporters, analysis and AI modules are imported inside the
+# handlers that use them, keeping them (and reportlab, python-pptx, numpy,
+# the LLM clients) off the cold-start import path
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -54,8 +75,37 @@ app = FastAPI(
     title="AI Financial Modeling Platform",
     description="Generate institutional-grade Excel financial models with AI",
     version="1.0.0",
+    # orjson encodes the large analysis payloads much faster than stdlib json,
+    # and serializes numpy scalars/arrays natively
+    default_response_class=ORJSONResponse,
 )
 
+# JSON request bodies declaring more than this are rejected before being read.
+# File uploads are multipart and are not affected.
+MAX_JSON_BODY_BYTES = 1024 * 1024
+
+
+class JSONBodyLimitMiddleware:
+    """Answers 413 to JSON requests whose Content-Length exceeds MAX_JSON_BODY_BYTES"""
+    
+    def __init__(self, app):
+        self.app = app
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http":
+            headers = dict(scope["headers"])
+            length = headers.get(b"content-length", b"")
+            if (length.isdigit() and int(length) > MAX_JSON_BODY_BYTES
+                    and headers.get(b"content-type", b"").startswith(b"application/json")):
+                response = ORJSONResponse({"detail": "Request body too large"}, status_code=413)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+# Added before CORS so the 413 still carries CORS headers
+app.add_middleware(JSONBodyLimitMiddleware)
+
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -65,6 +115,36 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
+# File downloads are already zip-compressed (xlsx/xlsm/pptx/zip) or binary,
+# so only the JSON API responses go through gzip
+_UNCOMPRESSED_PREFIXES = ("/api/download/", "/api/export/")
+# Event streams must reach the client as each event is written, not when
+# the compressor's buffer fills
+_UNCOMPRESSED_SUFFIXES = ("/stream",)
+
+
+class APIGZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that passes file download and event stream routes through untouched"""
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and (scope["path"].startswith(_UNCOMPRESSED_PREFIXES)
+                                        or scope["path"].endswith(_UNCOMPRESSED_SUFFIXES)):
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Added after CORS so it wraps it and compresses the final response
+app.add_middleware(APIGZipMiddleware, minimum_size=1024, compresslevel=6)
+
+
+class DownloadResponse(FileResponse):
+    """FileResponse for generated models and exports, read in 1MB chunks"""
+    # Starlette's 64KB default means dozens of reads and socket writes per
+    # multi-MB workbook or deck
+    chunk_size = 1024 * 1024
+
 # Serve Static Frontend (for Docker/Single-Container deployments)
 from fastapi.staticfiles import StaticFiles
 import os
@@ -85,12 +165,12 @@ if os.path.exists(static_dir):
         
         # API requests should return 404
         if path.startswith("/api"):
-            return JSONResponse({"detail": "Not Found"}, status_code=404)
+            return ORJSONResponse({"detail": "Not Found"}, status_code=404)
             
         # Static assets (js, css, images) should return 404 if missing
         # preventing "Uncaught SyntaxError: Unexpected token '<'"
         if "." in path.split("/")[-1]:
-             return JSONResponse({"detail": "Asset not found"}, status_code=404)
+             return ORJSONResponse({"detail": "Asset not found"}, status_code=404)
              
         return FileResponse(os.path.join(static_dir, "index.html"))
 
@@ -105,6 +185,61 @@ else:
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
 
+# Anything other than a letter, digit, space, '-' or '_' (\w is exactly
+# str.isalnum() plus '_', so non-Latin names keep their letters)
+_UNSAFE_NAME_CHARS = re.compile(r"[^\w \-]")
+
+
+def _safe_name(name: str, max_length: int = 30) -> str:
+    """Reduce a user-supplied name to characters that are safe in a filename"""
+    return _UNSAFE_NAME_CHARS.sub("", name).strip()[:max_length]
+
+
+def _reserve_output_path(prefix: str, suffix: str = ".xlsx") -> tuple:
+    """Atomically claim a unique file in OUTPUT_DIR; returns (output_path, filename)"""
+    tf = tempfile.NamedTemporaryFile(prefix=prefix, suffix=suffix, dir=OUTPUT_DIR, delete=False)
+    tf.close()
+    return tf.name, os.path.basename(tf.name)
+
+
+def _discard_output(output_path: str) -> None:
+    """Remove a file claimed with _reserve_output_path for a job that failed"""
+    try:
+        os.remove(output_path)
+    except OSError:
+        pass
+
+
+# Workbook generation and simulations are CPU-bound, so they run in worker
+# processes rather than holding the GIL in the event loop's thread pool. Job
+# status stays in this process; workers only compute and write files. Where
+# processes can't be spawned (e.g. serverless sandboxes) the default
+# executor is used instead. Each uvicorn worker (WEB_CONCURRENCY of them)
+# gets its own pool, sized to its share of the cores.
+_cpu_pool: Optional[ProcessPoolExecutor] = None
+_cpu_pool_failed = False
+
+
+def _get_cpu_pool() -> Optional[ProcessPoolExecutor]:
+    """Create the CPU-bound work process pool on first use"""
+    global _cpu_pool, _cpu_pool_failed
+    if _cpu_pool is None and not _cpu_pool_failed and not os.environ.get("VERCEL"):
+        try:
+            web_workers = max(1, int(os.environ.get("WEB_CONCURRENCY", 1)))
+            pool_size = max(1, min(4, (os.cpu_count() or 1) // web_workers))
+            _cpu_pool = ProcessPoolExecutor(max_workers=pool_size)
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f"Process pool unavailable, running CPU-bound work in threads: {e}")
+            _cpu_pool_failed = True
+    return _cpu_pool
+
+
+async def _run_in_cpu_pool(func, **kwargs):
+    """Run a picklable module-level function off the event loop"""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_get_cpu_pool(), partial(func, **kwargs))
+
+
 # Pydantic models for API
 class ModelRequest(BaseModel):
     """Request to generate a financial model"""
@@ -213,7 +348,23 @@ class MARequest(BaseModel):
 
 
 # Job storage with database persistence
-from job_manager import jobs
+from job_manager import jobs, TERMINAL_STATUSES
+
+
+def _require_job(job_id: str) -> Dict[str, Any]:
+    """Look up a job in one read, raising 404 if it doesn't exist"""
+    job = jobs.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return job
+
+
+def _require_ready(job_id: str, detail: str = "Model not ready") -> Dict[str, Any]:
+    """Look up a job that must have completed, raising 404 or 400 otherwise"""
+    job = _require_job(job_id)
+    if job.get("status") != "completed":
+        raise HTTPException(status_code=400, detail=detail)
+    return job
 
 
 @app.get("/")
@@ -232,6 +383,13 @@ async def root():
     }
 
 
+# Company metadata changes rarely, so lookups are kept in-process for an hour
+# as (symbol, exchange) -> (fetched_at, CompanyInfo), evicting least recently used
+COMPANY_INFO_TTL_SECONDS = 3600
+COMPANY_INFO_CACHE_SIZE = 1024
+_company_info_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+
+
 @app.get("/api/company/{symbol}", response_model=CompanyInfo)
 async def get_company_info(symbol: str, exchange: str = "NSE"):
     """
@@ -241,13 +399,19 @@ async def get_company_info(symbol: str, exchange: str = "NSE"):
         symbol: Stock symbol (e.g., ADANIPOWER, RELIANCE)
         exchange: NSE or BSE
     """
+    key = (symbol.upper(), exchange.upper())
+    cached = _company_info_cache.get(key)
+    if cached is not None and time() - cached[0] < COMPANY_INFO_TTL_SECONDS:
+        _company_info_cache.move_to_end(key)
+        return cached[1]
+    
     try:
         # Fetch data from Yahoo Finance
         data = await fetch_stock_data(symbol, exchange)
         info = data.get('company_info', {})
         metrics = data.get('key_metrics', {})
         
-        return CompanyInfo(
+        company = CompanyInfo(
             symbol=symbol.upper(),
             name=info.get('name', symbol),
             sector=info.get('sector', 'Unknown'),
@@ -258,29 +422,30 @@ async def get_company_info(symbol: str, exchange: str = "NSE"):
     except Exception as e:
         logger.error(f"Error fetching company info for {symbol}: {e}")
         raise HTTPException(status_code=404, detail=f"Company not found: {symbol}")
-
-        raise HTTPException(status_code=404, detail=f"Company not found: {symbol}")
+    
+    _company_info_cache[key] = (time(), company)
+    _company_info_cache.move_to_end(key)
+    if len(_company_info_cache) > COMPANY_INFO_CACHE_SIZE:
+        _company_info_cache.popitem(last=False)
+    return company
 
 
 # --- NEW API ROUTES FOR CHAT & ANALYSIS ---
 
 class ChatRequest(BaseModel):
-    message: str
-    history: Optional[List[Dict[str, str]]] = None
+    message: str = Field(..., max_length=4000)
+    # The assistant only sends the last few turns to the LLM
+    history: Optional[List[Dict[str, str]]] = Field(default=None, max_length=50)
 
 @app.post("/api/chat/{job_id}")
 async def chat_endpoint(job_id: str, request: ChatRequest):
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
+    job = _require_job(job_id)
     
     # Ensure job has data needed for chat
     # We pass the whole job dict, the assistant handles extraction
     
     # Run in threadpool to avoid blocking
-    loop = asyncio.get_event_loop()
-    response = await loop.run_in_executor(None, process_chat_message, request.message, job, request.history)
+    response = await asyncio.to_thread(process_chat_message, request.message, job, request.history)
     
     if not response['success']:
         # Return 200 with error message as chat response so UI doesn't crash
@@ -290,9 +455,7 @@ async def chat_endpoint(job_id: str, request: ChatRequest):
 
 @app.get("/api/analysis/sensitivity/{job_id}")
 async def get_sensitivity(job_id: str):
-    if job_id not in jobs:
-         raise HTTPException(status_code=404, detail="Job not found")
-    job = jobs[job_id]
+    job = _require_job(job_id)
     
     # Check if we have valuation data
     # (assuming job stores 'valuation_summary' or similar from generate_financial_model)
@@ -307,21 +470,34 @@ async def get_sensitivity(job_id: str):
         pass
         
     data = calculate_sensitivity(valuation_data, assumptions)
-    return {"sensitivity": data}
+    # Plain nested floats, so skip jsonable_encoder and let orjson encode them
+    return ORJSONResponse({"sensitivity": data})
 
 @app.get("/api/analysis/football-field/{job_id}")
 async def get_football_field(job_id: str):
-    if job_id not in jobs:
-         raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
+    job = _require_job(job_id)
     
     valuation_data = job.get('valuation_data', {})
     monte_carlo = job.get('monte_carlo_results')
     competitors = job.get('competitors_data', {}) # or similar
     
     data = create_football_field(valuation_data, monte_carlo, competitors)
-    return {"football_field": data}
+    # Monte Carlo ranges may hold numpy values, which orjson serializes natively
+    return ORJSONResponse({"football_field": data})
+
+
+# Model generations in progress, keyed by request parameters -> job_id, so a
+# duplicate request joins the running job instead of starting a second pipeline
+_inflight_models: Dict[tuple, str] = {}
+
+
+async def _generate_model_single_flight(key: tuple, job_id: str, *args):
+    """Run _generate_model_task and release its in-flight slot when done"""
+    try:
+        await _generate_model_task(job_id, *args)
+    finally:
+        if _inflight_models.get(key) == job_id:
+            del _inflight_models[key]
 
 
 @app.post("/api/model/generate", response_model=ModelResponse)
@@ -330,7 +506,19 @@ async def generate_model(request: ModelRequest, background_tasks: BackgroundTask
     Generate a financial model for a company
     
     This starts an async job and returns a job ID for tracking.
+    An identical request made while one is still running gets that job's ID.
     """
+    # Only these parameters reach _generate_model_task, so they alone decide
+    # whether two requests would build the same model
+    key = (request.symbol.upper(), request.exchange.upper(), request.forecast_years)
+    running_job_id = _inflight_models.get(key)
+    if running_job_id is not None:
+        return ModelResponse(
+            job_id=running_job_id,
+            status=jobs[running_job_id]["status"],
+            message="An identical model is already being generated. Check job status for progress.",
+        )
+    
     job_id = str(uuid.uuid4())
     
     # Initialize job
@@ -341,11 +529,13 @@ async def generate_model(request: ModelRequest, background_tasks: BackgroundTask
         "progress": 0,
         "message": "Job queued",
     }
+    _inflight_models[key] = job_id
     
     # Start background task
     if os.environ.get("VERCEL"):
         # On Vercel, run synchronously to prevent timeout/kill
-        await _generate_model_task(
+        await _generate_model_single_flight(
+            key,
             job_id,
             request.symbol,
             request.exchange,
@@ -353,7 +543,8 @@ async def generate_model(request: ModelRequest, background_tasks: BackgroundTask
         )
     else:
         background_tasks.add_task(
-            _generate_model_task,
+            _generate_model_single_flight,
+            key,
             job_id,
             request.symbol,
             request.exchange,
@@ -367,6 +558,42 @@ async def generate_model(request: ModelRequest, background_tasks: BackgroundTask
     )
 
 
+# Screener.in metric names for each financial field, in order of preference
+SCREENER_METRIC_NAMES = {
+    'revenue': ['sales', 'revenue', 'total revenue', 'net sales', 'income from operations'],
+    'expenses': ['expenses', 'total expenses', 'operating expenses'],
+    'operating_profit': ['operating profit', 'ebit', 'operating income'],
+    'ebitda': ['ebitda', 'operating profit before interest'],
+    'interest': ['interest', 'finance costs', 'interest expense'],
+    'net_income': ['net profit', 'net income', 'profit after tax', 'pat'],
+    'eps': ['eps', 'earnings per share', 'basic eps'],
+    'dividend': ['dividend payout', 'dividend', 'dividend %'],
+}
+
+# Reverse index of SCREENER_METRIC_NAMES: metric name -> (financial field, preference rank)
+_SCREENER_NAME_TO_KEY = {}
+for _fin_key, _names in SCREENER_METRIC_NAMES.items():
+    for _rank, _name in enumerate(_names):
+        _SCREENER_NAME_TO_KEY.setdefault(_name, (_fin_key, _rank))
+
+# Screener.in year columns look like "Mar 2024" or a bare year
+_YEAR_COLUMN_RE = re.compile(r'mar|^\d+$', re.IGNORECASE)
+
+# Margins derived from the latest year, as (margin key, numerator key)
+SCREENER_MARGINS = (
+    ('operating_margin', 'operating_profit'),
+    ('net_margin', 'net_income'),
+)
+
+
+def _to_float(value: Any) -> Optional[float]:
+    """Parse a Screener.in cell value, returning None when it isn't numeric"""
+    try:
+        return float(value) if value else None
+    except (ValueError, TypeError):
+        return None
+
+
 def _extract_screener_financials(annual_results: List[Dict]) -> Dict[str, Any]:
     """
     Extract real financial figures from Screener.in annual results
@@ -380,68 +607,70 @@ def _extract_screener_financials(annual_results: List[Dict]) -> Dict[str, Any]:
     financials = {}
     
     # Build a lookup by metric name
-    metric_map = {}
-    for row in annual_results:
-        metric = row.get('metric', '').lower().strip()
-        if metric:
-            metric_map[metric] = row
-    
-    # Common metric name mappings
-    mappings = {
-        'revenue': ['sales', 'revenue', 'total revenue', 'net sales', 'income from operations'],
-        'expenses': ['expenses', 'total expenses', 'operating expenses'],
-        'operating_profit': ['operating profit', 'ebit', 'operating income'],
-        'ebitda': ['ebitda', 'operating profit before interest'],
-        'interest': ['interest', 'finance costs', 'interest expense'],
-        'net_income': ['net profit', 'net income', 'profit after tax', 'pat'],
-        'eps': ['eps', 'earnings per share', 'basic eps'],
-        'dividend': ['dividend payout', 'dividend', 'dividend %'],
+    metric_map = {
+        row['metric'].lower().strip(): row
+        for row in annual_results if row.get('metric')
     }
     
     # Get the last year column (most recent)
     year_columns = []
     if annual_results:
         first_row = annual_results[0]
-        year_columns = [k for k in first_row.keys() if k not in ['metric'] and 'mar' in k.lower() or k.isdigit()]
+        year_columns = [k for k in first_row if k != 'metric' and _YEAR_COLUMN_RE.search(k)]
         if not year_columns:
             # Try to find any numeric-looking columns
             year_columns = [k for k in first_row.keys() if k not in ['metric']]
     
     latest_year = year_columns[-1] if year_columns else None
     
-    for fin_key, possible_names in mappings.items():
-        for name in possible_names:
-            if name in metric_map:
-                row = metric_map[name]
-                # Get most recent year value
-                if latest_year and latest_year in row:
-                    financials[fin_key] = row[latest_year]
-                # Also store historical values
-                financials[f'{fin_key}_history'] = {k: v for k, v in row.items() if k != 'metric'}
-                break
-    
-    # Calculate margins from the data
-    if financials.get('revenue') and financials.get('operating_profit'):
-        try:
-            rev = float(financials['revenue']) if financials['revenue'] else 0
-            op = float(financials['operating_profit']) if financials['operating_profit'] else 0
-            if rev > 0:
-                financials['operating_margin'] = op / rev
-        except (ValueError, TypeError):
-            pass
-    
-    if financials.get('revenue') and financials.get('net_income'):
-        try:
-            rev = float(financials['revenue']) if financials['revenue'] else 0
-            ni = float(financials['net_income']) if financials['net_income'] else 0
-            if rev > 0:
-                financials['net_margin'] = ni / rev
-        except (ValueError, TypeError):
-            pass
+    # Single pass over the rows, keeping the most preferred match per field
+    best_rows = {}
+    for name, row in metric_map.items():
+        match = _SCREENER_NAME_TO_KEY.get(name)
+        if match is None:
+            continue
+        fin_key, rank = match
+        if fin_key not in best_rows or rank < best_rows[fin_key][0]:
+            best_rows[fin_key] = (rank, row)
+    
+    for fin_key, (_, row) in best_rows.items():
+        # Get most recent year value
+        if latest_year and latest_year in row:
+            financials[fin_key] = row[latest_year]
+        # Also store historical values
+        financials[f'{fin_key}_history'] = {k: v for k, v in row.items() if k != 'metric'}
+    
+    # Calculate margins from the data, parsing revenue only once
+    rev = _to_float(financials.get('revenue'))
+    if rev and rev > 0:
+        for margin_key, fin_key in SCREENER_MARGINS:
+            value = _to_float(financials.get(fin_key))
+            if value is not None:
+                financials[margin_key] = value / rev
     
     return financials
 
 
+# TTLs for the persistent fetch cache used by model generation
+FETCH_CACHE_TTL_HOURS = 24
+DAMODARAN_CACHE_TTL_HOURS = 30 * 24
+
+
+async def _cached_fetch(key: str, ttl_hours: int, fetch):
+    """Return a cached fetch result, or await fetch() and cache a non-empty result"""
+    hit = await asyncio.to_thread(get_cached, key)
+    if hit is not None:
+        return hit
+    
+    result = await fetch()
+    if result:
+        try:
+            await asyncio.to_thread(set_cached, key, result, ttl_hours)
+        except (TypeError, ValueError) as e:
+            logger.warning(f"Could not cache fetch result: {e}")
+    return result
+
+
 async def _generate_model_task(
     job_id: str,
     symbol: str,
@@ -449,25 +678,27 @@ async def _generate_model_task(
     forecast_years: int,
 ):
     """Background task to generate the financial model"""
+    output_path = None
     try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["progress"] = 5
-        jobs[job_id]["message"] = "Fetching financial data from multiple sources in parallel..."
+        jobs.update(
+            job_id,
+            status="processing",
+            progress=5,
+            message="Fetching financial data from multiple sources in parallel...",
+        )
         
         # Helper wrappers for sync functions
-        loop = asyncio.get_event_loop()
-        
         async def fetch_av():
             try:
                 logger.info(f"Fetching Alpha Vantage data for {symbol}")
-                return await loop.run_in_executor(None, fetch_alpha_vantage_data, symbol)
+                return await asyncio.to_thread(fetch_alpha_vantage_data, symbol)
             except Exception as e:
                 logger.warning(f"Alpha Vantage fetch failed: {e}")
                 return {}
 
         async def fetch_sc():
             try:
-                return await loop.run_in_executor(None, fetch_screener_data, symbol)
+                return await asyncio.to_thread(fetch_screener_data, symbol)
             except Exception as e:
                 logger.warning(f"Screener scraping failed: {e}")
                 return {}
@@ -480,10 +711,15 @@ async def _generate_model_task(
                 logger.warning(f"Yahoo fetch failed: {e}")
                 return {}
 
-        # 1. Start parallel fetching for Company Data
-        av_task = asyncio.create_task(fetch_av())
-        sc_task = asyncio.create_task(fetch_sc())
-        yf_task = asyncio.create_task(fetch_yf())
+        # 1. Start parallel fetching for Company Data (served from the disk cache when fresh)
+        symbol_key = symbol.upper()
+        exchange_key = exchange.upper()
+        av_task = asyncio.create_task(_cached_fetch(
+            _generate_cache_key("alpha_vantage", symbol_key), FETCH_CACHE_TTL_HOURS, fetch_av))
+        sc_task = asyncio.create_task(_cached_fetch(
+            _generate_cache_key("screener_data", symbol_key), FETCH_CACHE_TTL_HOURS, fetch_sc))
+        yf_task = asyncio.create_task(_cached_fetch(
+            _generate_cache_key("stock_data", symbol_key, exchange_key), FETCH_CACHE_TTL_HOURS, fetch_yf))
         
         alpha_vantage_data, screener_data, yahoo_data = await asyncio.gather(av_task, sc_task, yf_task)
         
@@ -493,20 +729,22 @@ async def _generate_model_task(
         if screener_data.get('annual_results'):
             logger.info(f"Screener data fetched: {len(screener_data['annual_results'])} records")
         
-        jobs[job_id]["progress"] = 35
-        jobs[job_id]["message"] = "Fetching Damodaran industry benchmarks..."
+        jobs.update(job_id, progress=35, message="Fetching Damodaran industry benchmarks...")
         
-        # 2. Fetch Damodaran data (depends on Yahoo industry)
+        # 2. Fetch Damodaran data (depends on Yahoo industry) in the background
+        # while the company data is merged and classified below
         company_info = yahoo_data.get('company_info', {})
         yahoo_industry = company_info.get('industry', 'Unknown')
         damodaran_industry = map_yahoo_industry(yahoo_industry)
         
-        try:
-            damodaran_data = await loop.run_in_executor(None, get_all_industry_data, damodaran_industry)
-            logger.info(f"Damodaran data fetched for: {damodaran_industry}")
-        except Exception as e:
-            logger.warning(f"Damodaran fetch failed: {e}")
-            damodaran_data = {}
+        async def fetch_damodaran():
+            return await asyncio.to_thread(get_all_industry_data, damodaran_industry)
+        
+        damodaran_task = asyncio.create_task(_cached_fetch(
+            _generate_cache_key("damodaran", damodaran_industry),
+            DAMODARAN_CACHE_TTL_HOURS,
+            fetch_damodaran,
+        ))
         
         # Step 4: Merge all data sources with priority
         # Priority: Alpha Vantage > Screener.in > Yahoo Finance > Damodaran defaults
@@ -565,28 +803,37 @@ async def _generate_model_task(
                     financial_data['real_financials'] = real_financials
                     logger.info(f"Using Screener.in financials: Revenue={real_financials.get('revenue')}, Net Income={real_financials.get('net_income')}")
         
+        jobs.update(job_id, progress=45, message="Classifying industry...")
+        
+        # Step 5: Classify industry
+        industry_info = classify_company(company_info)
+        
+        damodaran_data, = await asyncio.gather(damodaran_task, return_exceptions=True)
+        if isinstance(damodaran_data, Exception):
+            logger.warning(f"Damodaran fetch failed: {damodaran_data}")
+            damodaran_data = {}
+        else:
+            logger.info(f"Damodaran data fetched for: {damodaran_industry}")
+        
         # Add Damodaran assumptions for projections (fallback for industry benchmarks)
         if damodaran_data:
             financial_data['damodaran'] = damodaran_data
             financial_data['model_assumptions'] = damodaran_data.get('model_assumptions', {})
             financial_data['data_source'] = f"Primary: Alpha Vantage API | Secondary: Screener.in + Yahoo | Industry: Damodaran ({damodaran_industry})"
         
-        jobs[job_id]["progress"] = 45
-        jobs[job_id]["message"] = "Classifying industry..."
-        
-        # Step 5: Classify industry
-        industry_info = classify_company(company_info)
-        
         # Enhance industry_info with Damodaran data
         if damodaran_data:
             industry_info['damodaran_industry'] = damodaran_industry
             industry_info['industry_beta'] = damodaran_data.get('beta', {}).get('levered_beta', 1.0)
             industry_info['industry_wacc'] = damodaran_data.get('wacc', {}).get('wacc', 0.11)
         
-        jobs[job_id]["company_name"] = company_info.get('name', symbol)
-        jobs[job_id]["industry"] = industry_info.get('industry_name', 'Unknown')
-        jobs[job_id]["progress"] = 55
-        jobs[job_id]["message"] = "Designing model structure..."
+        jobs.update(
+            job_id,
+            company_name=company_info.get('name', symbol),
+            industry=industry_info.get('industry_name', 'Unknown'),
+            progress=55,
+            message="Designing model structure...",
+        )
         
         # Step 6: Design model structure with real assumptions
         model_structure = create_model_structure(
@@ -603,15 +850,13 @@ async def _generate_model_task(
                 **damodaran_data['model_assumptions']
             }
         
-        jobs[job_id]["progress"] = 70
-        jobs[job_id]["message"] = "Generating Excel model with real data..."
+        jobs.update(job_id, progress=70, message="Generating Excel model with real data...")
         
         # Step 7: Generate Excel file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{symbol}_{industry_info['model_type']}_{timestamp}.xlsx"
-        output_path = os.path.join(OUTPUT_DIR, filename)
+        output_path, filename = _reserve_output_path(f"{_safe_name(symbol)}_{industry_info['model_type']}_")
         
-        generate_financial_model(
+        await _run_in_cpu_pool(
+            generate_financial_model,
             company_name=company_info.get('name', symbol),
             model_structure=model_structure,
             financial_data=financial_data,
@@ -619,50 +864,35 @@ async def _generate_model_task(
             output_path=output_path,
         )
         
-        jobs[job_id]["progress"] = 90
-        jobs[job_id]["message"] = "Validating model..."
-        
-        # Step 5: Validate the model
-        validation_data = {
-            'income_statement': financial_data.get('income_statement', {}),
-            'balance_sheet': financial_data.get('balance_sheet', {}),
-            'cash_flow': financial_data.get('cash_flow', {}),
-            'assumptions': {},
-        }
-        is_valid, errors = validate_financial_model(
-            validation_data,
-            industry_info.get('industry_code', 'general')
+        # Complete (validation runs on demand via /api/job/{job_id}/validate)
+        jobs.update(
+            job_id,
+            status="completed",
+            progress=100,
+            message="Model generated successfully!",
+            file_path=output_path,
+            filename=filename,
+            industry_code=industry_info.get('industry_code', 'general'),
+            download_url=f"/api/download/{job_id}",
         )
         
-        # Complete
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["progress"] = 100
-        jobs[job_id]["message"] = "Model generated successfully!"
-        jobs[job_id]["file_path"] = output_path
-        jobs[job_id]["filename"] = filename
-        jobs[job_id]["validation"] = {
-            "is_valid": is_valid,
-            "errors": errors[:5] if errors else [],  # Limit to first 5 errors
-        }
-        jobs[job_id]["download_url"] = f"/api/download/{job_id}"
-        
         logger.info(f"Model generated successfully: {filename}")
         
     except Exception as e:
         logger.error(f"Error generating model for job {job_id}: {e}")
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["message"] = f"Error: {str(e)}"
-        jobs[job_id]["progress"] = 0
+        if output_path is not None:
+            _discard_output(output_path)
+        jobs.update(job_id, status="failed", message=f"Error: {str(e)}", progress=0)
 
 
 @app.get("/api/job/{job_id}")
 async def get_job_status(job_id: str):
     """Get the status of a model generation job"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    
+    return _job_status_payload(job_id, _require_job(job_id))
+
+
+def _job_status_payload(job_id: str, job: Dict[str, Any]) -> Dict[str, Any]:
+    """Status fields reported to clients by the polling and streaming endpoints"""
     response = {
         "job_id": job_id,
         "status": job["status"],
@@ -680,33 +910,129 @@ async def get_job_status(job_id: str):
     return response
 
 
+# Streams fall back to re-reading the job this often, which picks up
+# progress written by other workers (their updates don't notify us)
+JOB_STREAM_POLL_SECONDS = 2.0
+
+
+@app.get("/api/job/{job_id}/stream")
+async def stream_job_status(job_id: str):
+    """Push job status as Server-Sent Events until the job finishes"""
+    _require_job(job_id)
+    
+    loop = asyncio.get_running_loop()
+    changed = asyncio.Event()
+    
+    def on_change():
+        # Updates may come from executor threads
+        loop.call_soon_threadsafe(changed.set)
+    
+    async def events():
+        jobs.add_listener(job_id, on_change)
+        try:
+            last = None
+            while True:
+                changed.clear()
+                payload = _job_status_payload(job_id, jobs[job_id])
+                if payload != last:
+                    last = payload
+                    yield b"data: " + orjson.dumps(payload) + b"\n\n"
+                if payload["status"] in TERMINAL_STATUSES:
+                    return
+                try:
+                    await asyncio.wait_for(changed.wait(), JOB_STREAM_POLL_SECONDS)
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            jobs.remove_listener(job_id, on_change)
+    
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.get("/api/job/{job_id}/validate")
+async def validate_job_model(job_id: str):
+    """
+    Run QA validation for a completed model. Symbol jobs are checked against
+    the cached Yahoo fetch, raw-data and upload jobs against the data they
+    were generated from.
+    """
+    job = _require_ready(job_id, "Model not ready for validation")
+    
+    if job.get("validation") is None:
+        request_data = job.get("request") or {}
+        symbol = request_data.get("symbol")
+        if symbol:
+            exchange = request_data.get("exchange", "NSE")
+            
+            # Same cache entry the generation task filled, so this rarely refetches
+            source = await _cached_fetch(
+                _generate_cache_key("stock_data", symbol.upper(), exchange.upper()),
+                FETCH_CACHE_TTL_HOURS,
+                partial(fetch_stock_data, symbol, exchange),
+            )
+            assumptions = {}
+            industry_code = job.get("industry_code", "general")
+        elif "historical_data" in request_data:
+            source = request_data.get("historical_data") or {}
+            assumptions = request_data.get("assumptions") or {}
+            industry_code = request_data.get("industry", "general")
+        else:
+            raise HTTPException(status_code=400, detail="Job has no source data to validate against")
+        
+        validation_data = {
+            'income_statement': source.get('income_statement', {}),
+            'balance_sheet': source.get('balance_sheet', {}),
+            'cash_flow': source.get('cash_flow', {}),
+            'assumptions': assumptions,
+        }
+        is_valid, errors = validate_financial_model(validation_data, industry_code)
+        jobs.update(
+            job_id,
+            validation={
+                "is_valid": is_valid,
+                "errors": errors[:5] if errors else [],  # Limit to first 5 errors
+            },
+        )
+    
+    return {"job_id": job_id, **job["validation"]}
+
+
 @app.get("/api/download/{job_id}")
 async def download_model(job_id: str):
     """Download the generated Excel model"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    
-    if job["status"] != "completed":
-        raise HTTPException(status_code=400, detail="Model not ready for download")
+    job = _require_ready(job_id, "Model not ready for download")
     
     file_path = job.get("file_path")
-    if not file_path or not os.path.exists(file_path):
+    try:
+        # One stat both checks the file and gives FileResponse its
+        # Content-Length/ETag, so it doesn't stat again before streaming
+        stat_result = os.stat(file_path) if file_path else None
+    except OSError:
+        stat_result = None
+    if stat_result is None:
         raise HTTPException(status_code=404, detail="File not found")
     
-    return FileResponse(
+    # Streamed through anyio's async file wrapper, so no worker thread is
+    # held for the length of the transfer
+    return DownloadResponse(
         path=file_path,
         filename=job.get("filename", "financial_model.xlsx"),
         media_type="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+        stat_result=stat_result,
     )
 
 
-@app.get("/api/industries")
-async def get_industries():
-    """Get list of supported industries"""
-    from agents.industry_classifier import INDUSTRY_TEMPLATES
-    
+# Static list responses are safe for browsers and the CDN to cache for a day
+STATIC_LIST_CACHE_CONTROL = "public, max-age=86400"
+
+
+@lru_cache(maxsize=1)
+def _industries_payload() -> Dict[str, Any]:
+    """Build the /api/industries response once from the static templates"""
     industries = []
     for code, template in INDUSTRY_TEMPLATES.items():
         industries.append({
@@ -719,20 +1045,43 @@ async def get_industries():
     return {"industries": industries}
 
 
+@app.get("/api/industries")
+async def get_industries(response: Response):
+    """Get list of supported industries"""
+    response.headers["Cache-Control"] = STATIC_LIST_CACHE_CONTROL
+    return _industries_payload()
+
+
 # ======================= DAMODARAN DATA API =======================
 
+# Successful /api/damodaran/industries payload and when it was built
+_damodaran_industries_payload: Optional[Dict[str, Any]] = None
+_damodaran_industries_built_at = 0.0
+DAMODARAN_INDUSTRIES_TTL_SECONDS = 24 * 3600
+
+
 @app.get("/api/damodaran/industries")
-async def get_damodaran_industries():
+async def get_damodaran_industries(response: Response):
     """Get list of industries from Damodaran's database"""
+    global _damodaran_industries_payload, _damodaran_industries_built_at
     from data.damodaran_data import list_available_industries
     
+    if (_damodaran_industries_payload is not None
+            and time() - _damodaran_industries_built_at < DAMODARAN_INDUSTRIES_TTL_SECONDS):
+        response.headers["Cache-Control"] = STATIC_LIST_CACHE_CONTROL
+        return _damodaran_industries_payload
+    
     try:
-        industries = list_available_industries()
-        return {
+        # May download and parse Damodaran's spreadsheet, so keep it off the loop
+        industries = await asyncio.to_thread(list_available_industries)
+        _damodaran_industries_payload = {
             "source": "Damodaran Online (pages.stern.nyu.edu/~adamodar/)",
             "industries": industries,
             "count": len(industries)
         }
+        _damodaran_industries_built_at = time()
+        response.headers["Cache-Control"] = STATIC_LIST_CACHE_CONTROL
+        return _damodaran_industries_payload
     except Exception as e:
         logger.error(f"Failed to fetch Damodaran industries: {e}")
         return {"industries": [], "error": str(e)}
@@ -757,11 +1106,18 @@ async def get_damodaran_assumptions(industry: str):
         raise HTTPException(status_code=500, detail=f"Failed to fetch industry data: {str(e)}")
 
 
+@lru_cache(maxsize=1)
+def _india_erp_for_day(day: int) -> Dict[str, float]:
+    """get_india_erp() memoized per calendar day (day is a date ordinal)"""
+    return get_india_erp()
+
+
 @app.get("/api/damodaran/erp")
 async def get_equity_risk_premium():
     """Get India-specific equity risk premium from Damodaran"""
     try:
-        erp_data = get_india_erp()
+        # May download Damodaran's spreadsheet, so keep it off the loop
+        erp_data = await asyncio.to_thread(_india_erp_for_day, datetime.now().toordinal())
         return {
             "source": "Damodaran Online",
             "country": "India",
@@ -781,70 +1137,85 @@ class CompareRequest(BaseModel):
 @app.post("/api/compare")
 async def compare_companies(request: CompareRequest):
     """Compare multiple companies side-by-side"""
-    try:
-        comparison_data = []
-        
-        for symbol in request.symbols:
-            try:
-                # Fetch data for each company
-                stock_data = await fetch_stock_data(symbol, request.exchange)
-                screener_data = await fetch_screener_data(symbol)
+    async def fetch_company(symbol: str) -> Dict[str, Any]:
+        try:
+            stock_data = await fetch_stock_data(symbol, request.exchange)
+            
+            company_info = stock_data.get('company_info', {})
+            financials = stock_data.get('financials', {})
+            
+            # Extract key metrics for comparison
+            company_metrics = {
+                "symbol": symbol,
+                "name": company_info.get('name', symbol),
+                "sector": company_info.get('sector', 'Unknown'),
+                "market_cap": company_info.get('market_cap', 0),
+                "current_price": company_info.get('current_price', 0),
                 
-                company_info = stock_data.get('company_info', {})
-                financials = stock_data.get('financials', {})
+                # Valuation metrics
+                "pe_ratio": financials.get('pe_ratio', 0),
+                "pb_ratio": financials.get('pb_ratio', 0),
+                "ev_ebitda": financials.get('ev_ebitda', 0),
                 
-                # Extract key metrics for comparison
-                company_metrics = {
-                    "symbol": symbol,
-                    "name": company_info.get('name', symbol),
-                    "sector": company_info.get('sector', 'Unknown'),
-                    "market_cap": company_info.get('market_cap', 0),
-                    "current_price": company_info.get('current_price', 0),
-                    
-                    # Valuation metrics
-                    "pe_ratio": financials.get('pe_ratio', 0),
-                    "pb_ratio": financials.get('pb_ratio', 0),
-                    "ev_ebitda": financials.get('ev_ebitda', 0),
-                    
-                    # Profitability
-                    "revenue": financials.get('revenue', 0),
-                    "ebitda": financials.get('ebitda', 0),
-                    "net_income": financials.get('net_income', 0),
-                    "gross_margin": financials.get('gross_margin', 0),
-                    "ebitda_margin": financials.get('ebitda_margin', 0),
-                    "net_margin": financials.get('net_margin', 0),
-                    "roe": financials.get('roe', 0),
-                    "roce": financials.get('roce', 0),
-                    
-                    # Growth
-                    "revenue_growth": financials.get('revenue_growth', 0),
-                    "profit_growth": financials.get('profit_growth', 0),
-                    
-                    # Debt
-                    "debt_to_equity": financials.get('debt_to_equity', 0),
-                    "interest_coverage": financials.get('interest_coverage', 0),
-                }
+                # Profitability
+                "revenue": financials.get('revenue', 0),
+                "ebitda": financials.get('ebitda', 0),
+                "net_income": financials.get('net_income', 0),
+                "gross_margin": financials.get('gross_margin', 0),
+                "ebitda_margin": financials.get('ebitda_margin', 0),
+                "net_margin": financials.get('net_margin', 0),
+                "roe": financials.get('roe', 0),
+                "roce": financials.get('roce', 0),
                 
-                comparison_data.append(company_metrics)
+                # Growth
+                "revenue_growth": financials.get('revenue_growth', 0),
+                "profit_growth": financials.get('profit_growth', 0),
                 
-            except Exception as e:
-                logger.warning(f"Failed to fetch data for {symbol}: {e}")
-                comparison_data.append({
-                    "symbol": symbol,
-                    "name": symbol,
-                    "error": str(e)
-                })
+                # Debt
+                "debt_to_equity": financials.get('debt_to_equity', 0),
+                "interest_coverage": financials.get('interest_coverage', 0),
+            }
+            
+            return company_metrics
+            
+        except Exception as e:
+            logger.warning(f"Failed to fetch data for {symbol}: {e}")
+            return {
+                "symbol": symbol,
+                "name": symbol,
+                "error": str(e)
+            }
+    
+    try:
+        # Fetch each distinct symbol once, concurrently, then fan the
+        # results back out in request order
+        unique_symbols = list(dict.fromkeys(request.symbols))
+        fetched = dict(zip(unique_symbols, await asyncio.gather(
+            *(fetch_company(symbol) for symbol in unique_symbols)
+        )))
+        comparison_data = [fetched[symbol] for symbol in request.symbols]
         
         # Calculate averages for benchmarking
         metrics_to_average = ['pe_ratio', 'pb_ratio', 'ev_ebitda', 'gross_margin', 
                               'ebitda_margin', 'net_margin', 'roe', 'roce',
                               'revenue_growth', 'profit_growth', 'debt_to_equity']
         
-        averages = {}
-        for metric in metrics_to_average:
-            values = [c.get(metric, 0) for c in comparison_data if c.get(metric) and not c.get('error')]
-            if values:
-                averages[metric] = sum(values) / len(values)
+        # One pass over the companies; missing/zero values don't count
+        totals = dict.fromkeys(metrics_to_average, 0.0)
+        counts = dict.fromkeys(metrics_to_average, 0)
+        for company in comparison_data:
+            if company.get('error'):
+                continue
+            for metric in metrics_to_average:
+                value = company.get(metric)
+                if value:
+                    totals[metric] += value
+                    counts[metric] += 1
+        
+        averages = {
+            metric: totals[metric] / counts[metric]
+            for metric in metrics_to_average if counts[metric]
+        }
         
         return {
             "companies": comparison_data,
@@ -857,29 +1228,34 @@ async def compare_companies(request: CompareRequest):
         raise HTTPException(status_code=500, detail=f"Comparison failed: {str(e)}")
 
 
+# Metrics offered by the compare UI; the response never changes
+COMPARISON_METRICS_PAYLOAD = {
+    "metrics": [
+        {"id": "pe_ratio", "name": "P/E Ratio", "format": "number", "category": "valuation"},
+        {"id": "pb_ratio", "name": "P/B Ratio", "format": "number", "category": "valuation"},
+        {"id": "ev_ebitda", "name": "EV/EBITDA", "format": "number", "category": "valuation"},
+        {"id": "market_cap", "name": "Market Cap", "format": "currency", "category": "size"},
+        {"id": "revenue", "name": "Revenue", "format": "currency", "category": "financials"},
+        {"id": "ebitda", "name": "EBITDA", "format": "currency", "category": "financials"},
+        {"id": "net_income", "name": "Net Income", "format": "currency", "category": "financials"},
+        {"id": "gross_margin", "name": "Gross Margin", "format": "percent", "category": "profitability"},
+        {"id": "ebitda_margin", "name": "EBITDA Margin", "format": "percent", "category": "profitability"},
+        {"id": "net_margin", "name": "Net Margin", "format": "percent", "category": "profitability"},
+        {"id": "roe", "name": "ROE", "format": "percent", "category": "profitability"},
+        {"id": "roce", "name": "ROCE", "format": "percent", "category": "profitability"},
+        {"id": "revenue_growth", "name": "Revenue Growth", "format": "percent", "category": "growth"},
+        {"id": "profit_growth", "name": "Profit Growth", "format": "percent", "category": "growth"},
+        {"id": "debt_to_equity", "name": "Debt/Equity", "format": "number", "category": "leverage"},
+        {"id": "interest_coverage", "name": "Interest Coverage", "format": "number", "category": "leverage"},
+    ]
+}
+
+
 @app.get("/api/compare/metrics")
-async def get_comparison_metrics():
+async def get_comparison_metrics(response: Response):
     """Get list of metrics available for comparison"""
-    return {
-        "metrics": [
-            {"id": "pe_ratio", "name": "P/E Ratio", "format": "number", "category": "valuation"},
-            {"id": "pb_ratio", "name": "P/B Ratio", "format": "number", "category": "valuation"},
-            {"id": "ev_ebitda", "name": "EV/EBITDA", "format": "number", "category": "valuation"},
-            {"id": "market_cap", "name": "Market Cap", "format": "currency", "category": "size"},
-            {"id": "revenue", "name": "Revenue", "format": "currency", "category": "financials"},
-            {"id": "ebitda", "name": "EBITDA", "format": "currency", "category": "financials"},
-            {"id": "net_income", "name": "Net Income", "format": "currency", "category": "financials"},
-            {"id": "gross_margin", "name": "Gross Margin", "format": "percent", "category": "profitability"},
-            {"id": "ebitda_margin", "name": "EBITDA Margin", "format": "percent", "category": "profitability"},
-            {"id": "net_margin", "name": "Net Margin", "format": "percent", "category": "profitability"},
-            {"id": "roe", "name": "ROE", "format": "percent", "category": "profitability"},
-            {"id": "roce", "name": "ROCE", "format": "percent", "category": "profitability"},
-            {"id": "revenue_growth", "name": "Revenue Growth", "format": "percent", "category": "growth"},
-            {"id": "profit_growth", "name": "Profit Growth", "format": "percent", "category": "growth"},
-            {"id": "debt_to_equity", "name": "Debt/Equity", "format": "number", "category": "leverage"},
-            {"id": "interest_coverage", "name": "Interest Coverage", "format": "number", "category": "leverage"},
-        ]
-    }
+    response.headers["Cache-Control"] = STATIC_LIST_CACHE_CONTROL
+    return COMPARISON_METRICS_PAYLOAD
 
 
 @app.get("/api/health")
@@ -931,27 +1307,51 @@ async def get_ma_template(template_id: str):
 
 # ======================= EXPORT API =======================
 
+def _export_is_cached(artifact_path: str, source_path: Optional[str] = None) -> bool:
+    """
+    Whether an export built by an earlier request can be served as-is.
+    Completed jobs never change, so an artifact at least as new as the
+    model it was built from is still current.
+    """
+    try:
+        built_at = os.stat(artifact_path).st_mtime
+    except OSError:
+        return False
+    if source_path is None:
+        return True
+    try:
+        return built_at >= os.stat(source_path).st_mtime
+    except OSError:
+        return True
+
+
+# Availability is probed once at startup with find_spec, so neither this
+# endpoint nor startup has to import reportlab or python-pptx to answer it
+EXPORT_FORMATS_PAYLOAD = {
+    "formats": [
+        {"id": "xlsx", "name": "Excel", "extension": ".xlsx", "available": True, "description": "Full financial model"},
+        {"id": "xlsm", "name": "Excel with VBA", "extension": ".xlsm", "available": XLSM_AVAILABLE,
+         "description": "Macro-enabled workbook with VBA automation"},
+        {"id": "pdf", "name": "PDF", "extension": ".pdf",
+         "available": importlib.util.find_spec("reportlab") is not None, "description": "Executive summary report"},
+        {"id": "pptx", "name": "PowerPoint", "extension": ".pptx",
+         "available": importlib.util.find_spec("pptx") is not None, "description": "Presentation slides"},
+    ]
+}
+
+
 @app.get("/api/export/formats")
-async def get_export_formats():
+async def get_export_formats(response: Response):
     """Get available export formats"""
-    return {
-        "formats": [
-            {"id": "xlsx", "name": "Excel", "extension": ".xlsx", "available": True, "description": "Full financial model"},
-            {"id": "pdf", "name": "PDF", "extension": ".pdf", "available": True, "description": "Executive summary report"},
-            {"id": "pptx", "name": "PowerPoint", "extension": ".pptx", "available": True, "description": "Presentation slides"},
-        ]
-    }
+    response.headers["Cache-Control"] = STATIC_LIST_CACHE_CONTROL
+    return EXPORT_FORMATS_PAYLOAD
 
 
 @app.get("/api/export/{job_id}/pdf")
 async def export_to_pdf(job_id: str):
     """Export model to PDF"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    if job["status"] != "completed":
-        raise HTTPException(status_code=400, detail="Model not ready for export")
+    from exporters import pdf_exporter
+    job = _require_ready(job_id, "Model not ready for export")
     
     excel_path = job.get("file_path")
     if not excel_path or not os.path.exists(excel_path):
@@ -960,17 +1360,23 @@ async def export_to_pdf(job_id: str):
     try:
         # Generate PDF using exporter
         pdf_path = excel_path.replace('.xlsx', '_report.pdf')
-        pdf_exporter.create_pdf_report(
-            company_name=job.get("company_name", "Company"),
-            excel_path=excel_path,
-            output_path=pdf_path
-        )
+        if not _export_is_cached(pdf_path, excel_path):
+            success = await asyncio.to_thread(
+                pdf_exporter.create_pdf_report,
+                company_name=job.get("company_name", "Company"),
+                excel_path=excel_path,
+                output_path=pdf_path
+            )
+            if not success:
+                raise HTTPException(status_code=500, detail="PDF export failed")
         
-        return FileResponse(
+        return DownloadResponse(
             path=pdf_path,
             filename=os.path.basename(pdf_path),
             media_type="application/pdf"
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"PDF export failed: {e}")
         raise HTTPException(status_code=500, detail=f"PDF export failed: {str(e)}")
@@ -979,12 +1385,8 @@ async def export_to_pdf(job_id: str):
 @app.get("/api/export/{job_id}/pptx")
 async def export_to_pptx(job_id: str):
     """Export model to PowerPoint"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    if job["status"] != "completed":
-        raise HTTPException(status_code=400, detail="Model not ready for export")
+    from exporters import pptx_exporter
+    job = _require_ready(job_id, "Model not ready for export")
     
     excel_path = job.get("file_path")
     if not excel_path or not os.path.exists(excel_path):
@@ -993,17 +1395,21 @@ async def export_to_pptx(job_id: str):
     try:
         # Generate PPTX using exporter
         pptx_path = excel_path.replace('.xlsx', '_presentation.pptx')
-        pptx_exporter.create_presentation(
-            company_name=job.get("company_name", "Company"),
-            excel_path=excel_path,
-            output_path=pptx_path
-        )
+        if not _export_is_cached(pptx_path, excel_path):
+            success = await asyncio.to_thread(
+                pptx_exporter.create_presentation,
+                job.get("company_name", "Company"), excel_path, pptx_path
+            )
+            if not success:
+                raise HTTPException(status_code=500, detail="PPTX export failed")
         
-        return FileResponse(
+        return DownloadResponse(
             path=pptx_path,
             filename=os.path.basename(pptx_path),
             media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation"
         )
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"PPTX export failed: {e}")
         raise HTTPException(status_code=500, detail=f"PPTX export failed: {str(e)}")
@@ -1011,27 +1417,52 @@ async def export_to_pptx(job_id: str):
 
 # ======================= EXCEL PREVIEW API =======================
 
-@app.post("/api/model/preview-excel")
-async def preview_excel(file: UploadFile = File(...)):
-    """Preview uploaded Excel file data before processing using openpyxl"""
+# Sheet-name keywords for each statement, in priority order (a sheet named
+# "Cash & Balance" is a balance sheet, "Profit & Cash" an income statement)
+PREVIEW_SHEET_KEYWORDS = (
+    ("income_statement", ("income", "p&l", "profit")),
+    ("balance_sheet", ("balance",)),
+    ("cash_flow", ("cash",)),
+)
+_PREVIEW_SHEET_RE = re.compile(
+    "|".join(re.escape(word) for _, words in PREVIEW_SHEET_KEYWORDS for word in words),
+    re.IGNORECASE,
+)
+# keyword -> (priority, statement key)
+_PREVIEW_SHEET_BUCKETS = {
+    word: (priority, key)
+    for priority, (key, words) in enumerate(PREVIEW_SHEET_KEYWORDS)
+    for word in words
+}
+
+
+def _preview_sheet_key(sheet_name: str) -> Optional[str]:
+    """Map a sheet name to the financial statement it holds, if any"""
+    # One regex pass finds every keyword; the highest-priority one wins
+    matches = _PREVIEW_SHEET_RE.findall(sheet_name)
+    if not matches:
+        return None
+    return min(_PREVIEW_SHEET_BUCKETS[word.lower()] for word in matches)[1]
+
+
+def _build_excel_preview(source, filename: str) -> Dict[str, Any]:
+    """Read the header and first 5 data rows of each statement sheet"""
+    import openpyxl
+    
+    # read_only parses rows lazily, so only the rows sampled here are loaded
+    wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
     try:
-        import io
-        import openpyxl
-        
-        contents = await file.read()
-        
-        # Read Excel file using openpyxl
-        wb = openpyxl.load_workbook(io.BytesIO(contents), data_only=True)
-        
         preview_data = {
-            "filename": file.filename,
+            "filename": filename,
             "sheets": wb.sheetnames,
             "data": {}
         }
         
         # Extract key financial data from sheets
         for sheet_name in wb.sheetnames:
-            sheet_lower = sheet_name.lower()
+            key = _preview_sheet_key(sheet_name)
+            if not key:
+                continue
             sheet = wb[sheet_name]
             
             # Helper to get first 5 rows and 5 columns
@@ -1040,30 +1471,28 @@ async def preview_excel(file: UploadFile = File(...)):
                 continue
                 
             headers = [str(cell) if cell is not None else f"Col{i}" for i, cell in enumerate(rows[0])]
-            data_rows = []
-            for row in rows[1:]:
-                row_dict = {}
-                for i, cell in enumerate(row):
-                    if i < len(headers):
-                        row_dict[headers[i]] = cell
-                data_rows.append(row_dict)
-
-            key = None
-            if 'income' in sheet_lower or 'p&l' in sheet_lower or 'profit' in sheet_lower:
-                key = "income_statement"
-            elif 'balance' in sheet_lower:
-                key = "balance_sheet"
-            elif 'cash' in sheet_lower:
-                key = "cash_flow"
+            data_rows = [dict(zip(headers, row)) for row in rows[1:]]
             
-            if key:
-                preview_data["data"][key] = {
-                    "rows": sheet.max_row,
-                    "columns": headers,
-                    "sample": data_rows
-                }
+            preview_data["data"][key] = {
+                # From the sheet's stored dimensions; no full scan in read_only mode
+                "rows": sheet.max_row,
+                "columns": headers,
+                "sample": data_rows
+            }
         
         return preview_data
+    finally:
+        wb.close()
+
+
+@app.post("/api/model/preview-excel")
+async def preview_excel(file: UploadFile = File(...)):
+    """Preview uploaded Excel file data before processing using openpyxl"""
+    try:
+        # Parse straight from Starlette's spooled temp file rather than
+        # copying the whole upload into memory first
+        await file.seek(0)
+        return await asyncio.to_thread(_build_excel_preview, file.file, file.filename)
         
     except Exception as e:
         logger.error(f"Excel preview failed: {e}")
@@ -1072,19 +1501,23 @@ async def preview_excel(file: UploadFile = File(...)):
 
 # ======================= MONTE CARLO API =======================
 
+async def _run_monte_carlo_in_pool(**kwargs) -> Dict[str, Any]:
+    """Run run_monte_carlo_simulation off the event loop"""
+    from analysis.monte_carlo import run_monte_carlo_simulation
+    return await _run_in_cpu_pool(run_monte_carlo_simulation, **kwargs)
+
+
 @app.get("/api/analysis/monte-carlo/{job_id}")
 async def run_monte_carlo_endpoint(job_id: str, simulations: int = 1000):
     """Run Monte Carlo simulation on a completed model"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = _require_ready(job_id, "Model not ready for simulation")
+    if simulations < 1:
+        raise HTTPException(status_code=400, detail="simulations must be at least 1")
     
-    job = jobs[job_id]
-    if job["status"] != "completed":
-        raise HTTPException(status_code=400, detail="Model not ready for simulation")
+    # Cap at 10k for performance
+    simulations = min(simulations, 10000)
     
     try:
-        from analysis.monte_carlo import run_monte_carlo_simulation
-        
         company_name = job.get("company_name", "Company")
         
         # Extract assumptions from job data or use defaults
@@ -1105,17 +1538,16 @@ async def run_monte_carlo_endpoint(job_id: str, simulations: int = 1000):
             'net_debt': job.get('valuation', {}).get('net_debt', 2000),
         }
         
-        # Run simulation (cap at 10k for performance)
-        results = run_monte_carlo_simulation(
+        results = await _run_monte_carlo_in_pool(
             base_assumptions=base_assumptions,
             base_valuation=base_valuation,
-            num_simulations=min(simulations, 10000)
+            num_simulations=simulations
         )
         
         return {
             "job_id": job_id,
             "company_name": company_name,
-            "simulations": min(simulations, 10000),
+            "simulations": simulations,
             "results": results
         }
     except Exception as e:
@@ -1163,11 +1595,14 @@ class SaveProjectRequest(BaseModel):
     configuration: Dict[str, Any]
 
 
+# SQLite calls can wait on another worker's write lock, so the project
+# handlers run them in the thread pool, where each thread keeps its own
+# long-lived connection (see database.get_connection)
 @app.get("/api/projects")
 async def list_projects():
     """Get all saved projects"""
     from database import get_all_projects
-    projects = get_all_projects()
+    projects = await asyncio.to_thread(get_all_projects)
     return {"projects": projects}
 
 
@@ -1175,7 +1610,7 @@ async def list_projects():
 async def get_project_endpoint(project_id: int):
     """Get a specific project"""
     from database import get_project
-    project = get_project(project_id)
+    project = await asyncio.to_thread(get_project, project_id)
     if not project:
         raise HTTPException(status_code=404, detail="Project not found")
     return project
@@ -1185,7 +1620,8 @@ async def get_project_endpoint(project_id: int):
 async def create_project(request: SaveProjectRequest):
     """Create a new saved project"""
     from database import save_project
-    project = save_project(
+    project = await asyncio.to_thread(
+        save_project,
         name=request.name,
         configuration=request.configuration,
         project_type=request.project_type,
@@ -1198,7 +1634,8 @@ async def create_project(request: SaveProjectRequest):
 async def update_project_endpoint(project_id: int, request: SaveProjectRequest):
     """Update an existing project"""
     from database import update_project
-    project = update_project(
+    project = await asyncio.to_thread(
+        update_project,
         project_id=project_id,
         name=request.name,
         configuration=request.configuration,
@@ -1213,7 +1650,7 @@ async def update_project_endpoint(project_id: int, request: SaveProjectRequest):
 async def delete_project_endpoint(project_id: int):
     """Delete a saved project"""
     from database import delete_project
-    if not delete_project(project_id):
+    if not await asyncio.to_thread(delete_project, project_id):
         raise HTTPException(status_code=404, detail="Project not found")
     return {"deleted": True, "id": project_id}
 
@@ -1221,29 +1658,45 @@ async def delete_project_endpoint(project_id: int):
 # ======================= RATE LIMITING =======================
 
 # Simple in-memory rate limiter (for production use Redis)
-from collections import defaultdict
-from time import time
+from collections import deque
 
-_rate_limit_store = defaultdict(list)
+# client_ip:endpoint -> request timestamps, oldest first
+_rate_limit_store: Dict[str, deque] = {}
+_rate_limit_last_sweep = 0.0
 RATE_LIMIT_REQUESTS = 10  # Max requests per minute
 RATE_LIMIT_WINDOW = 60  # Window in seconds
 
 
+def _sweep_rate_limit_store(window_start: float) -> None:
+    """Drop clients with no requests inside the current window"""
+    stale = [key for key, dq in _rate_limit_store.items() if not dq or dq[-1] <= window_start]
+    for key in stale:
+        del _rate_limit_store[key]
+
+
 def check_rate_limit(client_ip: str, endpoint: str = "default") -> bool:
     """Check if client has exceeded rate limit"""
+    global _rate_limit_last_sweep
     key = f"{client_ip}:{endpoint}"
     current_time = time()
     window_start = current_time - RATE_LIMIT_WINDOW
     
-    # Clean old entries
-    _rate_limit_store[key] = [t for t in _rate_limit_store[key] if t > window_start]
+    # Forget idle clients about once per window so the store stays bounded
+    if current_time - _rate_limit_last_sweep >= RATE_LIMIT_WINDOW:
+        _sweep_rate_limit_store(window_start)
+        _rate_limit_last_sweep = current_time
+    
+    # Clean old entries from the front
+    dq = _rate_limit_store.setdefault(key, deque())
+    while dq and dq[0] <= window_start:
+        dq.popleft()
     
     # Check if over limit
-    if len(_rate_limit_store[key]) >= RATE_LIMIT_REQUESTS:
+    if len(dq) >= RATE_LIMIT_REQUESTS:
         return False
     
     # Record this request
-    _rate_limit_store[key].append(current_time)
+    dq.append(current_time)
     return True
 
 
@@ -1305,21 +1758,24 @@ async def generate_lbo_model_endpoint(request: LBORequest, background_tasks: Bac
 
 async def _generate_lbo_model_task(job_id: str, request: LBORequest):
     """Background task to generate the LBO model"""
+    from excel.lbo_generator import generate_lbo_model
+    output_path = None
     try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["progress"] = 10
-        jobs[job_id]["message"] = "Fetching financial data..."
+        jobs.update(job_id, status="processing", progress=10, message="Fetching financial data...")
         
         # Step 1: Fetch company data
         logger.info(f"Fetching data for LBO model: {request.symbol}")
         yahoo_data = await fetch_stock_data(request.symbol, request.exchange)
         
         company_info = yahoo_data.get('company_info', {})
-        jobs[job_id]["company_name"] = company_info.get('name', request.symbol)
-        jobs[job_id]["industry"] = company_info.get('industry', 'Unknown')
-        
-        jobs[job_id]["progress"] = 30
-        jobs[job_id]["message"] = "Preparing LBO assumptions..."
+        company_name = company_info.get('name', request.symbol)
+        jobs.update(
+            job_id,
+            company_name=company_name,
+            industry=company_info.get('industry', 'Unknown'),
+            progress=30,
+            message="Preparing LBO assumptions...",
+        )
         
         # Step 2: Extract financial data
         income_stmt = yahoo_data.get('income_statement', {})
@@ -1362,48 +1818,44 @@ async def _generate_lbo_model_task(job_id: str, request: LBORequest):
             'sector': company_info.get('sector', 'General'),
         }
         
-        jobs[job_id]["progress"] = 50
-        jobs[job_id]["message"] = "Generating LBO model structure..."
-        
         # Step 4: Generate LBO Excel file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{request.symbol}_LBO_{timestamp}.xlsx"
-        output_path = os.path.join(OUTPUT_DIR, filename)
+        output_path, filename = _reserve_output_path(f"{_safe_name(request.symbol)}_LBO_")
         
-        jobs[job_id]["progress"] = 70
-        jobs[job_id]["message"] = "Building Excel model with debt schedules..."
+        jobs.update(job_id, progress=70, message="Building Excel model with debt schedules...")
         
-        generate_lbo_model(
-            company_name=company_info.get('name', request.symbol),
+        await _run_in_cpu_pool(
+            generate_lbo_model,
+            company_name=company_name,
             financial_data=financial_data,
             lbo_assumptions=lbo_assumptions,
             industry_info=industry_info,
             output_path=output_path,
         )
         
-        jobs[job_id]["progress"] = 90
-        jobs[job_id]["message"] = "Finalizing LBO model..."
-        
         # Complete
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["progress"] = 100
-        jobs[job_id]["message"] = "LBO model generated successfully!"
-        jobs[job_id]["file_path"] = output_path
-        jobs[job_id]["filename"] = filename
-        jobs[job_id]["download_url"] = f"/api/download/{job_id}"
-        jobs[job_id]["lbo_summary"] = {
-            "entry_ev": base_ebitda * request.entry_multiple,
-            "total_debt": base_ebitda * (request.senior_debt_multiple + request.mezz_debt_multiple + request.sub_debt_multiple),
-            "holding_period": request.holding_period,
-        }
+        total_debt_multiple = request.senior_debt_multiple + request.mezz_debt_multiple + request.sub_debt_multiple
+        jobs.update(
+            job_id,
+            status="completed",
+            progress=100,
+            message="LBO model generated successfully!",
+            file_path=output_path,
+            filename=filename,
+            download_url=f"/api/download/{job_id}",
+            lbo_summary={
+                "entry_ev": base_ebitda * request.entry_multiple,
+                "total_debt": base_ebitda * total_debt_multiple,
+                "holding_period": request.holding_period,
+            },
+        )
         
         logger.info(f"LBO model generated successfully: {filename}")
         
     except Exception as e:
         logger.error(f"Error generating LBO model for job {job_id}: {e}")
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["message"] = f"Error: {str(e)}"
-        jobs[job_id]["progress"] = 0
+        if output_path is not None:
+            _discard_output(output_path)
+        jobs.update(job_id, status="failed", message=f"Error: {str(e)}", progress=0)
 
 
 # ======================= M&A MODEL GENERATION =======================
@@ -1453,23 +1905,19 @@ async def generate_ma_model_endpoint(request: MARequest, background_tasks: Backg
 
 async def _generate_ma_model_task(job_id: str, request: MARequest):
     """Background task to generate the M&A model"""
+    from excel.ma_generator import generate_ma_model
+    output_path = None
     try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["progress"] = 10
-        jobs[job_id]["message"] = "Fetching acquirer data..."
+        jobs.update(job_id, status="processing", progress=10, message="Fetching acquirer & target data...")
         
-        # Step 1: Fetch acquirer data
+        # Steps 1-2: Fetch acquirer and target data concurrently
         logger.info(f"Fetching data for M&A model: {request.acquirer_symbol} + {request.target_symbol}")
-        acquirer_yahoo = await fetch_stock_data(request.acquirer_symbol, request.exchange)
-        
-        jobs[job_id]["progress"] = 25
-        jobs[job_id]["message"] = "Fetching target data..."
-        
-        # Step 2: Fetch target data
-        target_yahoo = await fetch_stock_data(request.target_symbol, request.exchange)
+        acquirer_yahoo, target_yahoo = await asyncio.gather(
+            fetch_stock_data(request.acquirer_symbol, request.exchange),
+            fetch_stock_data(request.target_symbol, request.exchange),
+        )
         
-        jobs[job_id]["progress"] = 40
-        jobs[job_id]["message"] = "Preparing M&A assumptions..."
+        jobs.update(job_id, progress=40, message="Preparing M&A assumptions...")
         
         # Step 3: Extract financials
         acq_info = acquirer_yahoo.get('company_info', {})
@@ -1499,7 +1947,7 @@ async def _generate_ma_model_task(job_id: str, request: MARequest):
             'total_debt': tgt_metrics.get('total_debt', 0),
         }
         
-        jobs[job_id]["company_name"] = f"{request.acquirer_symbol} + {request.target_symbol}"
+        jobs.update(job_id, company_name=f"{request.acquirer_symbol} + {request.target_symbol}")
         
         # Step 4: Build transaction assumptions
         transaction_assumptions = {
@@ -1518,84 +1966,96 @@ async def _generate_ma_model_task(job_id: str, request: MARequest):
             'target_growth_rate': request.target_growth_rate,
         }
         
-        jobs[job_id]["progress"] = 60
-        jobs[job_id]["message"] = "Generating M&A model structure..."
-        
         # Step 5: Generate M&A Excel file
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        filename = f"{request.acquirer_symbol}_{request.target_symbol}_MA_{timestamp}.xlsx"
-        output_path = os.path.join(OUTPUT_DIR, filename)
+        output_path, filename = _reserve_output_path(
+            f"{_safe_name(request.acquirer_symbol)}_{_safe_name(request.target_symbol)}_MA_"
+        )
         
-        jobs[job_id]["progress"] = 75
-        jobs[job_id]["message"] = "Building accretion/dilution analysis..."
+        jobs.update(job_id, progress=75, message="Building accretion/dilution analysis...")
         
-        generate_ma_model(
+        await _run_in_cpu_pool(
+            generate_ma_model,
             acquirer_data=acquirer_data,
             target_data=target_data,
             transaction_assumptions=transaction_assumptions,
             output_path=output_path,
         )
         
-        jobs[job_id]["progress"] = 90
-        jobs[job_id]["message"] = "Finalizing M&A model..."
-        
         # Complete
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["progress"] = 100
-        jobs[job_id]["message"] = "M&A model generated successfully!"
-        jobs[job_id]["file_path"] = output_path
-        jobs[job_id]["filename"] = filename
-        jobs[job_id]["download_url"] = f"/api/download/{job_id}"
-        jobs[job_id]["ma_summary"] = {
-            "acquirer": request.acquirer_symbol,
-            "target": request.target_symbol,
-            "offer_premium": request.offer_premium,
-            "consideration_mix": f"{request.percent_stock*100:.0f}% Stock / {request.percent_cash*100:.0f}% Cash",
-        }
+        jobs.update(
+            job_id,
+            status="completed",
+            progress=100,
+            message="M&A model generated successfully!",
+            file_path=output_path,
+            filename=filename,
+            download_url=f"/api/download/{job_id}",
+            ma_summary={
+                "acquirer": request.acquirer_symbol,
+                "target": request.target_symbol,
+                "offer_premium": request.offer_premium,
+                "consideration_mix": f"{request.percent_stock*100:.0f}% Stock / {request.percent_cash*100:.0f}% Cash",
+            },
+        )
         
         logger.info(f"M&A model generated successfully: {filename}")
         
     except Exception as e:
         logger.error(f"Error generating M&A model for job {job_id}: {e}")
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["message"] = f"Error: {str(e)}"
-        jobs[job_id]["progress"] = 0
+        if output_path is not None:
+            _discard_output(output_path)
+        jobs.update(job_id, status="failed", message=f"Error: {str(e)}", progress=0)
 
 
 # ======================= STOCK DATABASE ENDPOINTS =======================
 
-@app.get("/api/stocks")
-async def list_all_stocks(sector: Optional[str] = None):
-    """Get all available stocks, optionally filtered by sector"""
-    if sector:
-        stocks = get_stocks_by_sector(sector)
+# The stock database is fixed for the life of the process, so each distinct
+# list response is serialized once and revalidated by ETag
+STOCK_LIST_CACHE_CONTROL = "public, max-age=300"
+
+
+@lru_cache(maxsize=256)
+def _stock_list_body(kind: str, arg: str = "") -> tuple:
+    """Serialized body and ETag for a stock list endpoint"""
+    if kind == "search":
+        results = search_stocks(arg)
+        payload = {"count": len(results), "results": results}
+    elif kind == "sectors":
+        sectors = get_sectors()
+        payload = {"sectors": sectors, "count": len(sectors)}
     else:
-        stocks = get_all_stocks()
+        stocks = get_stocks_by_sector(arg) if arg else get_all_stocks()
+        payload = {"count": len(stocks), "stocks": stocks}
     
-    return {
-        "count": len(stocks),
-        "stocks": stocks,
-    }
+    body = orjson.dumps(payload)
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def _etag_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """Return the cached body, or 304 if the client already holds this ETag"""
+    headers = {"ETag": etag, "Cache-Control": STOCK_LIST_CACHE_CONTROL}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+@app.get("/api/stocks")
+async def list_all_stocks(request: Request, sector: Optional[str] = None):
+    """Get all available stocks, optionally filtered by sector"""
+    return _etag_json_response(request, *_stock_list_body("sector", sector or ""))
 
 
 @app.get("/api/stocks/search/{query}")
-async def search_for_stocks(query: str):
+async def search_for_stocks(request: Request, query: str):
     """Search stocks by symbol or name"""
-    results = search_stocks(query)
-    return {
-        "count": len(results),
-        "results": results,
-    }
+    # search_stocks is case-insensitive, so share one entry per spelling
+    return _etag_json_response(request, *_stock_list_body("search", query.upper()))
 
 
 @app.get("/api/sectors")
-async def list_sectors():
+async def list_sectors(request: Request):
     """Get all available sectors"""
-    sectors = get_sectors()
-    return {
-        "sectors": sectors,
-        "count": len(sectors),
-    }
+    return _etag_json_response(request, *_stock_list_body("sectors"))
 
 
 # ======================= RAW DATA MODEL GENERATION =======================
@@ -1647,6 +2107,18 @@ async def generate_model_from_raw_data(request: RawDataRequest, background_tasks
     )
 
 
+@lru_cache(maxsize=64)
+def _industry_info(industry: str) -> MappingProxyType:
+    """Read-only industry info for a template code, built once per industry"""
+    template = INDUSTRY_TEMPLATES.get(industry, INDUSTRY_TEMPLATES['general'])
+    return MappingProxyType({
+        'industry_name': template['name'],
+        'industry_code': industry,
+        'model_type': template['model_type'],
+        'key_metrics': tuple(template['key_metrics']),
+    })
+
+
 async def _generate_model_from_raw_task(
     job_id: str,
     company_name: str,
@@ -1656,10 +2128,9 @@ async def _generate_model_from_raw_task(
     assumptions: Dict[str, float],
 ):
     """Background task to generate model from raw data"""
+    output_path = None
     try:
-        jobs[job_id]["status"] = "processing"
-        jobs[job_id]["progress"] = 20
-        jobs[job_id]["message"] = "Processing raw data..."
+        jobs.update(job_id, status="processing", progress=20, message="Processing raw data...")
         
         # Build financial data structure
         financial_data = {
@@ -1678,24 +2149,18 @@ async def _generate_model_from_raw_task(
         if assumptions:
             financial_data['user_assumptions'] = assumptions
         
-        jobs[job_id]["progress"] = 40
-        jobs[job_id]["message"] = "Building industry template..."
+        jobs.update(job_id, progress=40, message="Building industry template...")
         
-        # Get industry info
-        from agents.industry_classifier import INDUSTRY_TEMPLATES
-        industry_template = INDUSTRY_TEMPLATES.get(industry, INDUSTRY_TEMPLATES['general'])
+        # Get industry info (copied so the generators can't touch the cached entry)
+        industry_info = dict(_industry_info(industry))
         
-        industry_info = {
-            'industry_name': industry_template['name'],
-            'industry_code': industry,
-            'model_type': industry_template['model_type'],
-            'key_metrics': industry_template['key_metrics'],
-        }
-        
-        jobs[job_id]["company_name"] = company_name
-        jobs[job_id]["industry"] = industry_info['industry_name']
-        jobs[job_id]["progress"] = 55
-        jobs[job_id]["message"] = "Creating model structure..."
+        jobs.update(
+            job_id,
+            company_name=company_name,
+            industry=industry_info['industry_name'],
+            progress=55,
+            message="Creating model structure...",
+        )
         
         # Create model structure
         model_structure = create_model_structure(
@@ -1712,16 +2177,13 @@ async def _generate_model_from_raw_task(
                 if assumption_name in assumptions:
                     key_assumption['default_value'] = assumptions[assumption_name]
         
-        jobs[job_id]["progress"] = 70
-        jobs[job_id]["message"] = "Generating Excel model..."
+        jobs.update(job_id, progress=70, message="Generating Excel model...")
         
         # Generate Excel
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        safe_name = "".join(c for c in company_name if c.isalnum() or c in (' ', '-', '_')).strip()[:30]
-        filename = f"{safe_name}_{industry}_{timestamp}.xlsx"
-        output_path = os.path.join(OUTPUT_DIR, filename)
+        output_path, filename = _reserve_output_path(f"{_safe_name(company_name)}_{_safe_name(industry)}_")
         
-        generate_financial_model(
+        await _run_in_cpu_pool(
+            generate_financial_model,
             company_name=company_name,
             model_structure=model_structure,
             financial_data=financial_data,
@@ -1729,37 +2191,24 @@ async def _generate_model_from_raw_task(
             output_path=output_path,
         )
         
-        jobs[job_id]["progress"] = 90
-        jobs[job_id]["message"] = "Validating model..."
-        
-        # Validate
-        validation_data = {
-            'income_statement': financial_data.get('income_statement', {}),
-            'balance_sheet': financial_data.get('balance_sheet', {}),
-            'cash_flow': financial_data.get('cash_flow', {}),
-            'assumptions': assumptions,
-        }
-        is_valid, errors = validate_financial_model(validation_data, industry)
-        
-        # Complete
-        jobs[job_id]["status"] = "completed"
-        jobs[job_id]["progress"] = 100
-        jobs[job_id]["message"] = "Model generated successfully from raw data!"
-        jobs[job_id]["file_path"] = output_path
-        jobs[job_id]["filename"] = filename
-        jobs[job_id]["validation"] = {
-            "is_valid": is_valid,
-            "errors": errors[:5] if errors else [],
-        }
-        jobs[job_id]["download_url"] = f"/api/download/{job_id}"
+        # Complete (validation runs on demand via /api/job/{job_id}/validate)
+        jobs.update(
+            job_id,
+            status="completed",
+            progress=100,
+            message="Model generated successfully from raw data!",
+            file_path=output_path,
+            filename=filename,
+            download_url=f"/api/download/{job_id}",
+        )
         
         logger.info(f"Model generated from raw data: {filename}")
         
     except Exception as e:
         logger.error(f"Error generating model from raw data for job {job_id}: {e}")
-        jobs[job_id]["status"] = "failed"
-        jobs[job_id]["message"] = f"Error: {str(e)}"
-        jobs[job_id]["progress"] = 0
+        if output_path is not None:
+            _discard_output(output_path)
+        jobs.update(job_id, status="failed", message=f"Error: {str(e)}", progress=0)
 
 
 # ======================= EXCEL FILE UPLOAD =======================
@@ -1788,17 +2237,23 @@ async def generate_model_from_excel(
     job_id = str(uuid.uuid4())
     
     try:
-        # Save uploaded file temporarily
-        with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
-            content = await file.read()
-            tmp.write(content)
-            tmp_path = tmp.name
-        
-        # Parse the Excel file
-        extracted_data = _parse_excel_file(tmp_path)
-        
-        # Clean up temp file
-        os.unlink(tmp_path)
+        # Copy Starlette's spooled upload to disk in chunks and parse it,
+        # both in a worker thread so neither blocks the event loop. Re-uploads
+        # of the same bytes reuse the earlier parse.
+        await file.seek(0)
+        tmp_path, digest = await asyncio.to_thread(_save_upload_to_temp, file.file)
+        try:
+            extracted_data = _excel_parse_cache.get(digest)
+            if extracted_data is None:
+                extracted_data = await asyncio.to_thread(_parse_excel_file, tmp_path)
+                _excel_parse_cache[digest] = extracted_data
+                if len(_excel_parse_cache) > EXCEL_PARSE_CACHE_SIZE:
+                    _excel_parse_cache.popitem(last=False)
+            else:
+                _excel_parse_cache.move_to_end(digest)
+        finally:
+            os.unlink(tmp_path)
+        extracted_data = copy.deepcopy(extracted_data)
         
         # Use extracted company name if available
         if extracted_data.get('company_name'):
@@ -1813,6 +2268,9 @@ async def generate_model_from_excel(
                 "industry": industry,
                 "forecast_years": forecast_years,
                 "source": "excel_upload",
+                # Kept with the job so /api/job/{job_id}/validate can check it
+                "historical_data": extracted_data.get('historical_data', {}),
+                "assumptions": extracted_data.get('assumptions', {}),
             },
             "progress": 0,
             "message": "Job queued",
@@ -1841,6 +2299,64 @@ async def generate_model_from_excel(
         raise HTTPException(status_code=400, detail=f"Failed to parse Excel file: {str(e)}")
 
 
+UPLOAD_COPY_CHUNK_SIZE = 1024 * 1024
+
+# Parsed uploads keyed by content digest, most recently used last
+EXCEL_PARSE_CACHE_SIZE = 128
+_excel_parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+
+
+def _save_upload_to_temp(source) -> tuple:
+    """
+    Stream an uploaded file object to a temp .xlsx file, hashing it on the
+    way; returns (path, hex digest)
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.xlsx') as tmp:
+        while chunk := source.read(UPLOAD_COPY_CHUNK_SIZE):
+            digest.update(chunk)
+            tmp.write(chunk)
+        return tmp.name, digest.hexdigest()
+
+
+# Row-label aliases for uploaded statements (matched case-insensitively)
+EXCEL_INCOME_ALIASES = {
+    'revenue': ['revenue', 'sales', 'total revenue', 'net sales', 'total sales', 'income', 'turnover'],
+    'ebitda': ['ebitda', 'operating profit before depreciation', 'pbdit'],
+    'net_income': ['net income', 'net profit', 'profit after tax', 'pat', 'bottom line', 'net profit after tax'],
+    'operating_income': ['operating income', 'operating profit', 'ebit', 'pbit'],
+    'gross_profit': ['gross profit', 'gross margin'],
+}
+
+EXCEL_BALANCE_ALIASES = {
+    'total_assets': ['total assets', 'assets', 'total asset'],
+    'total_liabilities': ['total liabilities', 'liabilities', 'total liability', 'total debt'],
+    'total_equity': ['total equity', 'shareholders equity', 'shareholder equity', 'net worth', 'networth'],
+    'cash': ['cash', 'cash and equivalents', 'cash & equivalents', 'cash and bank'],
+    'debt': ['total debt', 'borrowings', 'long term debt', 'short term debt'],
+}
+
+
+def _compile_alias_matcher(aliases: Dict[str, List[str]]):
+    """
+    Build a (regex, alias -> field) pair that finds the field for a label
+    in one scan. Longer aliases are tried first, so 'net income' matches
+    net_income rather than the 'income' alias of revenue.
+    """
+    alias_to_field = {}
+    for field, names in aliases.items():
+        for name in names:
+            alias_to_field.setdefault(name, field)
+    pattern = re.compile("|".join(
+        re.escape(name) for name in sorted(alias_to_field, key=len, reverse=True)
+    ))
+    return pattern, alias_to_field
+
+
+_INCOME_ALIAS_RE, _INCOME_ALIAS_FIELDS = _compile_alias_matcher(EXCEL_INCOME_ALIASES)
+_BALANCE_ALIAS_RE, _BALANCE_ALIAS_FIELDS = _compile_alias_matcher(EXCEL_BALANCE_ALIASES)
+
+
 def _parse_excel_file(file_path: str) -> Dict[str, Any]:
     """
     Parse an uploaded Excel file and extract financial data
@@ -1850,7 +2366,9 @@ def _parse_excel_file(file_path: str) -> Dict[str, Any]:
     - Multiple sheets (Income Statement, Balance Sheet, etc.)
     - Screener.in or similar export formats
     """
-    wb = openpyxl.load_workbook(file_path, data_only=True)
+    import openpyxl
+    # read_only parses rows lazily; values_only below skips Cell objects entirely
+    wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
     
     extracted = {
         'company_name': None,
@@ -1861,88 +2379,70 @@ def _parse_excel_file(file_path: str) -> Dict[str, Any]:
         'assumptions': {},
     }
     
-    # Common financial data field mappings (case-insensitive)
-    income_mappings = {
-        'revenue': ['revenue', 'sales', 'total revenue', 'net sales', 'total sales', 'income', 'turnover'],
-        'ebitda': ['ebitda', 'operating profit before depreciation', 'pbdit'],
-        'net_income': ['net income', 'net profit', 'profit after tax', 'pat', 'bottom line', 'net profit after tax'],
-        'operating_income': ['operating income', 'operating profit', 'ebit', 'pbit'],
-        'gross_profit': ['gross profit', 'gross margin'],
-    }
-    
-    balance_mappings = {
-        'total_assets': ['total assets', 'assets', 'total asset'],
-        'total_liabilities': ['total liabilities', 'liabilities', 'total liability', 'total debt'],
-        'total_equity': ['total equity', 'shareholders equity', 'shareholder equity', 'net worth', 'networth'],
-        'cash': ['cash', 'cash and equivalents', 'cash & equivalents', 'cash and bank'],
-        'debt': ['total debt', 'borrowings', 'long term debt', 'short term debt'],
-    }
-    
-    # Try to find company name from first sheet
-    first_sheet = wb.active
-    for row in first_sheet.iter_rows(min_row=1, max_row=5, max_col=5):
-        for cell in row:
-            if cell.value and isinstance(cell.value, str):
-                val = cell.value.strip()
-                # Look for company name patterns (usually contains "Ltd" or "Limited" or is in bold/header)
-                if any(suffix in val.lower() for suffix in ['ltd', 'limited', 'inc', 'corp', 'company']):
-                    extracted['company_name'] = val
-                    break
-        if extracted['company_name']:
-            break
-    
-    # Search through all sheets for financial data
-    for sheet_name in wb.sheetnames:
-        ws = wb[sheet_name]
-        sheet_lower = sheet_name.lower()
-        
-        # Determine what type of data this sheet might contain
-        is_income_sheet = any(term in sheet_lower for term in ['income', 'profit', 'loss', 'p&l', 'pl', 'revenue'])
-        is_balance_sheet = any(term in sheet_lower for term in ['balance', 'asset', 'liability', 'position'])
-        
-        # Scan the sheet for labeled values
-        for row in ws.iter_rows(min_row=1, max_row=100, max_col=10):
-            label_cell = row[0] if row else None
-            if not label_cell or not label_cell.value:
-                continue
-            
-            label = str(label_cell.value).strip().lower()
-            
-            # Find the first numeric value in this row
-            value = None
-            for cell in row[1:]:
-                if cell.value is not None:
-                    try:
-                        value = float(cell.value)
+    try:
+        # Try to find company name from first sheet
+        first_sheet = wb.active
+        for row in first_sheet.iter_rows(min_row=1, max_row=5, max_col=5, values_only=True):
+            for cell_value in row:
+                if cell_value and isinstance(cell_value, str):
+                    val = cell_value.strip()
+                    # Look for company name patterns (usually contains "Ltd" or "Limited" or is in bold/header)
+                    if any(suffix in val.lower() for suffix in ['ltd', 'limited', 'inc', 'corp', 'company']):
+                        extracted['company_name'] = val
                         break
-                    except (ValueError, TypeError):
-                        continue
-            
-            if value is None:
-                continue
-            
-            # Match against income statement fields
-            for field, aliases in income_mappings.items():
-                if any(alias in label for alias in aliases):
-                    extracted['historical_data']['income_statement'][field] = value
-                    break
-            
-            # Match against balance sheet fields
-            for field, aliases in balance_mappings.items():
-                if any(alias in label for alias in aliases):
-                    extracted['historical_data']['balance_sheet'][field] = value
-                    break
+            if extracted['company_name']:
+                break
+
+        income_stmt = extracted['historical_data']['income_statement']
+        balance_sheet = extracted['historical_data']['balance_sheet']
+
+        # Search through all sheets for financial data. Rows come from a single
+        # streaming pass (random cell access re-reads the sheet in read-only
+        # mode), and values are only looked at once the label matches a field.
+        for sheet_name in wb.sheetnames:
+            ws = wb[sheet_name]
+
+            # Scan the sheet for labeled values
+            for row in ws.iter_rows(min_row=1, max_row=100, max_col=10, values_only=True):
+                label_value = row[0] if row else None
+                if not label_value:
+                    continue
+
+                label = str(label_value).strip().lower()
+                income_match = _INCOME_ALIAS_RE.search(label)
+                balance_match = _BALANCE_ALIAS_RE.search(label)
+                if not income_match and not balance_match:
+                    continue
+
+                # Find the first numeric value in this row
+                value = None
+                for cell_value in row[1:]:
+                    if cell_value is not None:
+                        try:
+                            value = float(cell_value)
+                            break
+                        except (ValueError, TypeError):
+                            continue
+
+                if value is None:
+                    continue
+
+                if income_match:
+                    income_stmt[_INCOME_ALIAS_FIELDS[income_match.group()]] = value
+                if balance_match:
+                    balance_sheet[_BALANCE_ALIAS_FIELDS[balance_match.group()]] = value
+
+    finally:
+        # Read-only workbooks keep the zip open until closed
+        wb.close()
     
     # Calculate assumptions from extracted data if possible
-    income_stmt = extracted['historical_data']['income_statement']
     if income_stmt.get('revenue') and income_stmt.get('ebitda'):
         extracted['assumptions']['ebitda_margin'] = income_stmt['ebitda'] / income_stmt['revenue']
     
     if income_stmt.get('revenue') and income_stmt.get('net_income'):
         extracted['assumptions']['net_margin'] = income_stmt['net_income'] / income_stmt['revenue']
     
-    wb.close()
-    
     return extracted
 
 
@@ -1987,26 +2487,28 @@ async def get_job_history(limit: int = 20, offset: int = 0):
         List of completed jobs
     """
     try:
-        history = db.get_job_history(limit=limit, offset=offset)
-        return {
+        history = await asyncio.to_thread(db.get_job_history, limit=limit, offset=offset)
+        # Plain rows from SQLite, so skip jsonable_encoder and let orjson
+        # encode them directly
+        return ORJSONResponse({
             "jobs": history,
             "count": len(history),
             "limit": limit,
             "offset": offset
-        }
+        })
     except Exception as e:
         logger.error(f"Error fetching job history: {e}")
-        # Fallback to in-memory jobs
+        # Fallback to the jobs cached in memory
         completed = [
-            {**v, "id": k} for k, v in jobs.items() 
+            {**v, "id": k} for k, v in jobs.cached_jobs()
             if v.get("status") == "completed"
         ]
-        return {
+        return ORJSONResponse({
             "jobs": completed[:limit],
             "count": len(completed),
             "limit": limit,
             "offset": offset
-        }
+        })
 
 
 @app.get("/api/model/preview/{job_id}")
@@ -2029,10 +2531,7 @@ async def get_model_preview(job_id: str):
         pass
     
     # Fallback to in-memory
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
+    job = _require_job(job_id)
     return {
         "job_id": job_id,
         "company_name": job.get("company_name"),
@@ -2059,6 +2558,7 @@ async def get_smart_assumptions(
     Returns:
         Recommended assumptions with explanations
     """
+    from agents.ai_assistant import generate_smart_assumptions
     try:
         result = await generate_smart_assumptions(
             industry=industry,
@@ -2090,6 +2590,7 @@ async def get_ai_commentary(
     Returns:
         Investment thesis, risks, and recommendation
     """
+    from agents.ai_assistant import generate_valuation_commentary
     try:
         commentary = await generate_valuation_commentary(
             company_name=company_name,
@@ -2114,6 +2615,7 @@ async def parse_nlp_request(prompt: str):
     Returns:
         Extracted parameters for model generation
     """
+    from agents.ai_assistant import parse_natural_language_request
     try:
         result = await parse_natural_language_request(prompt)
         return result
@@ -2134,16 +2636,20 @@ async def get_yahoo_stock_data(symbol: str):
         Stock information and price history
     """
     try:
-        info = get_stock_info(symbol)
+        # Both fetchers block on Yahoo, so run them together off the event loop
+        info, price_history = await asyncio.gather(
+            asyncio.to_thread(get_stock_info, symbol),
+            asyncio.to_thread(get_price_history, symbol, period="1y"),
+        )
         if not info:
             raise HTTPException(status_code=404, detail=f"Stock {symbol} not found")
         
-        price_history = get_price_history(symbol, period="1y")
-        
-        return {
+        # Returned as a response so the year of prices goes straight to
+        # orjson instead of through jsonable_encoder first
+        return ORJSONResponse({
             "info": info,
             "price_history": price_history
-        }
+        })
     except Exception as e:
         logger.error(f"Error fetching Yahoo data for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2162,11 +2668,11 @@ async def get_stock_historical(symbol: str, years: int = 5):
         Historical income statement, balance sheet, and cash flow
     """
     try:
-        financials = get_historical_financials(symbol, years=years)
+        financials = await asyncio.to_thread(get_historical_financials, symbol, years=years)
         if not financials:
             raise HTTPException(status_code=404, detail=f"No historical data for {symbol}")
         
-        return financials
+        return ORJSONResponse(financials)
     except Exception as e:
         logger.error(f"Error fetching historical data for {symbol}: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -2189,8 +2695,11 @@ async def run_monte_carlo(
     Returns:
         Probability distribution of valuations
     """
+    if num_simulations < 1:
+        raise HTTPException(status_code=400, detail="num_simulations must be at least 1")
+    
     try:
-        results = run_monte_carlo_simulation(
+        results = await _run_monte_carlo_in_pool(
             base_assumptions=base_assumptions,
             base_valuation=base_valuation,
             num_simulations=min(num_simulations, 50000)  # Cap at 50k
@@ -2213,13 +2722,8 @@ async def export_model(job_id: str, format: str):
     Returns:
         File download or Google Sheets link
     """
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    
-    if job.get("status") != "completed":
-        raise HTTPException(status_code=400, detail="Model not yet completed")
+    from exporters import pdf_exporter, pptx_exporter
+    job = _require_ready(job_id, "Model not yet completed")
     
     company_name = job.get("company_name", "Company")
     industry = job.get("industry", "general")
@@ -2235,7 +2739,8 @@ async def export_model(job_id: str, format: str):
         
         output_path = os.path.join(OUTPUT_DIR, f"{job_id}_summary.pdf")
         
-        success = pdf_exporter.generate_pdf_report(
+        success = _export_is_cached(output_path) or await asyncio.to_thread(
+            pdf_exporter.generate_pdf_report,
             output_path=output_path,
             company_name=company_name,
             industry=industry,
@@ -2245,7 +2750,7 @@ async def export_model(job_id: str, format: str):
         )
         
         if success:
-            return FileResponse(
+            return DownloadResponse(
                 output_path,
                 media_type="application/pdf",
                 filename=f"{company_name.replace(' ', '_')}_Summary.pdf"
@@ -2259,17 +2764,13 @@ async def export_model(job_id: str, format: str):
         
         output_path = os.path.join(OUTPUT_DIR, f"{job_id}_pitch.pptx")
         
-        success = pptx_exporter.generate_pptx_report(
-            output_path=output_path,
-            company_name=company_name,
-            industry=industry,
-            valuation_data=valuation_data,
-            assumptions=assumptions,
-            commentary=commentary
+        success = _export_is_cached(output_path) or await asyncio.to_thread(
+            pptx_exporter.generate_pptx_report,
+            output_path, company_name, industry, valuation_data, assumptions, None, commentary
         )
         
         if success:
-            return FileResponse(
+            return DownloadResponse(
                 output_path,
                 media_type="application/vnd.openxmlformats-officedocument.presentationml.presentation",
                 filename=f"{company_name.replace(' ', '_')}_Pitch.pptx"
@@ -2285,29 +2786,28 @@ async def export_model(job_id: str, format: str):
     
     elif format.lower() == "xlsm":
         # Generate xlsm with VBA modules
-        try:
-            from exporters.xlsm_generator import create_xlsm_with_vba, get_vba_modules_zip
-            
-            # Get the actual Excel file path from the job
-            xlsx_path = job.get("file_path")
-            
-            if not xlsx_path or not os.path.exists(xlsx_path):
-                raise HTTPException(status_code=404, detail="Original Excel file not found")
-            
-            xlsm_path = xlsx_path.replace('.xlsx', '_with_vba.xlsm')
-            
-            success = create_xlsm_with_vba(xlsx_path, xlsm_path)
-            
-            if success:
-                return FileResponse(
-                    xlsm_path,
-                    media_type="application/vnd.ms-excel.sheet.macroEnabled.12",
-                    filename=f"{company_name.replace(' ', '_')}_Model_with_VBA.xlsm"
-                )
-            else:
-                raise HTTPException(status_code=500, detail="Failed to create xlsm file")
-        except ImportError:
+        if not XLSM_AVAILABLE:
             raise HTTPException(status_code=501, detail="XLSM generator not available")
+        
+        # Get the actual Excel file path from the job
+        xlsx_path = job.get("file_path")
+        
+        if not xlsx_path or not os.path.exists(xlsx_path):
+            raise HTTPException(status_code=404, detail="Original Excel file not found")
+        
+        xlsm_path = xlsx_path.replace('.xlsx', '_with_vba.xlsm')
+        
+        success = (_export_is_cached(xlsm_path, xlsx_path)
+                   or await asyncio.to_thread(create_xlsm_with_vba, xlsx_path, xlsm_path))
+        
+        if success:
+            return DownloadResponse(
+                xlsm_path,
+                media_type="application/vnd.ms-excel.sheet.macroEnabled.12",
+                filename=f"{company_name.replace(' ', '_')}_Model_with_VBA.xlsm"
+            )
+        else:
+            raise HTTPException(status_code=500, detail="Failed to create xlsm file")
     
     else:
         raise HTTPException(status_code=400, detail=f"Unsupported format: {format}")
@@ -2316,71 +2816,28 @@ async def export_model(job_id: str, format: str):
 @app.get("/api/export/{job_id}/vba-modules")
 async def get_vba_modules(job_id: str):
     """Download VBA modules as a zip file"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = _require_job(job_id)
+    
+    if not XLSM_AVAILABLE:
+        raise HTTPException(status_code=501, detail="XLSM generator not available")
     
     try:
-        from exporters.xlsm_generator import get_vba_modules_zip
-        
-        company_name = jobs[job_id].get("company_name", "Model")
-        zip_path = os.path.join(OUTPUT_DIR, f"{job_id}_vba_modules.zip")
+        company_name = job.get("company_name", "Model")
         
-        get_vba_modules_zip(zip_path)
+        # Build the zip in memory and send it straight back, no staging file
+        buffer = BytesIO()
+        write_vba_modules_zip(buffer)
         
-        return FileResponse(
-            zip_path,
+        return Response(
+            content=buffer.getvalue(),
             media_type="application/zip",
-            filename=f"{company_name.replace(' ', '_')}_VBA_Modules.zip"
+            headers={"Content-Disposition": f'attachment; filename="{company_name.replace(" ", "_")}_VBA_Modules.zip"'}
         )
     except Exception as e:
         logger.error(f"Failed to create VBA modules zip: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/export/formats")
-async def get_export_formats():
-    """Get available export formats"""
-    return {
-        "formats": [
-            {
-                "id": "xlsx",
-                "name": "Excel",
-                "extension": ".xlsx",
-                "available": True,
-                "description": "Full financial model workbook"
-            },
-            {
-                "id": "xlsm",
-                "name": "Excel with VBA",
-                "extension": ".xlsm",
-                "available": True,
-                "description": "Macro-enabled workbook with VBA automation"
-            },
-            {
-                "id": "pdf",
-                "name": "PDF Summary",
-                "extension": ".pdf",
-                "available": pdf_exporter.is_available(),
-                "description": "Executive summary report"
-            },
-            {
-                "id": "pptx",
-                "name": "PowerPoint",
-                "extension": ".pptx",
-                "available": pptx_exporter.is_available(),
-                "description": "Investor pitch deck"
-            },
-            {
-                "id": "gsheets",
-                "name": "Google Sheets",
-                "extension": None,
-                "available": False,
-                "description": "Export to Google Sheets (requires setup)"
-            }
-        ]
-    }
-
-
 @app.get("/api/preferences/{key}")
 async def get_preference(key: str):
     """Get user preference"""
@@ -2415,16 +2872,9 @@ async def get_sensitivity_analysis(job_id: str, variation: float = 0.10):
         job_id: Job identifier
         variation: Percentage variation for each assumption (default 10%)
     """
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    if job.get("status") != "completed":
-        raise HTTPException(status_code=400, detail="Model not ready")
+    job = _require_ready(job_id)
     
     try:
-        from analysis.tornado_analysis import calculate_sensitivity
-        
         valuation_data = job.get("valuation_data", {})
         assumptions = job.get("assumptions", {})
         
@@ -2440,56 +2890,13 @@ async def get_sensitivity_analysis(job_id: str, variation: float = 0.10):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.post("/api/chat/{job_id}")
-async def chat_with_model(job_id: str, request: dict):
-    """
-    AI chat about the financial model
-    
-    Args:
-        job_id: Job identifier
-        request: {"message": "user question", "history": []}
-    """
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    message = request.get("message", "")
-    history = request.get("history", [])
-    
-    if not message:
-        raise HTTPException(status_code=400, detail="Message required")
-    
-    try:
-        from agents.chat_assistant import process_chat_message, get_suggested_questions
-        
-        response = process_chat_message(message, job, history)
-        suggestions = get_suggested_questions(job)
-        
-        return {
-            "job_id": job_id,
-            "response": response.get("response", ""),
-            "success": response.get("success", False),
-            "suggestions": suggestions[:3]
-        }
-    except Exception as e:
-        logger.error(f"Chat error: {e}")
-        return {
-            "job_id": job_id,
-            "response": f"Sorry, I encountered an error: {str(e)}",
-            "success": False,
-            "suggestions": []
-        }
-
-
 @app.get("/api/chat/{job_id}/suggestions")
 async def get_chat_suggestions(job_id: str):
     """Get suggested questions for the model"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
+    job = _require_job(job_id)
     
     try:
-        from agents.chat_assistant import get_suggested_questions
-        suggestions = get_suggested_questions(jobs[job_id])
+        suggestions = get_suggested_questions(job)
         return {"suggestions": suggestions}
     except Exception as e:
         return {"suggestions": ["What are the key value drivers?", "What are the main risks?"]}
@@ -2502,16 +2909,9 @@ async def get_football_field(job_id: str):
     
     Aggregates DCF, Monte Carlo, and Comps into visual range
     """
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    job = jobs[job_id]
-    if job.get("status") != "completed":
-        raise HTTPException(status_code=400, detail="Model not ready")
+    job = _require_ready(job_id)
     
     try:
-        from analysis.football_field import create_football_field
-        
         valuation_data = job.get("valuation_data", {})
         monte_carlo = job.get("monte_carlo_results")
         
@@ -2527,11 +2927,62 @@ async def get_football_field(job_id: str):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@app.get("/api/templates")
-async def get_model_templates():
-    """Get available model templates"""
+# Static JSON files served by the API: path -> (mtime_ns, (parsed data, ETag)).
+# Each file is parsed once and reparsed only after it changes on disk.
+_json_file_cache: Dict[str, tuple] = {}
+
+
+def _load_json_file(path: str, build=None) -> tuple:
+    """
+    Parse a JSON file, reusing the previous result while it is unchanged.
+    If given, build(data) derives the cached value from the parsed file.
+    Returns (data, etag), the ETag being a hash of the file's bytes.
+    """
+    mtime = os.stat(path).st_mtime_ns
+    cached = _json_file_cache.get(path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(path, 'rb') as f:
+        raw = f.read()
+    data = orjson.loads(raw)
+    if build is not None:
+        data = build(data)
+    result = (data, f'"{hashlib.blake2b(raw, digest_size=16).hexdigest()}"')
+    _json_file_cache[path] = (mtime, result)
+    return result
+
+
+def _json_file_response(request: Request, content: Any, etag: Optional[str]) -> Response:
+    """Response built from a static JSON file, or 304 if the client has this version"""
+    if etag is None:
+        return ORJSONResponse(content)
+    headers = {"ETag": etag}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    return ORJSONResponse(content, headers=headers)
+
+
+def _build_us_stock_index(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Precompute the lookups /api/stocks/us filters on"""
+    stocks = tuple(data.get("stocks", []))
+    by_sector: Dict[str, List[int]] = {}
+    for i, stock in enumerate(stocks):
+        by_sector.setdefault(stock["sector"].lower(), []).append(i)
+    return {
+        "stocks": stocks,
+        # (symbol, upper-cased name) per stock, so searches don't re-case names
+        "search_keys": tuple((stock["symbol"], stock["name"].upper()) for stock in stocks),
+        "by_sector": by_sector,
+    }
+
+
+def _load_templates() -> tuple:
+    """
+    Load config/templates.json as (templates, etag), or empty sections and
+    no ETag if it can't be read
+    """
     try:
-        import json
         templates_path = os.path.join(os.path.dirname(__file__), "config", "templates.json")
         
         # Try relative path first
@@ -2539,20 +2990,26 @@ async def get_model_templates():
             templates_path = os.path.join(os.path.dirname(__file__), "..", "config", "templates.json")
         
         if os.path.exists(templates_path):
-            with open(templates_path, 'r') as f:
-                data = json.load(f)
-            return data
+            return _load_json_file(templates_path)
         else:
-            return {"templates": {}, "scenarios": {}}
+            return {"templates": {}, "scenarios": {}}, None
     except Exception as e:
         logger.error(f"Templates error: {e}")
-        return {"templates": {}, "scenarios": {}}
+        return {"templates": {}, "scenarios": {}}, None
+
+
+@app.get("/api/templates")
+async def get_model_templates(request: Request):
+    """Get available model templates"""
+    # File access (a stat when cached, a parse after a change) stays off the loop
+    templates, etag = await asyncio.to_thread(_load_templates)
+    return _json_file_response(request, templates, etag)
 
 
 @app.get("/api/templates/{template_id}")
 async def get_template(template_id: str):
     """Get specific template by ID"""
-    templates = await get_model_templates()
+    templates, _ = await asyncio.to_thread(_load_templates)
     template = templates.get("templates", {}).get(template_id)
     
     if not template:
@@ -2562,7 +3019,7 @@ async def get_template(template_id: str):
 
 
 @app.get("/api/stocks/us")
-async def get_us_stocks(search: str = None, sector: str = None, limit: int = 50):
+async def get_us_stocks(request: Request, search: str = None, sector: str = None, limit: int = 50):
     """
     Get US stocks (NYSE/NASDAQ)
     
@@ -2572,24 +3029,39 @@ async def get_us_stocks(search: str = None, sector: str = None, limit: int = 50)
         limit: Max results
     """
     try:
-        import json
         us_stocks_path = os.path.join(os.path.dirname(__file__), "data", "us_stocks.json")
         
         if os.path.exists(us_stocks_path):
-            with open(us_stocks_path, 'r') as f:
-                data = json.load(f)
+            index, etag = await asyncio.to_thread(_load_json_file, us_stocks_path, _build_us_stock_index)
+            stocks = index["stocks"]
             
-            stocks = data.get("stocks", [])
+            # The result depends only on the file and the query string, so the
+            # file's ETag validates it for this URL; checked before filtering
+            headers = {"ETag": etag}
+            if request.headers.get("if-none-match") == etag:
+                return Response(status_code=304, headers=headers)
             
-            # Apply filters
-            if search:
-                search = search.upper()
-                stocks = [s for s in stocks if search in s["symbol"] or search in s["name"].upper()]
+            # Plain browsing: a slice of the cached tuple, no index lookups
+            if not search and not sector:
+                return ORJSONResponse({"stocks": stocks[:limit], "total": len(stocks)}, headers=headers)
             
+            # Apply filters to positions, so matches keep the file's order.
+            # Sector is a substring match, checked once per distinct sector.
+            candidates = range(len(stocks))
             if sector:
-                stocks = [s for s in stocks if sector.lower() in s["sector"].lower()]
+                sector = sector.lower()
+                candidates = sorted(
+                    i for name, ids in index["by_sector"].items() if sector in name for i in ids
+                )
             
-            return {"stocks": stocks[:limit], "total": len(stocks)}
+            if search:
+                search = search.upper()
+                keys = index["search_keys"]
+                candidates = [i for i in candidates if search in keys[i][0] or search in keys[i][1]]
+            
+            return ORJSONResponse(
+                {"stocks": [stocks[i] for i in candidates[:limit]], "total": len(candidates)}, headers=headers
+            )
         else:
             return {"stocks": [], "total": 0}
     except Exception as e:
@@ -2597,26 +3069,26 @@ async def get_us_stocks(search: str = None, sector: str = None, limit: int = 50)
         return {"stocks": [], "total": 0}
 
 
+class ScenarioSaveRequest(BaseModel):
+    name: str = "Saved Scenario"
+
+
 @app.post("/api/scenarios/{job_id}/save")
-async def save_scenario(job_id: str, request: dict):
+async def save_scenario(job_id: str, request: ScenarioSaveRequest):
     """Save current assumptions as a scenario"""
-    if job_id not in jobs:
-        raise HTTPException(status_code=404, detail="Job not found")
-    
-    scenario_name = request.get("name", "Saved Scenario")
-    
-    job = jobs[job_id]
+    job = _require_job(job_id)
     scenario = {
-        "name": scenario_name,
+        "name": request.name,
         "assumptions": job.get("assumptions", {}),
         "valuation_data": job.get("valuation_data", {}),
         "created_at": datetime.now().isoformat()
     }
     
-    # Store in job
-    if "scenarios" not in job:
-        job["scenarios"] = []
-    job["scenarios"].append(scenario)
+    # Appended in one database transaction, so saves from any worker all land
+    try:
+        jobs.append(job_id, "scenarios", scenario)
+    except KeyError:
+        raise HTTPException(status_code=404, detail="Job not found")
     
     return {"success": True, "scenario": scenario}
 
@@ -2624,14 +3096,26 @@ async def save_scenario(job_id: str, request: dict):
 @app.get("/api/scenarios/{job_id}")
 async def get_scenarios(job_id: str):
     """Get saved scenarios for a job"""
-    if job_id not in jobs:
+    try:
+        job = jobs.reload(job_id)
+    except KeyError:
         raise HTTPException(status_code=404, detail="Job not found")
     
-    return {"scenarios": jobs[job_id].get("scenarios", [])}
+    return {"scenarios": job.get("scenarios", [])}
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
+    host = os.getenv("HOST", "127.0.0.1")
+    port = int(os.getenv("PORT", 8000))
+    if os.getenv("ENV") == "dev":
+        uvicorn.run("main:app", host=host, port=port, reload=True)
+    else:
+        # Deployments start uvicorn directly (Dockerfile, Procfile, render.yaml);
+        # this mirrors them for local production-like runs. Workers read
+        # WEB_CONCURRENCY to size their CPU pools, so it is exported for them.
+        # uvicorn picks uvloop/httptools by itself when they are installed.
+        workers = int(os.environ.setdefault("WEB_CONCURRENCY", "2"))
+        uvicorn.run("main:app", host=host, port=port, workers=workers)
 
 
@@ -0,0 +1,64 @@
+"""
+Stock Table Generator
+Emits data/stock_tables_generated.py so the stock database can skip the
+flatten + CSV/JSON merge on every process start.
+
+Usage (from the backend directory):
+    python scripts/gen_stock_tables.py
+"""
+
+import os
+import sys
+import importlib.util
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SOURCE_PATH = os.path.join(BACKEND_DIR, "data", "stock_database.py")
+OUTPUT_PATH = os.path.join(BACKEND_DIR, "data", "stock_tables_generated.py")
+
+
+def load_source_tables():
+    """Import stock_database with codegen mode on so it builds from source"""
+    os.environ["STOCK_TABLES_CODEGEN"] = "1"
+    spec = importlib.util.spec_from_file_location("_stock_database_source", SOURCE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.ALL_STOCKS, module.INDIAN_STOCKS
+
+
+def render_module(all_stocks, indian_stocks) -> str:
+    """Render the lookup tables as Python literals"""
+    position = {id(stock): i for i, stock in enumerate(all_stocks)}
+
+    lines = [
+        '"""',
+        "Generated by scripts/gen_stock_tables.py - do not edit by hand",
+        '"""',
+        "",
+        "ALL_STOCKS = [",
+    ]
+    lines.extend(f"    {stock!r}," for stock in all_stocks)
+    lines.append("]")
+    lines.append("")
+    lines.append("SECTOR_INDICES = {")
+    for sector, stocks in indian_stocks.items():
+        indices = tuple(position[id(stock)] for stock in stocks)
+        lines.append(f"    {sector!r}: {indices!r},")
+    lines.append("}")
+    lines.append("")
+    return "\n".join(lines)
+
+
+def main():
+    all_stocks, indian_stocks = load_source_tables()
+    source = render_module(all_stocks, indian_stocks)
+
+    tmp_path = OUTPUT_PATH + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        f.write(source)
+    os.replace(tmp_path, OUTPUT_PATH)
+
+    print(f"Wrote {len(all_stocks)} stocks across {len(indian_stocks)} sectors to {OUTPUT_PATH}")
+
+
+if __name__ == "__main__":
+    sys.exit(main())
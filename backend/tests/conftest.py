@@ -0,0 +1,20 @@
+import os
+import sys
+import threading
+
+import pytest
+
+# Backend modules import each other as top-level packages (data, excel, ...)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture
+def job_db(tmp_path, monkeypatch):
+    """Point the job database at a fresh file for one test"""
+    import database
+    
+    monkeypatch.setattr(database, "DB_PATH", str(tmp_path / "models.db"))
+    # Drop connections opened against the previous path
+    monkeypatch.setattr(database, "_local", threading.local())
+    database.init_db()
+    return database
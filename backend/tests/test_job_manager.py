@@ -0,0 +1,74 @@
+import job_manager
+from job_manager import JobManager
+
+
+def _job(status, **fields):
+    return {
+        'status': status,
+        'progress': 0,
+        'message': '',
+        'company_name': 'Test Co',
+        'request': {'symbol': 'TEST'},
+        **fields,
+    }
+
+
+def test_eviction_skips_owned_running_jobs(job_db, monkeypatch):
+    monkeypatch.setattr(job_manager, "MAX_CACHED_JOBS", 2)
+    jobs = JobManager()
+    
+    jobs["running"] = _job("running")
+    jobs["done"] = _job("completed")
+    jobs["newest"] = _job("running")
+    
+    # The oldest entry is still being worked on here, so the finished job goes
+    assert [job_id for job_id, _ in jobs.cached_jobs()] == ["newest", "running"]
+    
+    # With only owned running jobs left there is nothing safe to evict
+    jobs["another"] = _job("running")
+    assert len(jobs.cached_jobs()) == 3
+
+
+def test_running_job_from_another_worker_is_reread(job_db):
+    worker = JobManager()
+    reader = JobManager()
+    
+    worker["job"] = _job("running")
+    assert reader["job"]["progress"] == 0
+    
+    worker.update("job", progress=50, message="Building")
+    job = reader["job"]
+    assert (job["progress"], job["message"]) == (50, "Building")
+    
+    # Finished jobs no longer change, so the cached copy is served
+    worker.update("job", status="completed", progress=100)
+    cached = reader["job"]
+    job_db.update_job("job", message="changed behind the cache")
+    assert reader["job"] is cached
+
+
+def test_update_keeps_other_result_keys(job_db):
+    jobs = JobManager()
+    other_worker = JobManager()
+    
+    jobs["job"] = _job("running", validation={"valid": True})
+    other_worker.append("job", "scenarios", {"name": "Bull"})
+    
+    # The cached dict here has no scenarios; updating must not drop them
+    jobs.update("job", status="completed", industry_code="IT")
+    
+    stored = JobManager()["job"]
+    assert stored["validation"] == {"valid": True}
+    assert stored["scenarios"] == [{"name": "Bull"}]
+    assert stored["industry_code"] == "IT"
+
+
+def test_concurrent_appends_all_land(job_db):
+    jobs = JobManager()
+    jobs["job"] = _job("completed")
+    
+    first, second = JobManager(), JobManager()
+    first.append("job", "scenarios", {"name": "Bull"})
+    second.append("job", "scenarios", {"name": "Bear"})
+    
+    assert [s["name"] for s in JobManager()["job"]["scenarios"]] == ["Bull", "Bear"]
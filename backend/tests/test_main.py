@@ -0,0 +1,124 @@
+import asyncio
+import threading
+
+import orjson
+import pytest
+
+pytest.importorskip("fastapi")
+from fastapi.testclient import TestClient
+
+import main
+from job_manager import jobs
+
+
+def _stream_events(client, job_id):
+    """Read the job's SSE stream to the end and return the decoded events"""
+    with client.stream("GET", f"/api/job/{job_id}/stream") as response:
+        assert response.headers["content-type"].startswith("text/event-stream")
+        return [
+            orjson.loads(line[len("data: "):])
+            for line in response.iter_lines()
+            if line.startswith("data: ")
+        ]
+
+
+def _new_job(job_id, status):
+    jobs[job_id] = {
+        'status': status,
+        'progress': 0,
+        'message': '',
+        'company_name': 'Test Co',
+        'request': {'symbol': 'TEST'},
+    }
+
+
+def test_stream_ends_on_terminal_status(job_db):
+    _new_job("stream-running", "running")
+    
+    def finish():
+        jobs.update("stream-running", progress=50, message="Building")
+        jobs.update("stream-running", status="failed", progress=100, message="Error")
+    
+    # The change arrives from another thread, as it does from the executor
+    timer = threading.Timer(0.2, finish)
+    timer.start()
+    try:
+        events = _stream_events(TestClient(main.app), "stream-running")
+    finally:
+        timer.join()
+    
+    assert events[0]["status"] == "running"
+    assert events[-1]["status"] == "failed"
+    assert events[-1]["message"] == "Error"
+
+
+def test_stream_of_finished_job_sends_one_event(job_db):
+    _new_job("stream-done", "completed")
+    
+    events = _stream_events(TestClient(main.app), "stream-done")
+    
+    assert [event["status"] for event in events] == ["completed"]
+
+
+@pytest.mark.parametrize("label, field", [
+    ("net income", "net_income"),
+    ("net sales", "revenue"),
+    ("income", "revenue"),
+    ("operating income", "operating_income"),
+])
+def test_income_labels_match_the_longest_alias(label, field):
+    match = main._INCOME_ALIAS_RE.search(label)
+    assert main._INCOME_ALIAS_FIELDS[match.group()] == field
+
+
+def test_parse_excel_file_keeps_net_income_out_of_revenue(tmp_path):
+    openpyxl = pytest.importorskip("openpyxl")
+    wb = openpyxl.Workbook()
+    ws = wb.active
+    ws.append(["Test Industries Ltd"])
+    ws.append(["Revenue", 1000])
+    ws.append(["Net Income", 100])
+    ws.append(["Total Assets", 5000])
+    path = tmp_path / "upload.xlsx"
+    wb.save(path)
+    
+    extracted = main._parse_excel_file(str(path))
+    
+    assert extracted['company_name'] == "Test Industries Ltd"
+    assert extracted['historical_data']['income_statement'] == {'revenue': 1000, 'net_income': 100}
+    assert extracted['historical_data']['balance_sheet'] == {'total_assets': 5000}
+    assert extracted['assumptions']['net_margin'] == pytest.approx(0.1)
+
+
+def test_duplicate_generate_request_joins_the_running_job(job_db, monkeypatch):
+    _new_job("generate-running", "running")
+    monkeypatch.setitem(main._inflight_models, ("TEST", "NSE", 5), "generate-running")
+    
+    # model_types doesn't change what the task builds, so it doesn't split jobs
+    response = TestClient(main.app).post(
+        "/api/model/generate",
+        json={"symbol": "test", "model_types": ["dcf"]},
+    )
+    
+    assert response.status_code == 200
+    assert response.json()["job_id"] == "generate-running"
+    assert response.json()["status"] == "running"
+
+
+def test_failed_generation_leaves_no_reserved_file(job_db, tmp_path, monkeypatch):
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    monkeypatch.setattr(main, "OUTPUT_DIR", str(output_dir))
+    
+    async def crash(func, **kwargs):
+        raise RuntimeError("worker died")
+    monkeypatch.setattr(main, "_run_in_cpu_pool", crash)
+    
+    _new_job("generate-fails", "pending")
+    asyncio.run(main._generate_model_from_raw_task(
+        "generate-fails", "Test Co", "Technology", 5,
+        {'income_statement': {'revenue': 1000}}, {},
+    ))
+    
+    assert jobs["generate-fails"]["status"] == "failed"
+    assert list(output_dir.iterdir()) == []
@@ -0,0 +1,58 @@
+import pytest
+
+openpyxl = pytest.importorskip("openpyxl")
+from openpyxl.workbook.defined_name import DefinedName
+
+from exporters.xlsm_generator import _add_setup_sheet
+
+
+@pytest.fixture
+def source_xlsx(tmp_path):
+    """A three-sheet workbook with a hidden tab, scoped and global names, and DCF active"""
+    wb = openpyxl.Workbook()
+    wb.active.title = "Cover"
+    dcf = wb.create_sheet("DCF")
+    dcf["B2"] = 0.1
+    wb.create_sheet("Hidden").sheet_state = "hidden"
+    
+    dcf.defined_names["DCF_WACC"] = DefinedName("DCF_WACC", attr_text="DCF!$B$2")
+    wb.defined_names["Global_WACC"] = DefinedName("Global_WACC", attr_text="DCF!$B$2")
+    wb.active = 1
+    
+    path = tmp_path / "model.xlsx"
+    wb.save(path)
+    return path
+
+
+def _reopen(tmp_path, data):
+    path = tmp_path / "model_with_setup.xlsx"
+    path.write_bytes(data)
+    return openpyxl.load_workbook(path)
+
+
+def test_setup_sheet_is_inserted_first(source_xlsx, tmp_path):
+    wb = _reopen(tmp_path, _add_setup_sheet(str(source_xlsx)))
+    
+    assert wb.sheetnames == ["VBA Setup", "Cover", "DCF", "Hidden"]
+    setup = wb["VBA Setup"]
+    assert setup.sheet_state == "visible"
+    assert setup["A1"].value == "VBA SETUP INSTRUCTIONS"
+    assert wb["Hidden"].sheet_state == "hidden"
+
+
+def test_sheet_positions_follow_the_shift(source_xlsx, tmp_path):
+    wb = _reopen(tmp_path, _add_setup_sheet(str(source_xlsx)))
+    
+    # The previously active tab stays active and sheet-scoped names stay on their sheet
+    assert wb.active.title == "DCF"
+    assert "DCF_WACC" in wb["DCF"].defined_names
+    assert "DCF_WACC" not in wb["Cover"].defined_names
+    assert wb.defined_names["Global_WACC"].attr_text == "DCF!$B$2"
+
+
+def test_existing_setup_sheet_is_left_to_openpyxl(source_xlsx, tmp_path):
+    data = _add_setup_sheet(str(source_xlsx))
+    path = tmp_path / "again.xlsx"
+    path.write_bytes(data)
+    
+    assert _add_setup_sheet(str(path)) is None
@@ -0,0 +1,56 @@
+import threading
+from collections import OrderedDict
+
+import pytest
+
+pytest.importorskip("requests")
+from data import yahoo_finance
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(yahoo_finance, "CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(yahoo_finance, "_MEMO", OrderedDict())
+
+
+def _fetch_concurrently(url, fetch, threads=8):
+    """Call _fetch_json_locked from several threads at once and collect the results"""
+    start = threading.Barrier(threads)
+    results = []
+    
+    def worker():
+        start.wait()
+        results.append(yahoo_finance._fetch_json_locked(url, "stock_info", fetch))
+    
+    workers = [threading.Thread(target=worker) for _ in range(threads)]
+    for t in workers:
+        t.start()
+    for t in workers:
+        t.join()
+    return results
+
+
+def test_concurrent_callers_share_one_fetch():
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        return {"symbol": "TCS"}
+    
+    results = _fetch_concurrently("https://example.test/TCS", fetch)
+    
+    assert len(calls) == 1
+    assert results == [{"symbol": "TCS"}] * 8
+
+
+def test_empty_answer_is_cached_for_waiters():
+    calls = []
+    
+    def fetch():
+        calls.append(1)
+        return None
+    
+    results = _fetch_concurrently("https://example.test/UNKNOWN", fetch)
+    
+    assert len(calls) == 1
+    assert results == [None] * 8
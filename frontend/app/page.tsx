@@ -285,6 +285,12 @@ async function getJobStatus(jobId: string): Promise<JobStatus> {
     return response.json();
 }
 
+async function getJobValidation(jobId: string): Promise<JobStatus["validation"]> {
+    const response = await fetch(`${API_BASE}/api/job/${jobId}/validate`);
+    if (!response.ok) throw new Error("Failed to validate model");
+    return response.json();
+}
+
 async function getJobHistory(limit: number = 20): Promise<{ jobs: JobHistoryItem[] }> {
     const response = await fetch(`${API_BASE}/api/jobs/history?limit=${limit}`);
     if (!response.ok) return { jobs: [] };
@@ -826,6 +832,14 @@ export default function Home() {
                     setIsLoading(false);
                     clearInterval(interval);
                 }
+
+                // Validation runs on demand once the model is ready
+                if (status.status === "completed" && !status.validation) {
+                    getJobValidation(status.job_id)
+                        .then((validation) => setJobStatus((prev) =>
+                            prev && prev.job_id === status.job_id ? { ...prev, validation } : prev))
+                        .catch((err) => console.error("Failed to validate model:", err));
+                }
             } catch (err) {
                 console.error("Failed to get job status:", err);
             }